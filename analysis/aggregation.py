@@ -0,0 +1,321 @@
+"""Mergeable online aggregation over DataFrame chunks."""
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Sequence
+
+# Items kept per level of a QuantileSketch; rank error is roughly log2(n) / capacity
+DEFAULT_SKETCH_CAPACITY = 2048
+
+
+def _as_float_array(values) -> np.ndarray:
+    """Convert a Series or array-like to a float64 array without missing values."""
+    array = np.asarray(values, dtype="float64")
+    return array[~np.isnan(array)]
+
+
+class QuantileSketch:
+    """
+    Approximate quantiles in bounded memory (compacting sketch).
+
+    Values are buffered in levels; when a level holds more than capacity
+    items it is sorted and every other item is promoted to the next level
+    with twice the weight. Sketches of the same capacity can be merged.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_SKETCH_CAPACITY) -> None:
+        """
+        Initialize an empty QuantileSketch.
+
+        Args:
+            capacity: Maximum number of items kept per level.
+        """
+        self.capacity = capacity
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._offset = 0
+
+    def update(self, values) -> None:
+        """
+        Add values to the sketch (missing values are ignored).
+
+        Args:
+            values: Series or array-like of numbers.
+        """
+        self.levels[0] = np.concatenate([self.levels[0], _as_float_array(values)])
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        Merge another sketch into this one.
+
+        Args:
+            other: QuantileSketch built from a different part of the data.
+        """
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-th quantile.
+
+        Args:
+            q: Quantile between 0 and 1.
+
+        Returns:
+            Estimated value, or NaN if the sketch is empty.
+        """
+        values = np.concatenate(self.levels)
+        if len(values) == 0:
+            return float("nan")
+
+        weights = np.concatenate([np.full(len(items), 2 ** level)
+                                  for level, items in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        position = np.searchsorted(cumulative, q * cumulative[-1], side="left")
+        return float(values[order][min(position, len(values) - 1)])
+
+    def _compress(self) -> None:
+        """Halve every level that holds more than capacity items."""
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self.capacity:
+                items = np.sort(items)
+                # An odd item out stays on this level
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                paired = items[:len(items) - len(keep)]
+                promoted = paired[self._offset::2]
+                self._offset ^= 1
+
+                self.levels[level] = keep
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+
+class OnlineStats:
+    """
+    Running count, sum, mean, min, max, variance and quantiles of a column.
+
+    Each update() folds in a whole chunk with vectorized NumPy operations,
+    using Chan's parallel form of Welford's algorithm for the variance, so
+    partial states from different chunks or workers can be merged exactly.
+    """
+
+    def __init__(self, quantiles: bool = True, capacity: int = DEFAULT_SKETCH_CAPACITY) -> None:
+        """
+        Initialize empty statistics.
+
+        Args:
+            quantiles: Maintain a QuantileSketch for approximate quantiles.
+            capacity: Capacity of the quantile sketch.
+        """
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = float("nan")
+        self.max = float("nan")
+        self.sketch: Optional[QuantileSketch] = QuantileSketch(capacity) if quantiles else None
+
+    def update(self, values) -> None:
+        """
+        Fold a chunk of values into the statistics (missing values are ignored).
+
+        Args:
+            values: Series or array-like of numbers.
+        """
+        array = _as_float_array(values)
+        if len(array) == 0:
+            return
+
+        chunk = OnlineStats(quantiles=False)
+        chunk.count = len(array)
+        chunk.total = float(array.sum())
+        chunk.mean = chunk.total / chunk.count
+        chunk.m2 = float(((array - chunk.mean) ** 2).sum())
+        chunk.min = float(array.min())
+        chunk.max = float(array.max())
+        self._combine(chunk)
+
+        if self.sketch is not None:
+            self.sketch.update(array)
+
+    def merge(self, other: "OnlineStats") -> None:
+        """
+        Merge statistics computed over a different part of the data.
+
+        Args:
+            other: OnlineStats instance (e.g. from a parallel worker).
+        """
+        self._combine(other)
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+
+    @property
+    def sum(self) -> float:
+        """Sum of all values."""
+        return self.total
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1), NaN for fewer than two values."""
+        return self.m2 / (self.count - 1) if self.count > 1 else float("nan")
+
+    def quantile(self, q: float) -> float:
+        """
+        Approximate q-th quantile.
+
+        Args:
+            q: Quantile between 0 and 1.
+
+        Returns:
+            Estimated value.
+
+        Raises:
+            ValueError: If the statistics were created without quantiles.
+        """
+        if self.sketch is None:
+            raise ValueError("Quantiles are not tracked by this OnlineStats instance.")
+        return self.sketch.quantile(q)
+
+    def result(self, quantiles: Sequence[float] = ()) -> dict:
+        """
+        Return the statistics as a dictionary of native Python types.
+
+        Args:
+            quantiles: Quantiles to include (e.g., (0.25, 0.5, 0.75)).
+
+        Returns:
+            Dictionary with keys: count, sum, mean, min, max, var, std and,
+            if requested, quantiles (mapping each q to its estimate).
+        """
+        variance = self.variance
+        stats = {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.mean if self.count else float("nan"),
+            "min": self.min,
+            "max": self.max,
+            "var": variance,
+            "std": float(np.sqrt(variance))
+        }
+        if quantiles:
+            stats["quantiles"] = {q: self.quantile(q) for q in quantiles}
+        return stats
+
+    def _combine(self, other: "OnlineStats") -> None:
+        """Combine count, mean, M2, min and max with another instance."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.total, self.mean, self.m2 = other.count, other.total, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+
+class GroupedOnlineStats:
+    """
+    Running count, sum, mean, min, max and variance per group.
+
+    Each chunk is reduced with one groupby; partial states are then merged
+    with vectorized Chan/Welford updates aligned on the group keys.
+    """
+
+    def __init__(self, group_cols: Sequence[str], value_col: str = "value") -> None:
+        """
+        Initialize empty grouped statistics.
+
+        Args:
+            group_cols: Column names to group by.
+            value_col: Name of the column to aggregate.
+        """
+        self.group_cols = list(group_cols)
+        self.value_col = value_col
+        self.state: Optional[pd.DataFrame] = None
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """
+        Fold a DataFrame chunk into the statistics.
+
+        Args:
+            chunk: DataFrame containing group_cols and value_col.
+        """
+        partial = (
+            chunk.groupby(self.group_cols, observed=True)[self.value_col]
+            .agg(["count", "sum", "mean", "var", "min", "max"])
+        )
+        partial = partial[partial["count"] > 0]
+        partial["m2"] = partial["var"].fillna(0.0) * (partial["count"] - 1)
+        self._combine(partial.drop(columns="var"))
+
+    def merge(self, other: "GroupedOnlineStats") -> None:
+        """
+        Merge grouped statistics computed over a different part of the data.
+
+        Args:
+            other: GroupedOnlineStats with the same group columns.
+        """
+        if other.state is not None:
+            self._combine(other.state)
+
+    def result(self) -> pd.DataFrame:
+        """
+        Return the statistics as a DataFrame.
+
+        Returns:
+            DataFrame with columns group_cols + [count, sum, mean, min, max, var, std],
+            sorted by the group columns.
+        """
+        columns = self.group_cols + ["count", "sum", "mean", "min", "max", "var", "std"]
+        if self.state is None:
+            return pd.DataFrame(columns=columns)
+
+        state = self.state.sort_index()
+        result = pd.DataFrame({
+            "count": state["count"].astype("int64"),
+            "sum": state["sum"],
+            "mean": state["mean"],
+            "min": state["min"],
+            "max": state["max"],
+            "var": (state["m2"] / (state["count"] - 1)).where(state["count"] > 1),
+        }, index=state.index)
+        result["std"] = np.sqrt(result["var"])
+        return result.reset_index()[columns]
+
+    def _combine(self, partial: pd.DataFrame) -> None:
+        """Merge a partial state frame (count, sum, mean, m2, min, max) into self.state."""
+        if self.state is None:
+            self.state = partial.copy()
+            return
+
+        left, right = self.state.align(partial, join="outer")
+        count_a = left["count"].fillna(0)
+        count_b = right["count"].fillna(0)
+        mean_a = left["mean"].fillna(0.0)
+        mean_b = right["mean"].fillna(0.0)
+        count = count_a + count_b
+        delta = mean_b - mean_a
+
+        self.state = pd.DataFrame({
+            "count": count,
+            "sum": left["sum"].fillna(0.0) + right["sum"].fillna(0.0),
+            "mean": mean_a + delta * count_b / count,
+            "min": np.fmin(left["min"], right["min"]),
+            "max": np.fmax(left["max"], right["max"]),
+            "m2": left["m2"].fillna(0.0) + right["m2"].fillna(0.0)
+                  + delta ** 2 * count_a * count_b / count,
+        }, index=left.index)
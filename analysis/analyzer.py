@@ -1,23 +1,50 @@
 """Data analysis and statistical calculations."""
 import pandas as pd
+from typing import Iterable, Sequence, Union
+from analysis.aggregation import GroupedOnlineStats, OnlineStats
+from analysis.cube import IndicatorCube
+from analysis.selection import ReportSelection
+
+# A DataFrame, or an iterator of DataFrame chunks (e.g. DatabaseRepository.iter_reports)
+FrameOrChunks = Union[pd.DataFrame, Iterable[pd.DataFrame]]
+
+# Operations also accept a ReportSelection, which is aggregated in SQL, and
+# an IndicatorCube, which is reduced along its axes
+AnalysisInput = Union[FrameOrChunks, ReportSelection, IndicatorCube]
 
 
 class Analyzer:
     """Handles data analysis operations."""
 
-    def summary_stats(self, df: pd.DataFrame, value_col: str = "value") -> dict:
+    def summary_stats(self, df: AnalysisInput, value_col: str = "value") -> dict:
         """
         Calculate summary statistics for a column.
 
         Args:
-            df: Input DataFrame.
+            df: Input DataFrame, an iterator of DataFrame chunks which is
+                consumed in one pass with constant memory, or a
+                ReportSelection which is aggregated inside the database,
+                or an IndicatorCube.
             value_col: Name of the column to analyze.
 
         Returns:
             Dictionary with keys: mean, min, max, count
         """
+        if isinstance(df, IndicatorCube):
+            return df.summary()
+        if isinstance(df, ReportSelection):
+            row = df.aggregate().iloc[0]
+            return {
+                "mean": float(row["mean"]) if pd.notna(row["mean"]) else float("nan"),
+                "min": float(row["min"]) if pd.notna(row["min"]) else float("nan"),
+                "max": float(row["max"]) if pd.notna(row["max"]) else float("nan"),
+                "count": int(row["count"])
+            }
+        if not isinstance(df, pd.DataFrame):
+            return self._summary_stats_chunked(df, value_col)
+
         stats = df[value_col].agg(["mean", "min", "max", "count"])
-        
+
         # Convert to dict with native Python types
         return {
             "mean": float(stats["mean"]),
@@ -25,42 +52,154 @@ class Analyzer:
             "max": float(stats["max"]),
             "count": int(stats["count"])
         }
-    
-    def trend_over_time(self, df: pd.DataFrame, date_col: str = "report_date", 
+
+    def trend_over_time(self, df: AnalysisInput, date_col: str = "report_date",
                    value_col: str = "value") -> pd.DataFrame:
         """
         Calculate trend over time (mean value per date).
 
         Args:
-            df: Input DataFrame.
+            df: Input DataFrame, an iterator of DataFrame chunks, a
+                ReportSelection (grouped in SQL) or an IndicatorCube.
             date_col: Name of the date column.
             value_col: Name of the value column.
 
         Returns:
             DataFrame with columns [date_col, value_col], sorted by date.
         """
+        if isinstance(df, IndicatorCube):
+            return df.trend(value_col).rename(columns={"report_date": date_col})
+        if isinstance(df, ReportSelection):
+            return self._selection_mean(df, [date_col], value_col)
+        if not isinstance(df, pd.DataFrame):
+            return self._group_mean_chunked(df, [date_col], value_col).sort_values(by=date_col)
+
         # Group by date and calculate mean
         trend = df.groupby(date_col)[value_col].mean().reset_index()
-        
+
         # Sort by date
         trend = trend.sort_values(by=date_col)
-        
+
         return trend
-    
-    def group_aggregate(self, df: pd.DataFrame, group_cols: list, 
+
+    def group_aggregate(self, df: AnalysisInput, group_cols: list,
                     agg_col: str = "value") -> pd.DataFrame:
         """
         Group by specified columns and aggregate.
 
         Args:
-            df: Input DataFrame.
+            df: Input DataFrame, an iterator of DataFrame chunks, a
+                ReportSelection (grouped in SQL) or an IndicatorCube
+                (group_cols must be cube axes, see analysis.cube.AXES).
             group_cols: List of column names to group by.
             agg_col: Column name to aggregate (default: mean).
 
         Returns:
             DataFrame with grouped results.
         """
+        if isinstance(df, IndicatorCube):
+            return df.group_mean(group_cols, agg_col)
+        if isinstance(df, ReportSelection):
+            return self._selection_mean(df, group_cols, agg_col)
+        if not isinstance(df, pd.DataFrame):
+            return self._group_mean_chunked(df, group_cols, agg_col)
+
         # Group by specified columns and calculate mean
         result = df.groupby(group_cols)[agg_col].mean().reset_index()
-        
-        return result
\ No newline at end of file
+
+        return result
+
+    def online_stats(self, data: AnalysisInput, value_col: str = "value",
+                     quantiles: Sequence[float] = (0.25, 0.5, 0.75)) -> dict:
+        """
+        Calculate all summary statistics in a single pass.
+
+        Args:
+            data: Input DataFrame, an iterator of DataFrame chunks, or a
+                ReportSelection (streamed in chunks).
+            value_col: Name of the column to analyze.
+            quantiles: Approximate quantiles to estimate.
+
+        Returns:
+            Dictionary with keys: count, sum, mean, min, max, var, std and
+            quantiles (mapping each requested q to its estimate).
+        """
+        stats = OnlineStats(quantiles=bool(quantiles))
+        for chunk in self._iter_chunks(data):
+            stats.update(chunk[value_col])
+        return stats.result(quantiles)
+
+    def online_group_stats(self, data: AnalysisInput, group_cols: list,
+                           value_col: str = "value") -> pd.DataFrame:
+        """
+        Calculate count, sum, mean, min, max and variance per group in a single pass.
+
+        Args:
+            data: Input DataFrame, an iterator of DataFrame chunks, or a
+                ReportSelection (streamed in chunks).
+            group_cols: List of column names to group by.
+            value_col: Name of the column to aggregate.
+
+        Returns:
+            DataFrame with columns group_cols + [count, sum, mean, min, max, var, std].
+        """
+        stats = GroupedOnlineStats(group_cols, value_col)
+        for chunk in self._iter_chunks(data):
+            stats.update(chunk)
+        return stats.result()
+
+    @staticmethod
+    def _iter_chunks(data: AnalysisInput) -> Iterable[pd.DataFrame]:
+        """Treat a single DataFrame as a one-chunk iterator and stream selections."""
+        if isinstance(data, IndicatorCube):
+            return [data.to_frame()]
+        if isinstance(data, ReportSelection):
+            return data.iter_chunks()
+        return [data] if isinstance(data, pd.DataFrame) else data
+
+    @staticmethod
+    def _selection_mean(selection: ReportSelection, group_cols: list,
+                        value_col: str) -> pd.DataFrame:
+        """
+        Calculate the mean per group of a ReportSelection in SQL.
+
+        Args:
+            selection: ReportSelection to aggregate.
+            group_cols: List of column names to group by.
+            value_col: Name given to the mean column.
+
+        Returns:
+            DataFrame with columns group_cols + [value_col], sorted by group.
+        """
+        result = selection.aggregate(group_cols)
+        return result[list(group_cols) + ["mean"]].rename(columns={"mean": value_col})
+
+    def _summary_stats_chunked(self, chunks: Iterable[pd.DataFrame], value_col: str) -> dict:
+        """
+        Calculate summary statistics over DataFrame chunks in one pass.
+
+        Args:
+            chunks: Iterator of DataFrames.
+            value_col: Name of the column to analyze.
+
+        Returns:
+            Dictionary with keys: mean, min, max, count
+        """
+        stats = self.online_stats(chunks, value_col, quantiles=())
+        return {key: stats[key] for key in ("mean", "min", "max", "count")}
+
+    def _group_mean_chunked(self, chunks: Iterable[pd.DataFrame], group_cols: list,
+                            value_col: str) -> pd.DataFrame:
+        """
+        Calculate the mean per group over DataFrame chunks.
+
+        Args:
+            chunks: Iterator of DataFrames.
+            group_cols: List of column names to group by.
+            value_col: Name of the column to average.
+
+        Returns:
+            DataFrame with columns group_cols + [value_col].
+        """
+        stats = self.online_group_stats(chunks, group_cols, value_col)
+        return stats[list(group_cols) + ["mean"]].rename(columns={"mean": value_col})
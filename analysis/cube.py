@@ -0,0 +1,225 @@
+"""Dense indicator × country × year arrays for vectorized analysis."""
+import numpy as np
+import pandas as pd
+from typing import Optional, Sequence
+from utils.periods import to_years
+
+# Axis names, in axis order, matching the long-format report columns
+AXES = ("indicator_code", "country_code", "report_date")
+
+
+class IndicatorCube:
+    """
+    Reports held as a dense NumPy array with labeled axes.
+
+    values has shape (indicators, countries, years); NaN marks a missing
+    report. The year axis is contiguous, so shifting along it compares
+    consecutive years. Statistics are axis reductions that ignore NaN.
+    """
+
+    def __init__(self, values: np.ndarray, indicators: Sequence[str],
+                 countries: Sequence[str], years: Sequence[int]) -> None:
+        """
+        Initialize IndicatorCube.
+
+        Args:
+            values: float array of shape (len(indicators), len(countries), len(years)).
+            indicators: Indicator code of each position on axis 0.
+            countries: Country code of each position on axis 1.
+            years: Year of each position on axis 2.
+
+        Raises:
+            ValueError: If the labels do not match the shape of values.
+        """
+        self.values = np.asarray(values, dtype="float64")
+        self.indicators = np.asarray(indicators, dtype=object)
+        self.countries = np.asarray(countries, dtype=object)
+        self.years = np.asarray(years, dtype="int64")
+        expected = (len(self.indicators), len(self.countries), len(self.years))
+        if self.values.shape != expected:
+            raise ValueError(f"values has shape {self.values.shape}, labels imply {expected}")
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, value_col: str = "value") -> "IndicatorCube":
+        """
+        Build a cube from long-format reports.
+
+        Args:
+            df: DataFrame with indicator_code, country_code, report_date and value_col.
+            value_col: Name of the value column.
+
+        Returns:
+            IndicatorCube covering every indicator, country and year in df
+            (years form a contiguous range).
+        """
+        indicator_pos, indicators = pd.factorize(df["indicator_code"].astype(str), sort=True)
+        country_pos, countries = pd.factorize(df["country_code"].astype(str), sort=True)
+        years = to_years(df["report_date"])
+        first_year = int(years.min()) if len(years) else 0
+        year_count = int(years.max()) - first_year + 1 if len(years) else 0
+
+        values = np.full((len(indicators), len(countries), year_count), np.nan)
+        values[indicator_pos, country_pos, years - first_year] = df[value_col].to_numpy(dtype="float64")
+        return cls(values, list(indicators), list(countries), first_year + np.arange(year_count))
+
+    @property
+    def count(self) -> int:
+        """Number of non-missing values."""
+        return int((~np.isnan(self.values)).sum())
+
+    def summary(self) -> dict:
+        """
+        Calculate summary statistics over all values.
+
+        Returns:
+            Dictionary with keys: mean, min, max, count
+        """
+        present = self.values[~np.isnan(self.values)]
+        if len(present) == 0:
+            return {"mean": float("nan"), "min": float("nan"), "max": float("nan"), "count": 0}
+        return {
+            "mean": float(present.mean()),
+            "min": float(present.min()),
+            "max": float(present.max()),
+            "count": len(present)
+        }
+
+    def mean(self, by: Sequence[str] = ()) -> np.ndarray:
+        """
+        Mean over every axis not named in by, ignoring missing values.
+
+        Args:
+            by: Axis names to keep (see AXES).
+
+        Returns:
+            Array with one dimension per kept axis (NaN where a group is empty).
+        """
+        reduce_axes = self._reduce_axes(by)
+        present = ~np.isnan(self.values)
+        total = np.where(present, self.values, 0.0).sum(axis=reduce_axes)
+        count = present.sum(axis=reduce_axes)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(count > 0, total / count, np.nan)
+
+    def group_mean(self, by: Sequence[str], value_col: str = "value") -> pd.DataFrame:
+        """
+        Mean per group as a long DataFrame, e.g. by=["country_code"] to compare countries.
+
+        Args:
+            by: Axis names to group by (see AXES).
+            value_col: Name given to the mean column.
+
+        Returns:
+            DataFrame with columns by + [value_col] for non-empty groups, sorted by group.
+        """
+        means = self.mean(by)
+        kept = sorted(AXES.index(name) for name in by)
+        grids = np.meshgrid(*[np.arange(means.shape[i]) for i in range(means.ndim)], indexing="ij")
+        present = ~np.isnan(means)
+
+        data = {name: self._labels(AXES.index(name))[grids[kept.index(AXES.index(name))][present]]
+                for name in by}
+        data[value_col] = means[present]
+        return pd.DataFrame(data).sort_values(list(by), ignore_index=True)
+
+    def trend(self, value_col: str = "value") -> pd.DataFrame:
+        """
+        Mean value per year across all indicators and countries.
+
+        Args:
+            value_col: Name given to the mean column.
+
+        Returns:
+            DataFrame with columns [report_date, value_col], sorted by date.
+        """
+        return self.group_mean(["report_date"], value_col)
+
+    def yoy_growth(self) -> "IndicatorCube":
+        """
+        Year-on-year growth rate (value / previous year's value - 1).
+
+        Returns:
+            IndicatorCube without the first year; NaN where either year is
+            missing or the previous value is zero.
+        """
+        previous, current = self.values[:, :, :-1], self.values[:, :, 1:]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            growth = np.where(previous != 0, current / previous - 1, np.nan)
+        return IndicatorCube(growth, self.indicators, self.countries, self.years[1:])
+
+    def rolling_mean(self, window: int, min_periods: Optional[int] = None) -> "IndicatorCube":
+        """
+        Trailing mean over window years, ignoring missing values.
+
+        Args:
+            window: Number of years in the window (including the current one).
+            min_periods: Minimum non-missing values required (default: window).
+
+        Returns:
+            IndicatorCube with the same axes.
+
+        Raises:
+            ValueError: If window is less than 1.
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        min_periods = window if min_periods is None else min_periods
+
+        # Window sums as differences of cumulative sums along the year axis
+        present = ~np.isnan(self.values)
+        pad = [(0, 0), (0, 0), (1, 0)]
+        sums = np.pad(np.where(present, self.values, 0.0).cumsum(axis=2), pad)
+        counts = np.pad(present.cumsum(axis=2), pad)
+        end = np.arange(1, self.values.shape[2] + 1)
+        start = np.maximum(end - window, 0)
+        window_sum = sums[:, :, end] - sums[:, :, start]
+        window_count = counts[:, :, end] - counts[:, :, start]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rolled = np.where(window_count >= max(min_periods, 1), window_sum / window_count, np.nan)
+        return IndicatorCube(rolled, self.indicators, self.countries, self.years)
+
+    def rank(self, ascending: bool = False) -> "IndicatorCube":
+        """
+        Rank countries within each indicator and year.
+
+        Args:
+            ascending: Rank the smallest value 1 (default: largest is 1).
+
+        Returns:
+            IndicatorCube of ranks starting at 1 (ties ranked in axis order,
+            NaN where the value is missing).
+        """
+        present = ~np.isnan(self.values)
+        # Missing values sort last in either direction
+        keys = np.where(present, self.values if ascending else -self.values, np.inf)
+        order = np.argsort(keys, axis=1, kind="stable")
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(1, self.values.shape[1] + 1)[None, :, None], axis=1)
+        return IndicatorCube(np.where(present, ranks, np.nan), self.indicators, self.countries, self.years)
+
+    def to_frame(self, value_col: str = "value") -> pd.DataFrame:
+        """
+        Convert non-missing values back to long format.
+
+        Args:
+            value_col: Name of the value column.
+
+        Returns:
+            DataFrame with columns indicator_code, country_code, report_date, value_col.
+        """
+        positions = np.nonzero(~np.isnan(self.values))
+        data = {name: self._labels(axis)[positions[axis]] for axis, name in enumerate(AXES)}
+        data[value_col] = self.values[positions]
+        return pd.DataFrame(data)
+
+    def _reduce_axes(self, by: Sequence[str]) -> tuple:
+        """Axes to reduce when keeping the named ones."""
+        unknown = [name for name in by if name not in AXES]
+        if unknown:
+            raise ValueError(f"Unknown cube axes: {unknown}")
+        return tuple(axis for axis, name in enumerate(AXES) if name not in by)
+
+    def _labels(self, axis: int) -> np.ndarray:
+        """Labels of an axis (integer years for report_date)."""
+        return (self.indicators, self.countries, self.years)[axis]
@@ -1,5 +1,15 @@
 """Filtering criteria for data queries."""
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple, Union
+from utils.periods import first_year_from, to_years, year_of
+
+
+def _as_list(codes: Optional[Union[str, Sequence[str]]]) -> List[str]:
+    """Normalize a single code or a sequence of codes to a list."""
+    if not codes:
+        return []
+    if isinstance(codes, str):
+        return [codes]
+    return list(codes)
 
 
 class FilterCriteria:
@@ -7,25 +17,72 @@ class FilterCriteria:
 
     def __init__(
         self,
-        country: Optional[str] = None,
+        country: Optional[Union[str, Sequence[str]]] = None,
         date_from: Optional[str] = None,
-        date_to: Optional[str] = None
+        date_to: Optional[str] = None,
+        indicator: Optional[Union[str, Sequence[str]]] = None,
+        value_min: Optional[float] = None,
+        value_max: Optional[float] = None
     ) -> None:
         """
         Initialize FilterCriteria.
 
         Args:
-            country: Country code to filter by (e.g., "ABW").
-            date_from: Start date in ISO format (e.g., "2020-01-01").
-            date_to: End date in ISO format (e.g., "2024-12-31").
+            country: Country code or list of codes to filter by (e.g., "ABW").
+            date_from: Start date in ISO format (e.g., "2020-01-01") or a year.
+            date_to: End date in ISO format (e.g., "2024-12-31") or a year.
+            indicator: Indicator code or list of codes (e.g., "SP.DYN.LE00.IN").
+            value_min: Minimum value (inclusive).
+            value_max: Maximum value (inclusive).
         """
         self.country = country
         self.date_from = date_from
         self.date_to = date_to
+        self.indicator = indicator
+        self.value_min = value_min
+        self.value_max = value_max
+
+    @property
+    def countries(self) -> List[str]:
+        """List of country codes to filter by (empty if unfiltered)."""
+        return _as_list(self.country)
+
+    @property
+    def indicators(self) -> List[str]:
+        """List of indicator codes to filter by (empty if unfiltered)."""
+        return _as_list(self.indicator)
+
+    @property
+    def year_from(self) -> Optional[int]:
+        """
+        First report year in range (reports are dated 1 January), or None.
 
-    def to_sql_where(self) -> Tuple[str, tuple]:
+        Raises:
+            ValueError: If date_from is not a valid year or ISO date.
         """
-        Generate SQL WHERE clause and parameters.
+        return first_year_from(self.date_from) if self.date_from else None
+
+    @property
+    def year_to(self) -> Optional[int]:
+        """
+        Last report year in range, or None.
+
+        Raises:
+            ValueError: If date_to is not a valid year or ISO date.
+        """
+        return year_of(self.date_to) if self.date_to else None
+
+    def to_sql_where(self, table_alias: Optional[str] = None) -> Tuple[str, tuple]:
+        """
+        Generate SQL WHERE clause and parameters for the reports table.
+
+        Indicator codes are resolved through a subquery on indicators so the
+        clause can be used without a join. Dates are converted to integer
+        report years to match the report_date column.
+
+        Args:
+            table_alias: Alias of the reports table to qualify columns with
+                (needed when the query joins other tables).
 
         Returns:
             Tuple of (where_clause, params):
@@ -34,48 +91,87 @@ class FilterCriteria:
         """
         conditions = []
         params = []
-
-        if self.country:
-            conditions.append("country_code = ?")
-            params.append(self.country)
+        prefix = f"{table_alias}." if table_alias else ""
+
+        countries = self.countries
+        if len(countries) == 1:
+            conditions.append(f"{prefix}country_code = ?")
+            params.append(countries[0])
+        elif countries:
+            conditions.append(f"{prefix}country_code IN ({', '.join('?' for _ in countries)})")
+            params.extend(countries)
+
+        indicators = self.indicators
+        if indicators:
+            conditions.append(
+                f"{prefix}indicator_id IN (SELECT indicator_id FROM indicators "
+                f"WHERE indicator_code IN ({', '.join('?' for _ in indicators)}))"
+            )
+            params.extend(indicators)
 
         if self.date_from:
-            conditions.append("report_date >= ?")
-            params.append(self.date_from)
+            conditions.append(f"{prefix}report_date >= ?")
+            params.append(self.year_from)
 
         if self.date_to:
-            conditions.append("report_date <= ?")
-            params.append(self.date_to)
+            conditions.append(f"{prefix}report_date <= ?")
+            params.append(self.year_to)
+
+        if self.value_min is not None:
+            conditions.append(f"{prefix}value >= ?")
+            params.append(self.value_min)
+
+        if self.value_max is not None:
+            conditions.append(f"{prefix}value <= ?")
+            params.append(self.value_max)
 
         if conditions:
             where_clause = "WHERE " + " AND ".join(conditions)
             return where_clause, tuple(params)
         else:
             return "", ()
-        
+
     def apply_pandas(self, df) -> "pd.DataFrame":
         """
         Apply filtering criteria to a pandas DataFrame.
 
+        All conditions are combined into one boolean mask, so the frame is
+        copied only once.
+
         Args:
-            df: Input DataFrame with columns: country_code, report_date, etc.
+            df: Input DataFrame with columns: country_code, report_date
+                (integer years, datetimes or ISO strings), etc.
+                (indicator_code is required when filtering by indicator).
 
         Returns:
             Filtered DataFrame.
         """
         import pandas as pd
-        
-        result = df.copy()
 
-        # Filter by country
-        if self.country:
-            result = result[result["country_code"] == self.country]
+        mask = pd.Series(True, index=df.index)
 
-        # Filter by date range
-        if self.date_from:
-            result = result[result["report_date"] >= self.date_from]
+        # Filter by country and indicator
+        countries = self.countries
+        if countries:
+            mask &= df["country_code"].isin(countries)
 
-        if self.date_to:
-            result = result[result["report_date"] <= self.date_to]
+        indicators = self.indicators
+        if indicators:
+            mask &= df["indicator_code"].isin(indicators)
+
+        # Filter by date range on integer years
+        if self.date_from or self.date_to:
+            years = to_years(df["report_date"])
+            if self.date_from:
+                mask &= years >= self.year_from
+            if self.date_to:
+                mask &= years <= self.year_to
+
+        # Filter by value range
+        if self.value_min is not None:
+            mask &= df["value"] >= self.value_min
+
+        if self.value_max is not None:
+            mask &= df["value"] <= self.value_max
 
-        return result
\ No newline at end of file
+        return df[mask].copy()
@@ -0,0 +1,83 @@
+"""Filtered report selections evaluated inside the database."""
+import pandas as pd
+from typing import Iterator, Optional, Sequence
+from analysis.cube import IndicatorCube
+from analysis.filters import FilterCriteria
+
+
+class ReportSelection:
+    """
+    A set of reports defined by FilterCriteria that stays in the database.
+
+    Analyzer operations on a ReportSelection are compiled to SQL GROUP BY
+    queries, so only aggregated rows are transferred into pandas.
+    """
+
+    def __init__(self, repo, criteria: Optional[FilterCriteria] = None) -> None:
+        """
+        Initialize ReportSelection.
+
+        Args:
+            repo: Connected DatabaseRepository instance.
+            criteria: FilterCriteria instance (None selects all reports).
+        """
+        self.repo = repo
+        self.criteria = criteria or FilterCriteria()
+
+    def aggregate(self, group_cols: Sequence[str] = ()) -> pd.DataFrame:
+        """
+        Aggregate the selection in SQL.
+
+        Args:
+            group_cols: Columns to group by (empty for a single overall row).
+
+        Returns:
+            DataFrame with columns group_cols + [count, sum, mean, min, max, var].
+        """
+        return self.repo.aggregate_reports(self.criteria, group_cols=group_cols)
+
+    def to_frame(self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Load the selected rows into memory.
+
+        Args:
+            columns: Columns to return (None for the repository defaults).
+
+        Returns:
+            DataFrame with the selected rows.
+        """
+        if columns is None:
+            return self.repo.select_reports(self.criteria)
+        return self.repo.select_reports(self.criteria, columns=columns)
+
+    def iter_chunks(self, columns: Optional[Sequence[str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream the selected rows as DataFrame chunks.
+
+        Args:
+            columns: Columns to return (None for the repository defaults).
+
+        Yields:
+            DataFrames with the selected rows.
+        """
+        if columns is None:
+            return self.repo.iter_reports(self.criteria)
+        return self.repo.iter_reports(self.criteria, columns=columns)
+
+    def to_cube(self) -> IndicatorCube:
+        """
+        Load the selection as a dense indicator × country × year cube.
+
+        Repositories with a select_block() method (the cube backend) return
+        the array directly; others are loaded row-wise and pivoted.
+
+        Returns:
+            IndicatorCube of the selected reports.
+        """
+        if hasattr(self.repo, "select_block"):
+            return IndicatorCube(*self.repo.select_block(self.criteria))
+        df = self.repo.select_reports(
+            self.criteria, columns=("indicator_code", "country_code", "report_date", "value"),
+            parse_dates=False
+        )
+        return IndicatorCube.from_frame(df)
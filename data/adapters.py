@@ -0,0 +1,384 @@
+"""Registry of dataset adapters: how each source format is read and normalized."""
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+from utils.config import LONG_FORMAT_CHUNK_SCALE
+from utils.periods import to_years
+
+# Columns of the common long-format schema, in order
+NORMALIZED_COLUMNS = ["country_code", "country_name", "indicator_code",
+                      "indicator_name", "report_date", "value"]
+
+# Common-schema columns read as categoricals
+_ID_COLUMNS = ("country_code", "country_name", "indicator_code", "indicator_name")
+
+
+class DatasetAdapter:
+    """
+    Describes one source format: reader options and normalization.
+
+    Subclasses implement usecols(), dtypes() and normalize(). Adapters are
+    stateless, so normalize() can be applied to each chunk of a file.
+    """
+
+    # True if each source row holds a whole series, so no series spans two chunks
+    whole_series = False
+
+    def __init__(self, name: str, column_map: Dict[str, str], metadata_rows: int = 0,
+                 chunk_scale: int = 1) -> None:
+        """
+        Initialize DatasetAdapter.
+
+        Args:
+            name: Dataset type used to look the adapter up (e.g., "world_bank").
+            column_map: Source column name to common-schema column name.
+            metadata_rows: Lines above the header row to skip.
+            chunk_scale: Multiplier applied to the import chunk size, which
+                counts wide rows (one per country and indicator).
+        """
+        self.name = name
+        self.column_map = column_map
+        self.metadata_rows = metadata_rows
+        self.chunk_scale = chunk_scale
+
+    def read_options(self, header: List[str], float32: bool = False) -> dict:
+        """
+        Build the pandas.read_csv() keyword arguments for a file.
+
+        Args:
+            header: Column names of the file's header row.
+            float32: Read values as float32 instead of float64.
+
+        Returns:
+            Dictionary with skiprows, usecols and dtype.
+        """
+        columns = self.usecols(header)
+        return {
+            "skiprows": self.metadata_rows,
+            "usecols": columns,
+            "dtype": self.dtypes(columns, float32),
+        }
+
+    def usecols(self, header: List[str]) -> List[str]:
+        """Return the columns of header to read."""
+        raise NotImplementedError
+
+    def dtypes(self, columns: List[str], float32: bool = False) -> dict:
+        """Return explicit dtypes for the columns to read."""
+        raise NotImplementedError
+
+    def normalize(self, df: pd.DataFrame, dropna: bool = False) -> pd.DataFrame:
+        """Convert a frame read with read_options() to the common schema."""
+        raise NotImplementedError
+
+    def _check_columns(self, df: pd.DataFrame, required: List[str]) -> None:
+        """
+        Strip column names and check that required source columns exist.
+
+        Raises:
+            ValueError: If a required column is missing.
+        """
+        df.columns = df.columns.str.strip()
+        if not all(col in df.columns for col in required):
+            raise ValueError(f"Missing required columns. Found: {list(df.columns)}")
+
+
+class WideYearAdapter(DatasetAdapter):
+    """
+    Wide files with one row per country and indicator and one column per year.
+
+    The year block is reshaped in NumPy: values are raveled row by row,
+    identifiers are repeated as integer category codes and years tiled, so
+    no per-row Python strings are created.
+    """
+
+    whole_series = True
+
+    def usecols(self, header: List[str]) -> List[str]:
+        """Return all named columns, skipping the empty one left by a trailing comma."""
+        return [col for col in header if col.strip()]
+
+    def dtypes(self, columns: List[str], float32: bool = False) -> dict:
+        """Return "category" for identifier columns and floats for year columns."""
+        float_dtype = "float32" if float32 else "float64"
+        dtypes = {}
+        for col in columns:
+            if col.strip() in self.column_map:
+                dtypes[col] = "category"
+            elif col.strip().isdigit():
+                dtypes[col] = float_dtype
+        return dtypes
+
+    def normalize(self, df: pd.DataFrame, dropna: bool = False) -> pd.DataFrame:
+        """
+        Reshape the wide year block to long format.
+
+        Args:
+            df: Wide DataFrame with the identifier columns and year columns.
+            dropna: Leave out rows without a value before the frame is built.
+
+        Returns:
+            DataFrame with NORMALIZED_COLUMNS, ordered by source row, then year.
+            Identifier columns are categoricals, report_date is int64 and
+            value is float64 (float32 if all year columns are float32).
+
+        Raises:
+            ValueError: If an identifier column is missing.
+        """
+        self._check_columns(df, list(self.column_map))
+
+        # Identify year columns (columns that can be parsed as integers)
+        year_columns = [col for col in df.columns if col.isdigit()]
+
+        # Year block as a 2-D array (empty strings become NaN)
+        block = df[year_columns]
+        if not all(pd.api.types.is_float_dtype(dtype) for dtype in block.dtypes):
+            block = block.apply(pd.to_numeric, errors='coerce')
+        float32 = len(year_columns) > 0 and all(dtype == "float32" for dtype in block.dtypes)
+        values = block.to_numpy(dtype="float32" if float32 else "float64").ravel()
+
+        # Row and year of every cell, restricted to cells with a value
+        row_index = np.repeat(np.arange(len(df)), len(year_columns))
+        years = np.tile(np.array(year_columns, dtype="int64"), len(df))
+        if dropna:
+            mask = ~np.isnan(values)
+            values, row_index, years = values[mask], row_index[mask], years[mask]
+
+        df_long = pd.DataFrame({
+            name: _repeat_categorical(df[col], row_index) for col, name in self.column_map.items()
+        })[list(_ID_COLUMNS)]
+        df_long["report_date"] = years
+        df_long["value"] = values
+        return df_long
+
+
+class LongFormatAdapter(DatasetAdapter):
+    """
+    Long files with one row per country, indicator and period.
+
+    Normalization only selects, renames and casts columns; no reshape is
+    needed. Name columns are optional and default to the codes.
+
+    Sources may split an indicator by further dimensions (sex, age group,
+    unit). Rows at a dimension's default value, or without a value for it,
+    keep the plain indicator code; other values are appended to the code
+    and name, so distinct observations never share a (country, indicator,
+    year) key.
+    """
+
+    # Common-schema columns every long-format source must provide
+    REQUIRED = ("country_code", "indicator_code", "report_date", "value")
+
+    def __init__(self, name: str, column_map: Dict[str, str], metadata_rows: int = 0,
+                 chunk_scale: int = 1, dimensions: Optional[Dict[str, Optional[str]]] = None) -> None:
+        """
+        Initialize LongFormatAdapter.
+
+        Args:
+            name: Dataset type used to look the adapter up.
+            column_map: Source column name to common-schema column name.
+            metadata_rows: Lines above the header row to skip.
+            chunk_scale: Multiplier applied to the import chunk size.
+            dimensions: Source dimension column to its default value (None
+                if every value is folded into the indicator code), in the
+                order the values are appended.
+        """
+        super().__init__(name, column_map, metadata_rows, chunk_scale)
+        self.dimensions = dimensions or {}
+
+    def usecols(self, header: List[str]) -> List[str]:
+        """Return the mapped and dimension columns present in header."""
+        return [col for col in header if col.strip() in self.column_map or col.strip() in self.dimensions]
+
+    def dtypes(self, columns: List[str], float32: bool = False) -> dict:
+        """Return "category" for identifier and dimension columns and a float for the value."""
+        dtypes = {}
+        for col in columns:
+            target = self.column_map.get(col.strip())
+            if target in _ID_COLUMNS or col.strip() in self.dimensions:
+                dtypes[col] = "category"
+            elif target == "value":
+                dtypes[col] = "float32" if float32 else "float64"
+        return dtypes
+
+    def normalize(self, df: pd.DataFrame, dropna: bool = False) -> pd.DataFrame:
+        """
+        Map a long-format frame to the common schema.
+
+        Args:
+            df: DataFrame with the source's columns.
+            dropna: Leave out rows without a value.
+
+        Returns:
+            DataFrame with NORMALIZED_COLUMNS. Identifier columns are
+            categoricals and report_date is the int64 year of the period.
+
+        Raises:
+            ValueError: If a required column is missing or a period is not
+                a single year (e.g. "2020-Q1").
+        """
+        required = [col for col, target in self.column_map.items() if target in self.REQUIRED]
+        self._check_columns(df, required)
+
+        df_long = df[[col for col in self.column_map if col in df.columns]].rename(columns=self.column_map)
+        if not pd.api.types.is_float_dtype(df_long["value"]):
+            df_long["value"] = pd.to_numeric(df_long["value"], errors='coerce')
+        for code_col, name_col in (("country_code", "country_name"), ("indicator_code", "indicator_name")):
+            if name_col not in df_long.columns:
+                df_long[name_col] = df_long[code_col]
+        self._fold_dimensions(df, df_long)
+        if dropna:
+            df_long = df_long[df_long["value"].notna()]
+        for col in _ID_COLUMNS:
+            if not isinstance(df_long[col].dtype, pd.CategoricalDtype):
+                df_long[col] = df_long[col].astype("category")
+
+        df_long["report_date"] = _annual_years(df_long["report_date"])
+        return df_long[NORMALIZED_COLUMNS].reset_index(drop=True)
+
+    def _fold_dimensions(self, df: pd.DataFrame, df_long: pd.DataFrame) -> None:
+        """
+        Append non-default dimension values to indicator_code and indicator_name in place.
+
+        A female-only GHO row of WHOSIS_000001 becomes WHOSIS_000001.SEX_FMLE,
+        named "Life expectancy at birth (years) (SEX_FMLE)".
+
+        Args:
+            df: Source frame, row-aligned with df_long.
+            df_long: Renamed frame with indicator_code and indicator_name.
+        """
+        code_suffix = pd.Series("", index=df_long.index, dtype=object)
+        name_suffix = pd.Series("", index=df_long.index, dtype=object)
+        for col, default in self.dimensions.items():
+            if col not in df.columns:
+                continue
+            values = df[col].astype(object)
+            fold = values.notna() & (values != default)
+            code_suffix[fold] = code_suffix[fold] + "." + values[fold].astype(str)
+            name_suffix[fold] = name_suffix[fold] + ", " + values[fold].astype(str)
+
+        folded = code_suffix != ""
+        if not folded.any():
+            return
+        codes = df_long["indicator_code"].astype(object)
+        names = df_long["indicator_name"].astype(object)
+        codes[folded] = codes[folded].astype(str) + code_suffix[folded]
+        names[folded] = names[folded].astype(str) + " (" + name_suffix[folded].str[2:] + ")"
+        df_long["indicator_code"] = codes
+        df_long["indicator_name"] = names
+
+
+def _annual_years(periods: pd.Series) -> np.ndarray:
+    """
+    Convert period labels of a long-format source to years.
+
+    Args:
+        periods: Series of integer years or year strings.
+
+    Returns:
+        int64 array of years.
+
+    Raises:
+        ValueError: If a period is not a single year, such as "2020-Q1" or
+            "2015-2019"; truncating it would merge distinct reports.
+    """
+    if not pd.api.types.is_integer_dtype(periods):
+        text = periods.astype(str).str.strip()
+        invalid = ~text.str.fullmatch(r"\d{4}")
+        if invalid.any():
+            raise ValueError(f"Only annual periods are supported, found: {text[invalid].iloc[0]!r}")
+        periods = text
+    return to_years(periods)
+
+
+def _repeat_categorical(column: pd.Series, row_index: np.ndarray) -> pd.Categorical:
+    """
+    Build a categorical by taking one integer code per output row.
+
+    Args:
+        column: Identifier column of the wide frame.
+        row_index: Source row of every output row.
+
+    Returns:
+        Categorical with the column's distinct values as categories.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes, categories = column.cat.codes.to_numpy(), column.cat.categories
+    else:
+        codes, categories = pd.factorize(column)
+    return pd.Categorical.from_codes(codes[row_index], categories=categories)
+
+
+# Registered adapters by dataset type
+ADAPTERS: Dict[str, DatasetAdapter] = {}
+
+
+def register_adapter(adapter: DatasetAdapter) -> DatasetAdapter:
+    """
+    Register an adapter under its name, replacing any previous one.
+
+    Args:
+        adapter: DatasetAdapter instance.
+
+    Returns:
+        The registered adapter.
+    """
+    ADAPTERS[adapter.name] = adapter
+    return adapter
+
+
+def get_adapter(dataset: str) -> DatasetAdapter:
+    """
+    Look up the adapter of a dataset type.
+
+    Args:
+        dataset: Dataset type (e.g., "world_bank").
+
+    Returns:
+        The registered DatasetAdapter.
+
+    Raises:
+        ValueError: If no adapter is registered for dataset.
+    """
+    if dataset not in ADAPTERS:
+        raise ValueError(f"Unknown dataset type: {dataset}")
+    return ADAPTERS[dataset]
+
+
+# World Bank WDI bulk CSV: 4 metadata lines, then one column per year
+register_adapter(WideYearAdapter("world_bank", {
+    "Country Code": "country_code",
+    "Country Name": "country_name",
+    "Indicator Code": "indicator_code",
+    "Indicator Name": "indicator_name",
+}, metadata_rows=4))
+
+# WHO Global Health Observatory CSV export; Dim1 is usually sex, where
+# "Both sexes" keeps the plain indicator code
+register_adapter(LongFormatAdapter("who_gho", {
+    "SpatialDimValueCode": "country_code",
+    "Location": "country_name",
+    "IndicatorCode": "indicator_code",
+    "Indicator": "indicator_name",
+    "Period": "report_date",
+    "FactValueNumeric": "value",
+}, chunk_scale=LONG_FORMAT_CHUNK_SCALE, dimensions={
+    "Dim1ValueCode": "SEX_BTSX",
+    "Dim2ValueCode": None,
+    "Dim3ValueCode": None,
+}))
+
+# OECD Data Explorer SDMX-CSV export with labels; totals ("_T") keep the
+# plain measure code, and the unit is always part of it
+register_adapter(LongFormatAdapter("oecd", {
+    "REF_AREA": "country_code",
+    "Reference area": "country_name",
+    "MEASURE": "indicator_code",
+    "Measure": "indicator_name",
+    "TIME_PERIOD": "report_date",
+    "OBS_VALUE": "value",
+}, chunk_scale=LONG_FORMAT_CHUNK_SCALE, dimensions={
+    "SEX": "_T",
+    "AGE": "_T",
+    "UNIT_MEASURE": None,
+}))
@@ -0,0 +1,198 @@
+"""Asyncio interface to a repository for non-blocking front ends."""
+import asyncio
+import functools
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterator, List, Optional, Sequence, Tuple
+from data.repository import DEFAULT_REPORT_COLUMNS
+from utils.config import QUERY_CHUNK_SIZE
+
+if TYPE_CHECKING:
+    from analysis.filters import FilterCriteria
+    from data.repository import DatabaseRepository
+
+
+class AsyncRepository:
+    """
+    Run repository queries on a worker thread pool and await the results.
+
+    Each call is handed to a ThreadPoolExecutor, so the event loop stays
+    responsive while SQLite works. Several queries can be awaited together
+    with asyncio.gather(); on DatabaseRepository each one runs on its own
+    pooled read connection. Streaming methods are async iterators that fetch
+    one chunk per call on a thread of their own; wrap them in
+    contextlib.aclosing() when stopping early so the read connection is
+    released right away.
+
+    The wrapped repository must be connected; it is not closed by close()
+    or aclose(). Leaving an ``async with`` block awaits aclose().
+    """
+
+    def __init__(self, repo: "DatabaseRepository", max_workers: Optional[int] = None) -> None:
+        """
+        Initialize AsyncRepository.
+
+        Args:
+            repo: Connected DatabaseRepository (or CubeRepository) to query.
+            max_workers: Number of worker threads (default: the repository's
+                read pool size).
+        """
+        self.repo = repo
+        workers = max_workers or getattr(repo, "read_pool_size", 0) or 1
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="async-repo")
+
+    async def __aenter__(self) -> "AsyncRepository":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def close(self) -> None:
+        """Shut down the worker threads after pending calls finish."""
+        self._executor.shutdown(wait=True)
+
+    async def aclose(self) -> None:
+        """Shut down the worker threads, awaiting pending calls without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, functools.partial(self._executor.shutdown, wait=True))
+
+    async def query(self, sql: str, params: tuple = ()) -> pd.DataFrame:
+        """
+        Execute a SELECT query without blocking the event loop.
+
+        Args:
+            sql: SQL SELECT statement.
+            params: Query parameters.
+
+        Returns:
+            DataFrame containing query results.
+        """
+        return await self._run(self.repo.query_reports, sql, params)
+
+    async def query_many(self, queries: Sequence[Tuple[str, tuple]]) -> List[pd.DataFrame]:
+        """
+        Execute independent queries concurrently.
+
+        Args:
+            queries: Sequence of (sql, params) pairs.
+
+        Returns:
+            List of DataFrames in the order of queries.
+        """
+        return list(await asyncio.gather(*(self.query(sql, params) for sql, params in queries)))
+
+    async def select_reports(
+        self,
+        criteria: Optional["FilterCriteria"] = None,
+        columns: Sequence[str] = DEFAULT_REPORT_COLUMNS,
+        float32: bool = False,
+        parse_dates: bool = False
+    ) -> pd.DataFrame:
+        """
+        Query reports matching criteria; see DatabaseRepository.select_reports().
+
+        Args:
+            criteria: FilterCriteria instance (None selects all reports).
+            columns: Column names to return.
+            float32: Return value as float32 instead of float64.
+            parse_dates: Convert report_date from integer years to datetime64.
+
+        Returns:
+            DataFrame with the requested columns.
+        """
+        return await self._run(self.repo.select_reports, criteria, columns,
+                               float32=float32, parse_dates=parse_dates)
+
+    async def aggregate_reports(
+        self,
+        criteria: Optional["FilterCriteria"] = None,
+        group_cols: Sequence[str] = (),
+        parse_dates: bool = False
+    ) -> pd.DataFrame:
+        """
+        Aggregate reports matching criteria; see DatabaseRepository.aggregate_reports().
+
+        Args:
+            criteria: FilterCriteria instance (None aggregates all reports).
+            group_cols: Columns to group by.
+            parse_dates: Convert report_date from integer years to datetime64.
+
+        Returns:
+            DataFrame with columns group_cols + [count, sum, mean, min, max, var].
+        """
+        return await self._run(self.repo.aggregate_reports, criteria, group_cols,
+                               parse_dates=parse_dates)
+
+    def iter_query(
+        self,
+        sql: str,
+        params: tuple = (),
+        chunksize: int = QUERY_CHUNK_SIZE
+    ) -> AsyncIterator[pd.DataFrame]:
+        """
+        Stream a SELECT query as DataFrame chunks.
+
+        Args:
+            sql: SQL SELECT statement.
+            params: Query parameters.
+            chunksize: Number of rows per chunk.
+
+        Yields:
+            DataFrames of at most chunksize rows.
+        """
+        return self._iterate(self.repo.iter_query, sql, params, chunksize=chunksize)
+
+    def iter_reports(
+        self,
+        criteria: Optional["FilterCriteria"] = None,
+        columns: Sequence[str] = DEFAULT_REPORT_COLUMNS,
+        chunksize: int = QUERY_CHUNK_SIZE,
+        float32: bool = False,
+        parse_dates: bool = False
+    ) -> AsyncIterator[pd.DataFrame]:
+        """
+        Stream reports matching criteria; see DatabaseRepository.iter_reports().
+
+        Args:
+            criteria: FilterCriteria instance (None selects all reports).
+            columns: Column names to return.
+            chunksize: Number of rows per chunk.
+            float32: Return value as float32 instead of float64.
+            parse_dates: Convert report_date from integer years to datetime64.
+
+        Yields:
+            DataFrames with the requested columns.
+        """
+        return self._iterate(self.repo.iter_reports, criteria, columns, chunksize=chunksize,
+                             float32=float32, parse_dates=parse_dates)
+
+    async def _run(self, func: Callable, *args, **kwargs):
+        """Call func on a worker thread and await its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _iterate(self, func: Callable[..., Iterator[pd.DataFrame]], *args,
+                       **kwargs) -> AsyncIterator[pd.DataFrame]:
+        """
+        Drive a blocking chunk iterator from a dedicated worker thread.
+
+        Every call on the iterator runs on the same thread, so a lock it
+        holds between chunks (the writer lock of a repository without a
+        read pool) is released by the thread that took it. The iterator is
+        closed when the consumer stops early, so its read connection goes
+        back to the pool.
+        """
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="async-repo-iter")
+        try:
+            chunks = await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+            try:
+                while True:
+                    chunk = await loop.run_in_executor(executor, next, chunks, None)
+                    if chunk is None:
+                        return
+                    yield chunk
+            finally:
+                await loop.run_in_executor(executor, chunks.close)
+        finally:
+            executor.shutdown(wait=False)
@@ -0,0 +1,26 @@
+"""Selection of the storage backend."""
+from typing import Union
+from data.cube_repository import CubeRepository
+from data.repository import DatabaseRepository
+from utils.config import CUBE_STORE_PATH, DEFAULT_DB_PATH, STORAGE_BACKEND
+
+
+def create_repository(backend: str = STORAGE_BACKEND) -> Union[DatabaseRepository, CubeRepository]:
+    """
+    Create the repository for a storage backend.
+
+    Args:
+        backend: "sqlite" for DatabaseRepository at DEFAULT_DB_PATH or
+            "cube" for CubeRepository at CUBE_STORE_PATH.
+
+    Returns:
+        Unconnected repository instance.
+
+    Raises:
+        ValueError: If backend is unknown.
+    """
+    if backend == "sqlite":
+        return DatabaseRepository(DEFAULT_DB_PATH)
+    if backend == "cube":
+        return CubeRepository(CUBE_STORE_PATH)
+    raise ValueError(f"Unknown storage backend: {backend}")
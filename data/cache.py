@@ -0,0 +1,124 @@
+"""In-memory LRU cache for query results."""
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+import pandas as pd
+
+
+class QueryCache:
+    """
+    Least-recently-used cache of query result DataFrames bounded by memory.
+
+    Entries belong to a data version; when a lookup arrives with a newer
+    version (the repository bumps it on every write) the cache is emptied.
+    Results read at an older version are never stored, so a query that
+    overlapped a write cannot repopulate the cache. All methods are
+    thread-safe.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """
+        Initialize QueryCache.
+
+        Args:
+            max_bytes: Maximum total size of cached DataFrames (0 disables caching).
+        """
+        self.max_bytes = max_bytes
+        self.version = 0
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, version: int) -> Optional[pd.DataFrame]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Cache key (e.g. normalized SQL and parameters).
+            version: Current data version of the repository.
+
+        Returns:
+            A copy of the cached DataFrame, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key) if self._check_version(version) else None
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0].copy()
+
+    def put(self, key: Hashable, df: pd.DataFrame, version: int) -> None:
+        """
+        Store a result, evicting least-recently-used entries to stay within max_bytes.
+
+        Results larger than max_bytes are not cached.
+
+        Args:
+            key: Cache key.
+            df: Query result to cache (a copy is stored).
+            version: Data version the result was read at.
+        """
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if not self._check_version(version):
+                return
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            while self._entries and self.current_bytes + size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+            self._entries[key] = (df.copy(), size)
+            self.current_bytes += size
+
+    def clear(self) -> None:
+        """Remove all cached entries (counters are kept)."""
+        with self._lock:
+            self._clear()
+
+    def stats(self) -> dict:
+        """
+        Return cache counters.
+
+        Returns:
+            Dictionary with keys: hits, misses, evictions, entries, bytes, hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+    def _clear(self) -> None:
+        """Remove all entries; the caller holds the lock."""
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def _check_version(self, version: int) -> bool:
+        """
+        Drop all entries when a newer data version arrives.
+
+        Returns:
+            False if version is older than the cache's version (a stale reader).
+        """
+        if version < self.version:
+            return False
+        if version > self.version:
+            self._clear()
+            self.version = version
+        return True
@@ -1,76 +1,84 @@
 """Data cleaning and normalization."""
+import pickle
+import tempfile
+import numpy as np
 import pandas as pd
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from data.adapters import get_adapter
+from data.quality import QualityProfile
+
+# Version of the normalize_schema() output format; bump when it changes so
+# cached normalized datasets (see data/dataset_cache.py) are not reused
+NORMALIZE_VERSION = 4
+
+# Columns identifying one time series; imputation never crosses series
+SERIES_KEYS = ["country_code", "indicator_code"]
+
+# Strategies that fill missing values from other values of the same series
+IMPUTE_STRATEGIES = ("ffill", "interpolate", "mean")
 
 
 class DataCleaner:
     """Handles data cleaning and schema normalization."""
 
-    def normalize_schema(self, df: pd.DataFrame, dataset: str) -> pd.DataFrame:
+    def __init__(self, profile: Optional[QualityProfile] = None) -> None:
+        """
+        Initialize DataCleaner.
+
+        Args:
+            profile: QualityProfile updated with every frame normalize_schema()
+                produces (None disables profiling).
+        """
+        self.profile = profile
+
+    def normalize_schema(self, df: pd.DataFrame, dataset: str, dropna: bool = False) -> pd.DataFrame:
         """
         Normalize dataset-specific schema to common format.
 
+        Delegates to the dataset's adapter (see data/adapters.py): wide
+        sources are reshaped in NumPy, long-format sources are only mapped
+        and cast.
+
         Args:
             df: Input DataFrame with dataset-specific columns.
-            dataset: Dataset type (e.g., "world_bank").
+            dataset: Dataset type (e.g., "world_bank", "who_gho", "oecd").
+            dropna: Leave out rows without a value.
 
         Returns:
             DataFrame with normalized schema:
             [country_code, country_name, indicator_code, indicator_name, report_date, value]
+            Identifier columns are categoricals and report_date is int64.
+
+        Raises:
+            ValueError: If the dataset type is unknown or required columns are missing.
         """
-        if dataset == "world_bank":
-            # Strip whitespace from column names
-            df.columns = df.columns.str.strip()
-            
-            # Check if required columns exist
-            required_cols = ["Country Name", "Country Code", "Indicator Name", "Indicator Code"]
-            if not all(col in df.columns for col in required_cols):
-                raise ValueError(f"Missing required columns. Found: {list(df.columns)}")
-            
-            # Identify year columns (columns that can be parsed as integers)
-            year_columns = [col for col in df.columns if col.isdigit()]
-
-            # Rename identifier columns to common schema
-            df_renamed = df.rename(columns={
-                "Country Name": "country_name",
-                "Country Code": "country_code",
-                "Indicator Name": "indicator_name",
-                "Indicator Code": "indicator_code"
-            })
-
-            # Melt wide format to long format
-            id_vars = ["country_code", "country_name", "indicator_code", "indicator_name"]
-            df_long = pd.melt(
-                df_renamed,
-                id_vars=id_vars,
-                value_vars=year_columns,
-                var_name="year",
-                value_name="value"
-            )
-
-            # Transform year to ISO date format (YYYY-01-01)
-            df_long["report_date"] = df_long["year"] + "-01-01"
-            df_long = df_long.drop(columns=["year"])
-
-            # Convert value to numeric (empty strings become NaN)
-            df_long["value"] = pd.to_numeric(df_long["value"], errors='coerce')
-
-            # Reorder columns
-            df_long = df_long[["country_code", "country_name", "indicator_code", 
-                              "indicator_name", "report_date", "value"]]
-
-            return df_long
-        else:
-            raise ValueError(f"Unknown dataset type: {dataset}")
+        adapter = get_adapter(dataset)
+        if self.profile is None:
+            return adapter.normalize(df, dropna=dropna)
+
+        # Profile before dropping, so null ratios include the empty cells
+        df_long = adapter.normalize(df)
+        self.profile.update(df_long)
+        return df_long[df_long["value"].notna()].reset_index(drop=True) if dropna else df_long
         
     def handle_missing(self, df: pd.DataFrame, strategy: str = "drop") -> pd.DataFrame:
         """
         Handle missing values in the DataFrame.
 
+        The imputing strategies work per (country_code, indicator_code)
+        series ordered by report_date, and run as array operations over all
+        series at once. Rows they cannot fill (e.g. before the first value
+        of a series) are removed.
+
         Args:
             df: Input DataFrame.
             strategy: Strategy to handle missing values:
                     - "drop": Remove rows with missing values
                     - "fill_zero": Replace missing numeric values with 0
+                    - "ffill": Carry the last value of the series forward
+                    - "interpolate": Interpolate linearly in report_date
+                      between the surrounding values of the series
+                    - "mean": Use the mean of the series
 
         Returns:
             DataFrame with missing values handled.
@@ -81,9 +89,238 @@ class DataCleaner:
         elif strategy == "fill_zero":
             # Fill missing numeric values with 0
             return df.fillna(0)
+        elif strategy in IMPUTE_STRATEGIES:
+            result = df.assign(value=self._impute(df, strategy))
+            return result[result["value"].notna()]
         else:
             raise ValueError(f"Unknown strategy: {strategy}")
-        
+
+    def iter_handle_missing(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        strategy: str = "drop",
+        whole_series: bool = False
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Handle missing values over a stream of chunks, e.g. a streaming import.
+
+        Series may span chunks. Rows a later chunk can still affect are
+        carried over: for "ffill" and "interpolate" the last value of each
+        series, plus for "interpolate" the missing rows after it; for
+        "mean" every missing row until the stream ends, spilled to a
+        temporary file. Each series' years must arrive in ascending order
+        across chunks (any order within a chunk). The result equals
+        handle_missing() on the concatenated chunks.
+
+        Args:
+            chunks: Iterable of DataFrames.
+            strategy: Strategy accepted by handle_missing().
+            whole_series: Every series lies within one chunk, as with wide
+                sources (see DatasetAdapter.whole_series); each chunk is
+                then handled on its own and nothing is carried.
+
+        Yields:
+            DataFrames with missing values handled (possibly empty).
+        """
+        if strategy not in IMPUTE_STRATEGIES or whole_series:
+            for chunk in chunks:
+                yield self.handle_missing(chunk, strategy)
+        elif strategy == "mean":
+            yield from self._iter_mean_imputed(chunks)
+        else:
+            yield from self._iter_series_imputed(chunks, strategy)
+
+    def _iter_series_imputed(self, chunks: Iterable[pd.DataFrame], strategy: str) -> Iterator[pd.DataFrame]:
+        """
+        Forward-fill or interpolate chunks, carrying series ends between them.
+
+        Carried rows are parked per source chunk, and only the rows of
+        series that occur in the incoming chunk are taken back, so the cost
+        of a chunk does not grow with the number of series seen before.
+        """
+        series_ids: Dict[tuple, int] = {}
+        parked: Dict[int, pd.DataFrame] = {}
+        parked_in: Dict[int, int] = {}
+        for number, chunk in enumerate(chunks):
+            ids = self._stream_series_ids(chunk, series_ids)
+            frame = chunk.assign(_anchor=False, _series=ids)
+            present = np.unique(ids)
+
+            carried = []
+            for part_number in {parked_in.pop(i) for i in present.tolist() if i in parked_in}:
+                part = parked.pop(part_number)
+                take = np.isin(part["_series"].to_numpy(), present)
+                carried.append(part[take])
+                if not take.all():
+                    parked[part_number] = part[~take]
+            if carried:
+                frame = pd.concat(carried + [frame], ignore_index=True)
+            frame["value"] = self._impute(frame, strategy)
+            has_value = frame["value"].notna().to_numpy()
+
+            # Sorted position of the last value in each row's series (-1 if none)
+            order, _, start, end = self._series_layout(frame)
+            position = np.arange(len(order))
+            last = np.maximum.accumulate(np.where(has_value[order], position, -1))[end]
+            last[last < start] = -1
+
+            # The next chunk may fill rows after the last value, using that value
+            anchor = np.zeros(len(frame), dtype=bool)
+            anchor[order] = position == last
+            pending = np.zeros(len(frame), dtype=bool)
+            pending[order] = (position > last) & (last >= 0)
+
+            yield frame[has_value & ~frame["_anchor"].to_numpy()].drop(columns=["_anchor", "_series"])
+            carry = frame[anchor | pending].assign(_anchor=anchor[anchor | pending])
+            if len(carry):
+                parked[number] = carry
+                parked_in.update(dict.fromkeys(np.unique(carry["_series"].to_numpy()).tolist(), number))
+
+    def _stream_series_ids(self, chunk: pd.DataFrame, series_ids: Dict[tuple, int]) -> np.ndarray:
+        """
+        Return an id per row that identifies its series across chunks.
+
+        Keys are only looked up once per series in the chunk.
+
+        Args:
+            chunk: DataFrame with SERIES_KEYS.
+            series_ids: Series key to id, extended with unseen keys.
+
+        Returns:
+            int64 array of series ids.
+        """
+        _, first, inverse = np.unique(self._series_codes(chunk), return_index=True, return_inverse=True)
+        keys = zip(*(chunk[col].iloc[first].tolist() for col in SERIES_KEYS))
+        ids = np.array([series_ids.setdefault(key, len(series_ids)) for key in keys], dtype="int64")
+        return ids[inverse]
+
+    def _iter_mean_imputed(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Emit present values at once and fill missing rows with series means at the end.
+
+        Missing rows are spilled to a temporary file as they arrive and read
+        back one chunk at a time, so memory holds one chunk and the per-series
+        totals rather than every missing row of the stream.
+        """
+        totals = None
+        parts = 0
+        with tempfile.TemporaryFile() as spill:
+            for chunk in chunks:
+                has_value = chunk["value"].notna()
+                partial = chunk[has_value].groupby(SERIES_KEYS, observed=True)["value"].agg(["sum", "count"])
+                totals = partial if totals is None else totals.add(partial, fill_value=0)
+                if not has_value.all():
+                    pickle.dump(chunk[~has_value], spill, protocol=pickle.HIGHEST_PROTOCOL)
+                    parts += 1
+                yield chunk[has_value]
+
+            if totals is None:
+                return
+            means = (totals["sum"] / totals["count"]).rename("mean")
+            spill.seek(0)
+            for _ in range(parts):
+                rows = pickle.load(spill)
+                keys = pd.MultiIndex.from_frame(rows[SERIES_KEYS].astype(object))
+                rows["value"] = means.reindex(keys).to_numpy().astype(rows["value"].dtype)
+                yield rows[rows["value"].notna()]
+
+    def _impute(self, df: pd.DataFrame, strategy: str) -> np.ndarray:
+        """
+        Fill missing values from the same series without per-group loops.
+
+        Rows are sorted by series and report_date once; neighbouring values
+        are then found with cumulative max/min scans that do not cross
+        series boundaries.
+
+        Args:
+            df: DataFrame with SERIES_KEYS, report_date and value.
+            strategy: "ffill", "interpolate" or "mean".
+
+        Returns:
+            Array of values in df's row order, NaN where nothing could be filled.
+        """
+        order, series, start, end = self._series_layout(df)
+        values = df["value"].to_numpy(dtype=float)[order]
+        has_value = ~np.isnan(values)
+        position = np.arange(len(values))
+        filled = values.copy()
+        missing = ~has_value
+
+        if strategy == "mean":
+            sums = np.bincount(series, weights=np.where(has_value, values, 0.0))
+            counts = np.bincount(series, weights=has_value)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                filled[missing] = (sums / counts)[series[missing]]
+        else:
+            # Previous and next position holding a value, within the same series
+            prev = np.maximum.accumulate(np.where(has_value, position, -1))
+            prev[prev < start] = -1
+            if strategy == "ffill":
+                fill = missing & (prev >= 0)
+                filled[fill] = values[prev[fill]]
+            else:
+                nxt = np.minimum.accumulate(np.where(has_value, position, len(values))[::-1])[::-1]
+                nxt[nxt > end] = len(values)
+                fill = missing & (prev >= 0) & (nxt < len(values))
+                years = df["report_date"].to_numpy(dtype=float)[order]
+                lo, hi = prev[fill], nxt[fill]
+                filled[fill] = values[lo] + (values[hi] - values[lo]) * (years[fill] - years[lo]) / (years[hi] - years[lo])
+
+        result = np.empty_like(filled)
+        result[order] = filled
+        return result.astype(df["value"].dtype, copy=False)
+
+    @staticmethod
+    def _series_layout(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sort rows by series, then report_date.
+
+        Rows that already come grouped by series with ascending years, as
+        normalize_schema() returns them for wide sources, are not sorted.
+
+        Args:
+            df: DataFrame with SERIES_KEYS and report_date.
+
+        Returns:
+            Tuple of (order, series id, first and last sorted position of
+            the series) where the last three are aligned with the sorted rows.
+        """
+        series = DataCleaner._series_codes(df)
+        years = df["report_date"].to_numpy()
+        position = np.arange(len(df))
+        if len(df) == 0:
+            return position, series, position, position
+
+        boundary = series[1:] != series[:-1]
+        grouped = (np.all(boundary | (years[1:] > years[:-1]))
+                   and np.bincount(series[np.r_[True, boundary]]).max() == 1)
+        if grouped:
+            order = position
+        else:
+            # One int64 key sorts much faster than a two-key lexsort
+            order = np.argsort(series * (years.max() - years.min() + 1) + (years - years.min()))
+            series = series[order]
+            boundary = series[1:] != series[:-1]
+        first = np.r_[True, boundary]
+        last = np.r_[boundary, True]
+        start = np.maximum.accumulate(np.where(first, position, 0))
+        end = np.minimum.accumulate(np.where(last, position, len(order))[::-1])[::-1]
+        return order, series, start, end
+
+    @staticmethod
+    def _series_codes(df: pd.DataFrame) -> np.ndarray:
+        """Return an int64 code per row, equal for rows of the same series in df."""
+        # Combined integer codes of both keys (0 reserved for missing)
+        series = np.zeros(len(df), dtype="int64")
+        for col in SERIES_KEYS:
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                codes, size = df[col].cat.codes.to_numpy(), len(df[col].cat.categories)
+            else:
+                codes, uniques = pd.factorize(df[col])
+                size = len(uniques)
+            series = series * (size + 1) + codes + 1
+        return series
+
     def convert_types(self, df: pd.DataFrame, type_map: dict) -> pd.DataFrame:
         """
         Convert column data types according to type_map.
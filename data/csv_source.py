@@ -1,19 +1,50 @@
 """CSV data source for loading health data files."""
+import csv
+import importlib.util
+import itertools
 import pandas as pd
 import os
+from typing import Iterator, List, Optional
+from data.adapters import get_adapter
+
+
+def default_engine() -> str:
+    """
+    Return the fastest pandas CSV parser engine available.
+
+    Returns:
+        "pyarrow" if pyarrow is installed, "c" otherwise.
+    """
+    return "pyarrow" if importlib.util.find_spec("pyarrow") is not None else "c"
 
 
 class CSVDataSource:
-    """Loads and validates CSV files in World Bank WDI format."""
+    """Loads and validates CSV files in a registered dataset format (see data/adapters.py)."""
 
-    def __init__(self, file_path: str) -> None:
+    def __init__(
+        self,
+        file_path: str,
+        dataset: str = "world_bank",
+        float32: bool = False,
+        engine: Optional[str] = None
+    ) -> None:
         """
         Initialize CSVDataSource with a file path.
 
         Args:
             file_path: Path to the CSV file.
+            dataset: Dataset type whose adapter supplies the reader options.
+            float32: Read values as float32 instead of float64.
+            engine: pandas parser engine for load() (default: default_engine()).
+                iter_chunks() always uses the C engine, since pyarrow cannot
+                read in chunks.
         """
         self.file_path = file_path
+        self.adapter = get_adapter(dataset)
+        self.float32 = float32
+        self.engine = engine or default_engine()
+        self._header: Optional[List[str]] = None
+        self._header_offset: Optional[int] = None
 
     def validate(self) -> bool:
         """
@@ -26,32 +57,129 @@ class CSVDataSource:
             # Check if file exists
             if not os.path.exists(self.file_path):
                 return False
-            
+
             # Check if file is not empty
             if os.path.getsize(self.file_path) == 0:
                 return False
-            
-            # Try reading the file
-            pd.read_csv(self.file_path, skiprows=4, nrows=0)
-            return True
+
+            # Try reading the header row
+            return len(self.columns()) > 0
         except Exception:
             return False
 
+    def header(self) -> List[str]:
+        """
+        Read the header row below the adapter's metadata lines.
+
+        The header is read once with the csv module and cached, so
+        validate() and the loaders do not parse the file again.
+
+        Returns:
+            List of column names as they appear in the file.
+
+        Raises:
+            StopIteration: If the file has no header row.
+        """
+        if self._header is None:
+            with open(self.file_path, newline="", encoding="utf-8-sig") as f:
+                rows = itertools.islice(f, self.adapter.metadata_rows, None)
+                self._header = next(csv.reader(rows))
+        return self._header
+
+    def header_offset(self) -> int:
+        """
+        Return the byte offset of the header row (cached).
+
+        Returns:
+            Position after the adapter's metadata lines, blank lines included.
+        """
+        if self._header_offset is None:
+            with open(self.file_path, "rb") as f:
+                for _ in range(self.adapter.metadata_rows):
+                    f.readline()
+                self._header_offset = f.tell()
+        return self._header_offset
+
+    def columns(self) -> List[str]:
+        """
+        Return the columns the adapter reads, e.g. without the empty column
+        left by the trailing comma on every WDI line.
+
+        Returns:
+            List of column names.
+        """
+        return self.adapter.usecols(self.header())
+
+    def dtypes(self) -> dict:
+        """
+        Return the adapter's explicit dtypes for the columns to read.
+
+        Returns:
+            Dictionary mapping identifier columns to "category" and value
+            (or year) columns to float64 (or float32). Other columns are inferred.
+        """
+        return self.adapter.dtypes(self.columns(), self.float32)
+
+    def read_options(self, engine: Optional[str] = None) -> dict:
+        """
+        Build the pandas.read_csv() keyword arguments for this file.
+
+        Args:
+            engine: Parser engine (default: self.engine).
+
+        Returns:
+            Dictionary with skiprows, usecols, dtype and engine.
+        """
+        return {**self.adapter.read_options(self.header(), self.float32), "engine": engine or self.engine}
+
     def load(self) -> pd.DataFrame:
         """
         Load CSV file into a pandas DataFrame.
 
-        Skips the first 4 metadata rows of World Bank CSV format.
+        Skips the adapter's metadata rows (4 for World Bank CSV format) and
+        unused columns. Identifier columns are categoricals and value
+        columns floats (see dtypes()).
 
         Returns:
             DataFrame containing the CSV data.
 
         Raises:
-            ValueError: If the file cannot be validated or loaded.
+            ValueError: If the file cannot be validated or loaded, or a value
+                column contains a non-numeric value.
+        """
+        if not self.validate():
+            raise ValueError(f"Cannot load CSV file: {self.file_path}")
+
+        options = self.read_options()
+        if options["engine"] == "pyarrow" and options["skiprows"]:
+            # pyarrow's skip_rows does not count blank lines (WDI files have
+            # one after each metadata line), so start reading at the header
+            with open(self.file_path, "rb") as f:
+                f.seek(self.header_offset())
+                return pd.read_csv(f, **{**options, "skiprows": 0})
+
+        df = pd.read_csv(self.file_path, **options)
+        return df
+
+    def iter_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Load CSV file as an iterator of DataFrame chunks.
+
+        Only chunksize rows are held in memory at a time, so files larger
+        than available memory can be processed.
+
+        Args:
+            chunksize: Number of CSV rows per chunk.
+
+        Yields:
+            DataFrames with the same columns and dtypes as load().
+
+        Raises:
+            ValueError: If the file cannot be validated.
         """
         if not self.validate():
             raise ValueError(f"Cannot load CSV file: {self.file_path}")
-        
-        # Load CSV with skiprows=4 to skip World Bank metadata rows
-        df = pd.read_csv(self.file_path, skiprows=4)
-        return df
\ No newline at end of file
+
+        with pd.read_csv(self.file_path, chunksize=chunksize, **self.read_options(engine="c")) as reader:
+            for chunk in reader:
+                yield chunk
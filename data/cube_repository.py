@@ -0,0 +1,680 @@
+"""Memory-mapped columnar storage backend for health data."""
+import datetime
+import json
+import os
+import time
+from contextlib import contextmanager
+import numpy as np
+import pandas as pd
+from typing import TYPE_CHECKING, Iterator, List, Optional, Sequence, Tuple, Union
+from data.repository import DEFAULT_REPORT_COLUMNS, REPORT_COLUMNS, DatabaseRepository
+from utils.config import CUBE_GROWTH_FACTOR, QUERY_CHUNK_SIZE
+from utils.periods import to_years
+
+if TYPE_CHECKING:
+    from analysis.filters import FilterCriteria
+
+# Cube axes and the report columns that group along each of them
+AXIS_COLUMNS = {
+    0: ("indicator_id", "indicator_code", "indicator_name"),
+    1: ("country_code", "country_name"),
+    2: ("report_date",),
+}
+
+# An axis selection: a slice keeps NumPy views, an index array selects labels
+AxisSelection = Union[slice, np.ndarray]
+
+
+class CubeRepository:
+    """
+    Stores reports as a memory-mapped indicator × country × year cube.
+
+    Values live in values.npy (float64, NaN marks a missing report) and axis
+    labels in labels.json inside store_dir. It implements the same interface
+    as DatabaseRepository (connect, init_schema, save_reports,
+    upsert_reports, select_reports, iter_reports, aggregate_reports), so
+    it can be selected with STORAGE_BACKEND in utils/config.py. Raw SQL
+    (query_reports) is not part of it. Filters on whole axes and year
+    ranges are slices of the mapped array, so scans of one indicator read
+    only that indicator's country × year plane.
+
+    values.npy has spare capacity on each axis; values is the view of the
+    used part, so new labels usually only widen the view.
+    """
+
+    def __init__(self, store_dir: str) -> None:
+        """
+        Initialize CubeRepository with a storage directory.
+
+        Args:
+            store_dir: Directory holding values.npy and labels.json.
+        """
+        self.store_dir = store_dir
+        self.values: Optional[np.ndarray] = None
+        self._storage: Optional[np.ndarray] = None
+        self._year_offset = 0
+        self.indicators: List[dict] = []
+        self.countries: List[dict] = []
+        self.first_year = 0
+        self.data_version = 0
+        self.last_save_stats: Optional[dict] = None
+        self.last_aggregate_source: Optional[str] = None
+
+    @property
+    def values_path(self) -> str:
+        """Path of the memory-mapped value array."""
+        return os.path.join(self.store_dir, "values.npy")
+
+    @property
+    def labels_path(self) -> str:
+        """Path of the axis label file."""
+        return os.path.join(self.store_dir, "labels.json")
+
+    @property
+    def profiles_path(self) -> str:
+        """Path of the import profile log."""
+        return os.path.join(self.store_dir, "import_profiles.jsonl")
+
+    @property
+    def years(self) -> np.ndarray:
+        """Year label of each position on the year axis."""
+        return self.first_year + np.arange(self.values.shape[2])
+
+    def connect(self) -> None:
+        """Open the store, memory-mapping existing values."""
+        os.makedirs(self.store_dir, exist_ok=True)
+        if os.path.exists(self.labels_path):
+            self._load()
+        else:
+            self._storage = np.empty((0, 0, 0))
+            self._year_offset = 0
+            self.values = self._storage
+
+    def disconnect(self) -> None:
+        """Flush and release the memory map."""
+        if isinstance(self._storage, np.memmap):
+            self._storage.flush()
+        self.values = None
+        self._storage = None
+
+    def init_schema(self) -> None:
+        """Create an empty store if none exists yet."""
+        self._require_connection()
+        if not os.path.exists(self.labels_path):
+            self._save_labels()
+
+    def save_reports(self, df: pd.DataFrame, batch_size: int = 0) -> int:
+        """
+        Write reports into the cube.
+
+        Expected DataFrame columns match DatabaseRepository.save_reports().
+        Cells are addressed by (indicator, country, year); writing a cell
+        that already holds a value overwrites it.
+
+        Args:
+            df: DataFrame with normalized schema.
+            batch_size: Unused; kept for interface compatibility.
+
+        Returns:
+            Number of report rows written.
+        """
+        self._require_connection()
+        if df.empty:
+            return 0
+        start = time.perf_counter()
+        index = self._cell_index(df)
+        self.values[index] = df["value"].to_numpy(dtype="float64")
+        self._commit_write(len(df), start)
+        return len(df)
+
+    def upsert_reports(self, df: pd.DataFrame, batch_size: int = 0) -> dict:
+        """
+        Write reports, counting new, changed and unchanged cells.
+
+        Args:
+            df: DataFrame with normalized schema.
+            batch_size: Unused; kept for interface compatibility.
+
+        Returns:
+            Dictionary with keys: inserted, updated, unchanged
+        """
+        self._require_connection()
+        if df.empty:
+            return {"inserted": 0, "updated": 0, "unchanged": 0}
+        start = time.perf_counter()
+        df = df.drop_duplicates(subset=["country_code", "indicator_code", "report_date"], keep="last")
+        index = self._cell_index(df)
+        new = df["value"].to_numpy(dtype="float64")
+        old = self.values[index]
+
+        inserted = np.isnan(old) & ~np.isnan(new)
+        updated = ~np.isnan(old) & (old != new)
+        changed = inserted | updated
+        self.values[tuple(axis[changed] for axis in index)] = new[changed]
+
+        self._commit_write(len(df), start)
+        return {
+            "inserted": int(inserted.sum()),
+            "updated": int(updated.sum()),
+            "unchanged": int(len(df) - changed.sum())
+        }
+
+    def select_reports(
+        self,
+        criteria: Optional["FilterCriteria"] = None,
+        columns: Sequence[str] = DEFAULT_REPORT_COLUMNS,
+        float32: bool = False,
+        parse_dates: bool = False
+    ) -> pd.DataFrame:
+        """
+        Return reports matching criteria as a long-format DataFrame.
+
+        Args:
+            criteria: FilterCriteria instance (None selects all reports).
+            columns: Column names to return; see REPORT_COLUMNS.
+            float32: Return value as float32 instead of float64.
+            parse_dates: Convert report_date from integer years to datetime64.
+
+        Returns:
+            DataFrame with the requested columns.
+        """
+        self._check_columns(columns)
+        selection = self._select_axes(criteria)
+        block = self._block(selection)
+        return self._to_frame(block, selection, criteria, columns, float32, parse_dates)
+
+    def iter_reports(
+        self,
+        criteria: Optional["FilterCriteria"] = None,
+        columns: Sequence[str] = DEFAULT_REPORT_COLUMNS,
+        chunksize: int = QUERY_CHUNK_SIZE,
+        float32: bool = False,
+        parse_dates: bool = False
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream reports matching criteria, one indicator plane at a time.
+
+        Args:
+            criteria: FilterCriteria instance (None selects all reports).
+            columns: Column names to return; see REPORT_COLUMNS.
+            chunksize: Maximum number of rows per chunk.
+            float32: Return value as float32 instead of float64.
+            parse_dates: Convert report_date from integer years to datetime64.
+
+        Yields:
+            DataFrames with the requested columns.
+        """
+        self._check_columns(columns)
+        indicator_sel, country_sel, year_sel = self._select_axes(criteria)
+        for indicator in np.arange(self.values.shape[0])[indicator_sel]:
+            selection = (np.array([indicator]), country_sel, year_sel)
+            df = self._to_frame(self._block(selection), selection, criteria, columns,
+                                float32, parse_dates)
+            for offset in range(0, len(df), chunksize):
+                yield df.iloc[offset:offset + chunksize]
+
+    def select_block(
+        self,
+        criteria: Optional["FilterCriteria"] = None
+    ) -> Tuple[np.ndarray, List[str], List[str], np.ndarray]:
+        """
+        Return the dense sub-cube matching criteria with its axis labels.
+
+        Args:
+            criteria: FilterCriteria instance (None selects the whole cube).
+
+        Returns:
+            Tuple of (values, indicator codes, country codes, years); values
+            outside the criteria's value range are NaN.
+        """
+        selection = self._select_axes(criteria)
+        block = self._block(selection)
+        mask = self._value_mask(block, criteria)
+        if not mask.all():
+            block = np.where(mask, block, np.nan)
+        return (
+            block,
+            list(self._axis_labels(0, selection[0], "indicator_code")),
+            list(self._axis_labels(1, selection[1], "country_code")),
+            self.years[selection[2]]
+        )
+
+    def aggregate_reports(
+        self,
+        criteria: Optional["FilterCriteria"] = None,
+        group_cols: Sequence[str] = (),
+        parse_dates: bool = False,
+        use_rollups: bool = True
+    ) -> pd.DataFrame:
+        """
+        Aggregate values of reports matching criteria with axis reductions.
+
+        The cube is reduced one indicator plane at a time, so temporaries
+        are the size of a country × year plane, not of the selection.
+
+        Args:
+            criteria: FilterCriteria instance (None aggregates all reports).
+            group_cols: Columns to group by; each must map to a cube axis
+                (region is not stored in the cube).
+            parse_dates: Convert report_date from integer years to datetime64.
+            use_rollups: Unused; kept for interface compatibility.
+
+        Returns:
+            DataFrame with columns group_cols + [count, sum, mean, min, max, var],
+            sorted by the group columns.
+
+        Raises:
+            ValueError: If a column cannot be grouped by.
+        """
+        axis_of = {col: axis for axis, cols in AXIS_COLUMNS.items() for col in cols}
+        unsupported = [col for col in group_cols if col not in axis_of]
+        if unsupported:
+            raise ValueError(f"Cannot group cube by: {unsupported}")
+
+        selection = self._select_axes(criteria)
+        reduce_axes = tuple(axis for axis in range(3) if axis not in {axis_of[col] for col in group_cols})
+        count, total, sumsq, low, high = self._reduce_planes(selection, criteria, reduce_axes)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            stats = {
+                "count": count,
+                "sum": np.where(count > 0, total, np.nan),
+                "mean": total / count,
+                "min": np.where(count > 0, low, np.nan),
+                "max": np.where(count > 0, high, np.nan),
+                "var": np.where(count > 1, (sumsq - total ** 2 / count) / (count - 1), np.nan),
+            }
+        self.last_aggregate_source = "cube"
+
+        if not group_cols:
+            return pd.DataFrame({name: [np.asarray(value).item()] for name, value in stats.items()})
+
+        kept_axes = [axis for axis in range(3) if axis not in reduce_axes]
+        grids = np.meshgrid(*[np.arange(count.shape[i]) for i in range(len(kept_axes))], indexing="ij")
+        present = count > 0
+        data = {}
+        for col in group_cols:
+            position = kept_axes.index(axis_of[col])
+            labels = self._axis_labels(axis_of[col], selection[axis_of[col]], col)
+            data[col] = labels[grids[position][present]]
+        for name, value in stats.items():
+            data[name] = value[present]
+
+        result = pd.DataFrame(data).sort_values(list(group_cols), ignore_index=True)
+        return self._compact_dtypes(result, parse_dates=parse_dates)
+
+    def set_country_regions(self, regions: dict) -> None:
+        """
+        Assign regions to countries.
+
+        Args:
+            regions: Dictionary mapping country_code to region name.
+        """
+        self._require_connection()
+        for label in self.countries:
+            if label["code"] in regions:
+                label["region"] = regions[label["code"]]
+        self._save_labels()
+        self.data_version += 1
+
+    def save_import_profile(self, source: str, dataset: str, profile: dict) -> int:
+        """
+        Append the data-quality profile of an import to import_profiles.jsonl.
+
+        Args:
+            source: Path of the imported file.
+            dataset: Dataset type the file was imported as.
+            profile: Dictionary from QualityProfile.result().
+
+        Returns:
+            profile_id of the stored profile (its line number).
+        """
+        self._require_connection()
+        profile_id = len(self._read_import_profiles()) + 1
+        entry = {"profile_id": profile_id, "source": source, "dataset": dataset,
+                 "imported_at": datetime.datetime.now().isoformat(timespec="seconds"), "profile": profile}
+        with open(self.profiles_path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+        return profile_id
+
+    def load_import_profiles(self, source: Optional[str] = None) -> List[dict]:
+        """
+        Read stored import profiles, newest first.
+
+        Args:
+            source: Only return profiles of this file (None returns all).
+
+        Returns:
+            List of dictionaries with keys: profile_id, source, dataset,
+            imported_at, profile
+        """
+        self._require_connection()
+        entries = self._read_import_profiles()
+        return [entry for entry in reversed(entries) if source is None or entry["source"] == source]
+
+    @contextmanager
+    def profile(self, name: str) -> Iterator[None]:
+        """
+        Accept DatabaseRepository.profile() calls; the cube has no connection settings.
+
+        Args:
+            name: Profile name (ignored).
+        """
+        yield
+
+    def _read_import_profiles(self) -> List[dict]:
+        """Read every line of import_profiles.jsonl."""
+        if not os.path.exists(self.profiles_path):
+            return []
+        with open(self.profiles_path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _require_connection(self) -> None:
+        """Raise if connect() has not been called."""
+        if self.values is None:
+            raise RuntimeError("Store not connected. Call connect() first.")
+
+    def _load(self) -> None:
+        """Read labels and memory-map values from store_dir."""
+        with open(self.labels_path) as f:
+            labels = json.load(f)
+        self.indicators = labels["indicators"]
+        self.countries = labels["countries"]
+        self.first_year = labels["first_year"]
+        shape = (len(self.indicators), len(self.countries), labels["year_count"])
+        # Stores written before capacity was tracked are exactly their shape
+        capacity = tuple(labels.get("capacity", shape))
+        self._year_offset = labels.get("year_offset", 0)
+        if 0 in capacity:
+            self._storage = np.full(capacity, np.nan)
+        else:
+            self._storage = np.load(self.values_path, mmap_mode="r+")
+        self._set_view(shape)
+
+    def _set_view(self, shape: Tuple[int, int, int]) -> None:
+        """Point values at the used part of the storage array."""
+        self.values = self._storage[:shape[0], :shape[1], self._year_offset:self._year_offset + shape[2]]
+
+    def _save_labels(self) -> None:
+        """Write axis labels to labels.json."""
+        labels = {
+            "indicators": self.indicators,
+            "countries": self.countries,
+            "first_year": self.first_year,
+            "year_count": self.values.shape[2],
+            "capacity": list(self._storage.shape),
+            "year_offset": self._year_offset
+        }
+        temp_path = self.labels_path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(labels, f)
+        os.replace(temp_path, self.labels_path)
+
+    def _commit_write(self, row_count: int, start: float) -> None:
+        """Flush values and labels and record write statistics."""
+        if isinstance(self._storage, np.memmap):
+            self._storage.flush()
+        self._save_labels()
+        self.data_version += 1
+        elapsed = time.perf_counter() - start
+        self.last_save_stats = {
+            "rows": row_count,
+            "seconds": elapsed,
+            "rows_per_second": row_count / elapsed if elapsed > 0 else float(row_count),
+        }
+
+    def _cell_index(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Map report rows to cube cells, growing the cube for new labels.
+
+        Args:
+            df: DataFrame with normalized schema.
+
+        Returns:
+            Tuple of (indicator, country, year) index arrays.
+        """
+        self._require_connection()
+        indicator_pos = self._register_labels(self.indicators, df, "indicator_code", "indicator_name")
+        country_pos = self._register_labels(self.countries, df, "country_code", "country_name")
+        years = to_years(df["report_date"])
+
+        first_year = min(self.first_year, years.min()) if self.values.shape[2] else years.min()
+        last_year = max(self.first_year + self.values.shape[2] - 1, years.max()) \
+            if self.values.shape[2] else years.max()
+        shape = (len(self.indicators), len(self.countries), int(last_year - first_year + 1))
+        if shape != self.values.shape or first_year != self.first_year:
+            self._grow(shape, int(first_year))
+
+        return indicator_pos, country_pos, years - self.first_year
+
+    @staticmethod
+    def _register_labels(labels: List[dict], df: pd.DataFrame, code_col: str, name_col: str) -> np.ndarray:
+        """
+        Append unseen codes to an axis and return each row's axis position.
+
+        Args:
+            labels: Axis label list (modified in place).
+            df: DataFrame with code_col and name_col.
+            code_col: Column holding the code.
+            name_col: Column holding the display name.
+
+        Returns:
+            Array of axis positions, one per row of df.
+        """
+        positions = {label["code"]: i for i, label in enumerate(labels)}
+        unique = df[[code_col, name_col]].drop_duplicates(code_col)
+        for code, name in unique.itertuples(index=False, name=None):
+            if code not in positions:
+                positions[code] = len(labels)
+                labels.append({"code": str(code), "name": str(name)})
+        return df[code_col].astype(str).map(positions).to_numpy(dtype="int64")
+
+    def _grow(self, shape: Tuple[int, int, int], first_year: int) -> None:
+        """
+        Widen the used part of the cube, reallocating only when capacity runs out.
+
+        Args:
+            shape: New (indicators, countries, years) shape.
+            first_year: Year of the first position on the new year axis.
+        """
+        capacity = self._storage.shape
+        year_offset = self._year_offset - (self.first_year - first_year)
+        years_fit = self.values.shape[2] > 0 and year_offset >= 0 and year_offset + shape[2] <= capacity[2]
+        if years_fit and shape[0] <= capacity[0] and shape[1] <= capacity[1]:
+            self._year_offset = year_offset
+            self.first_year = first_year
+            self._set_view(shape)
+        else:
+            self._resize(shape, first_year, year_offset if years_fit else None)
+
+    def _resize(self, shape: Tuple[int, int, int], first_year: int, year_offset: Optional[int]) -> None:
+        """
+        Reallocate the value file with more capacity, keeping existing values.
+
+        Each axis that is too small grows to CUBE_GROWTH_FACTOR times its
+        capacity (at least the new shape), so repeated growth copies the
+        cube a logarithmic number of times.
+
+        Args:
+            shape: New (indicators, countries, years) shape.
+            first_year: Year of the first position on the new year axis.
+            year_offset: Position of first_year in the current storage if
+                the year axis fits, else None to grow it with spare room on
+                both sides.
+        """
+        old_capacity = self._storage.shape
+        capacity = [old_capacity[axis] if shape[axis] <= old_capacity[axis]
+                    else max(shape[axis], int(old_capacity[axis] * CUBE_GROWTH_FACTOR)) for axis in range(2)]
+        if year_offset is None:
+            capacity.append(max(shape[2], int(old_capacity[2] * CUBE_GROWTH_FACTOR)))
+            year_offset = (capacity[2] - shape[2]) // 2
+        else:
+            capacity.append(old_capacity[2])
+
+        temp_path = self.values_path + ".tmp"
+        resized = np.lib.format.open_memmap(temp_path, mode="w+", dtype="float64", shape=tuple(capacity))
+        resized[:] = np.nan
+        old = self.values
+        start = year_offset + (self.first_year - first_year if old.shape[2] else 0)
+        resized[:old.shape[0], :old.shape[1], start:start + old.shape[2]] = old
+        resized.flush()
+        del resized
+
+        if isinstance(self._storage, np.memmap):
+            self._storage.flush()
+        self.values = None
+        self._storage = None
+        del old
+        os.replace(temp_path, self.values_path)
+        self.first_year = first_year
+        self._year_offset = year_offset
+        self._storage = np.load(self.values_path, mmap_mode="r+")
+        self._set_view(shape)
+
+    def _select_axes(self, criteria: Optional["FilterCriteria"]) -> Tuple[AxisSelection, AxisSelection, slice]:
+        """
+        Translate criteria into a selection on each cube axis.
+
+        Args:
+            criteria: FilterCriteria instance or None.
+
+        Returns:
+            Tuple of (indicator, country, year) selections.
+        """
+        self._require_connection()
+        indicator_sel: AxisSelection = slice(None)
+        country_sel: AxisSelection = slice(None)
+        year_sel = slice(None)
+        if criteria is None:
+            return indicator_sel, country_sel, year_sel
+
+        if criteria.indicators:
+            wanted = set(criteria.indicators)
+            indicator_sel = np.array([i for i, label in enumerate(self.indicators) if label["code"] in wanted],
+                                     dtype="int64")
+        if criteria.countries:
+            wanted = set(criteria.countries)
+            country_sel = np.array([i for i, label in enumerate(self.countries) if label["code"] in wanted],
+                                   dtype="int64")
+
+        years = self.years
+        start = np.searchsorted(years, criteria.year_from) if criteria.date_from else 0
+        stop = np.searchsorted(years, criteria.year_to, side="right") if criteria.date_to else len(years)
+        year_sel = slice(int(start), int(stop))
+        return indicator_sel, country_sel, year_sel
+
+    def _reduce_planes(
+        self,
+        selection: Tuple[AxisSelection, AxisSelection, slice],
+        criteria: Optional["FilterCriteria"],
+        reduce_axes: Tuple[int, ...]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Reduce the selected cells plane by plane along the indicator axis.
+
+        Args:
+            selection: Axis selections from _select_axes().
+            criteria: FilterCriteria whose value range masks cells, or None.
+            reduce_axes: Cube axes to reduce.
+
+        Returns:
+            Tuple of (count, sum, sum of squares, min, max) arrays over the
+            kept axes; min is inf and max -inf where count is 0.
+        """
+        indicator_sel, country_sel, year_sel = selection
+        indicators = np.arange(self.values.shape[0])[indicator_sel]
+        plane_shape = (len(np.arange(self.values.shape[1])[country_sel]), len(self.years[year_sel]))
+        plane_axes = tuple(axis - 1 for axis in reduce_axes if axis > 0)
+        reduced_shape = tuple(size for axis, size in enumerate(plane_shape) if axis not in plane_axes)
+
+        # Either one row per indicator, or running totals over indicators
+        kept_shape = reduced_shape if 0 in reduce_axes else (len(indicators),) + reduced_shape
+        count = np.zeros(kept_shape, dtype="int64")
+        total = np.zeros(kept_shape)
+        sumsq = np.zeros(kept_shape)
+        low = np.full(kept_shape, np.inf)
+        high = np.full(kept_shape, -np.inf)
+        for position, indicator in enumerate(indicators):
+            # A slice keeps the plane a view of the memory map
+            plane = self.values[indicator][country_sel][:, year_sel]
+            mask = self._value_mask(plane, criteria)
+            present = np.where(mask, plane, 0.0)
+            target = Ellipsis if 0 in reduce_axes else position
+            count[target] += mask.sum(axis=plane_axes)
+            total[target] += present.sum(axis=plane_axes)
+            sumsq[target] += (present * present).sum(axis=plane_axes)
+            low[target] = np.minimum(low[target], np.where(mask, plane, np.inf).min(axis=plane_axes, initial=np.inf))
+            high[target] = np.maximum(high[target], np.where(mask, plane, -np.inf).max(axis=plane_axes, initial=-np.inf))
+        return count, total, sumsq, low, high
+
+    def _block(self, selection: Tuple[AxisSelection, AxisSelection, slice]) -> np.ndarray:
+        """Return the selected sub-cube (a view when every selection is a slice)."""
+        indicator_sel, country_sel, year_sel = selection
+        return self.values[indicator_sel][:, country_sel][:, :, year_sel]
+
+    @staticmethod
+    def _value_mask(block: np.ndarray, criteria: Optional["FilterCriteria"]) -> np.ndarray:
+        """Mask of present cells that satisfy the value range of criteria."""
+        mask = ~np.isnan(block)
+        if criteria is not None and criteria.value_min is not None:
+            mask &= block >= criteria.value_min
+        if criteria is not None and criteria.value_max is not None:
+            mask &= block <= criteria.value_max
+        return mask
+
+    def _axis_labels(self, axis: int, selection: AxisSelection, column: str) -> np.ndarray:
+        """
+        Label of each selected position on an axis for a report column.
+
+        Args:
+            axis: Cube axis (0 indicators, 1 countries, 2 years).
+            selection: Selection applied to the axis.
+            column: Report column the labels are for.
+
+        Returns:
+            Array of labels for the selected positions.
+        """
+        if axis == 2:
+            return self.years[selection]
+        if column == "indicator_id":
+            return np.arange(1, len(self.indicators) + 1)[selection]
+
+        labels = self.indicators if axis == 0 else self.countries
+        key = "name" if column.endswith("_name") else "code"
+        return np.array([label[key] for label in labels], dtype=object)[selection]
+
+    def _to_frame(
+        self,
+        block: np.ndarray,
+        selection: Tuple[AxisSelection, AxisSelection, slice],
+        criteria: Optional["FilterCriteria"],
+        columns: Sequence[str],
+        float32: bool,
+        parse_dates: bool
+    ) -> pd.DataFrame:
+        """Convert the present cells of a sub-cube to a long-format DataFrame."""
+        positions = np.nonzero(self._value_mask(block, criteria))
+        axis_of = {col: axis for axis, cols in AXIS_COLUMNS.items() for col in cols}
+
+        data = {}
+        for col in columns:
+            if col == "value":
+                data[col] = block[positions]
+            elif col == "region":
+                regions = np.array([label.get("region") for label in self.countries], dtype=object)
+                data[col] = regions[selection[1]][positions[1]]
+            else:
+                axis = axis_of[col]
+                data[col] = self._axis_labels(axis, selection[axis], col)[positions[axis]]
+        return self._compact_dtypes(pd.DataFrame(data, columns=list(columns)), float32, parse_dates)
+
+    @staticmethod
+    def _check_columns(columns: Sequence[str]) -> None:
+        """Raise ValueError for columns not in REPORT_COLUMNS."""
+        unknown = [col for col in columns if col not in REPORT_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown report columns: {unknown}")
+
+    @staticmethod
+    def _compact_dtypes(df: pd.DataFrame, float32: bool = False, parse_dates: bool = False) -> pd.DataFrame:
+        """Apply the same result dtypes as DatabaseRepository."""
+        return DatabaseRepository._compact_dtypes(df, float32=float32, parse_dates=parse_dates)
@@ -0,0 +1,153 @@
+"""Persistent on-disk cache of normalized datasets."""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Iterator, Tuple
+import numpy as np
+import pandas as pd
+from data.cleaner import NORMALIZE_VERSION
+from utils.config import DATASET_CACHE_DIR
+
+# Bytes read at a time when hashing source files
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class DatasetCache:
+    """
+    Stores normalized long-format chunks keyed by the source file's content hash.
+
+    Each entry is a directory of parts; every part stores one column per
+    .npy file (text columns as int32 category codes plus a category array),
+    so cached imports skip CSV parsing and reshaping entirely. Entries are
+    written to a temporary directory and renamed into place when complete.
+    """
+
+    def __init__(self, cache_dir: str = DATASET_CACHE_DIR) -> None:
+        """
+        Initialize DatasetCache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created on first write).
+        """
+        self.cache_dir = cache_dir
+
+    def key_for(self, file_path: str, dataset: str, dropna: bool = False) -> str:
+        """
+        Compute the cache key of a source file.
+
+        Args:
+            file_path: Path to the source file.
+            dataset: Dataset type the file is normalized as.
+            dropna: Whether rows without a value were left out.
+
+        Returns:
+            Hex digest of the file content, dataset type, dropna and NORMALIZE_VERSION.
+        """
+        digest = hashlib.sha256(f"{dataset}:{NORMALIZE_VERSION}:{int(dropna)}:".encode())
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def has(self, key: str) -> bool:
+        """
+        Check whether a complete entry exists.
+
+        Args:
+            key: Cache key from key_for().
+
+        Returns:
+            True if the entry can be read.
+        """
+        return os.path.exists(os.path.join(self.cache_dir, key, "entry.json"))
+
+    def iter_parts(self, key: str) -> Iterator[Tuple[int, pd.DataFrame]]:
+        """
+        Read a cached entry part by part.
+
+        Args:
+            key: Cache key from key_for().
+
+        Yields:
+            Tuples of (source rows the part came from, normalized DataFrame).
+        """
+        entry_dir = os.path.join(self.cache_dir, key)
+        with open(os.path.join(entry_dir, "entry.json")) as f:
+            entry = json.load(f)
+
+        for part in entry["parts"]:
+            yield part["rows_read"], self._read_part(os.path.join(entry_dir, part["name"]))
+
+    def write_through(self, key: str, chunks: Iterator[Tuple[int, pd.DataFrame]]) -> Iterator[Tuple[int, pd.DataFrame]]:
+        """
+        Pass chunks through while storing them as a new entry.
+
+        The entry only becomes visible once every chunk has been consumed;
+        if iteration stops early the partial entry is discarded.
+
+        Args:
+            key: Cache key from key_for().
+            chunks: Iterator of (source rows, normalized DataFrame) tuples.
+
+        Yields:
+            The same tuples, unchanged.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_dir = tempfile.mkdtemp(prefix=f".{key}.", dir=self.cache_dir)
+        parts = []
+        try:
+            for rows_read, df in chunks:
+                name = f"part-{len(parts):05d}"
+                self._write_part(os.path.join(temp_dir, name), df)
+                parts.append({"name": name, "rows_read": rows_read})
+                yield rows_read, df
+
+            with open(os.path.join(temp_dir, "entry.json"), "w") as f:
+                json.dump({"parts": parts}, f)
+            target = os.path.join(self.cache_dir, key)
+            if os.path.exists(target):
+                shutil.rmtree(target)
+            os.replace(temp_dir, target)
+        finally:
+            if os.path.exists(temp_dir):
+                shutil.rmtree(temp_dir)
+
+    @staticmethod
+    def _write_part(part_dir: str, df: pd.DataFrame) -> None:
+        """Write one DataFrame as a directory of .npy column files."""
+        os.makedirs(part_dir)
+        columns = []
+        for col in df.columns:
+            series = df[col]
+            if pd.api.types.is_numeric_dtype(series) and not isinstance(series.dtype, pd.CategoricalDtype):
+                np.save(os.path.join(part_dir, f"{col}.npy"), series.to_numpy())
+                columns.append({"name": col, "kind": "numeric"})
+            else:
+                categorical = series.astype("category")
+                np.save(os.path.join(part_dir, f"{col}.codes.npy"),
+                        categorical.cat.codes.to_numpy(dtype="int32"))
+                np.save(os.path.join(part_dir, f"{col}.categories.npy"),
+                        categorical.cat.categories.to_numpy(dtype=str))
+                columns.append({"name": col, "kind": "category"})
+
+        with open(os.path.join(part_dir, "columns.json"), "w") as f:
+            json.dump(columns, f)
+
+    @staticmethod
+    def _read_part(part_dir: str) -> pd.DataFrame:
+        """Read a directory of .npy column files back into a DataFrame."""
+        with open(os.path.join(part_dir, "columns.json")) as f:
+            columns = json.load(f)
+
+        data = {}
+        for column in columns:
+            name = column["name"]
+            if column["kind"] == "numeric":
+                data[name] = np.load(os.path.join(part_dir, f"{name}.npy"), mmap_mode="r")
+            else:
+                codes = np.load(os.path.join(part_dir, f"{name}.codes.npy"), mmap_mode="r")
+                categories = np.load(os.path.join(part_dir, f"{name}.categories.npy"))
+                data[name] = pd.Categorical.from_codes(codes, categories=categories)
+        return pd.DataFrame(data)
@@ -0,0 +1,229 @@
+"""Offline migration and compaction of the health data database."""
+import argparse
+import os
+import sqlite3
+import time
+from typing import Callable, Dict, Tuple
+from analysis.filters import FilterCriteria
+from data.repository import CLUSTERED_REPORT_INDEXES, DatabaseRepository
+from utils.config import DEFAULT_DB_PATH
+
+# Compacted reports table: no surrogate key, rows clustered so that one
+# indicator's values for all countries and years are stored together
+COMPACT_REPORTS_SQL = """
+    CREATE TABLE reports_compact (
+        country_code TEXT NOT NULL,
+        indicator_id INTEGER NOT NULL,
+        report_date INTEGER NOT NULL,
+        value REAL,
+        PRIMARY KEY (indicator_id, country_code, report_date),
+        FOREIGN KEY (country_code) REFERENCES countries(country_code),
+        FOREIGN KEY (indicator_id) REFERENCES indicators(indicator_id)
+    ) WITHOUT ROWID;
+"""
+
+# Timing runs per benchmark query (the fastest run is reported)
+BENCHMARK_REPEATS = 5
+
+
+def benchmark_queries(db_path: str, repeats: int = BENCHMARK_REPEATS) -> Dict[str, float]:
+    """
+    Time representative read queries against a database.
+
+    The query cache is disabled so every run reads from SQLite.
+
+    Args:
+        db_path: Path to the SQLite database.
+        repeats: Number of runs per query.
+
+    Returns:
+        Dictionary mapping query name to its fastest time in seconds.
+    """
+    repo = DatabaseRepository(db_path, cache_max_bytes=0)
+    repo.connect()
+    try:
+        indicator = repo.conn.execute("SELECT MIN(indicator_code) FROM indicators;").fetchone()[0]
+        country = repo.conn.execute("SELECT MIN(country_code) FROM countries;").fetchone()[0]
+        queries: Dict[str, Callable[[], object]] = {
+            "indicator_scan": lambda: repo.select_reports(FilterCriteria(indicator=indicator)),
+            "country_filter": lambda: repo.select_reports(FilterCriteria(country=country)),
+            "trend_raw": lambda: repo.aggregate_reports(group_cols=("report_date",), use_rollups=False),
+        }
+
+        timings = {}
+        for name, query in queries.items():
+            runs = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                query()
+                runs.append(time.perf_counter() - start)
+            timings[name] = min(runs)
+        return timings
+    finally:
+        repo.disconnect()
+
+
+def _rebuild_reports(conn: sqlite3.Connection) -> int:
+    """
+    Replace reports with the clustered WITHOUT ROWID table.
+
+    Args:
+        conn: Connection to the working copy, with an up-to-date schema.
+
+    Returns:
+        Number of rows in the rebuilt table.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("BEGIN TRANSACTION;")
+        cursor.execute(COMPACT_REPORTS_SQL)
+        cursor.execute("""
+            INSERT INTO reports_compact (country_code, indicator_id, report_date, value)
+            SELECT country_code, indicator_id, report_date, value
+            FROM reports
+            ORDER BY indicator_id, country_code, report_date;
+        """)
+        cursor.execute("DROP TABLE reports;")
+        cursor.execute("ALTER TABLE reports_compact RENAME TO reports;")
+        for index_name, columns in CLUSTERED_REPORT_INDEXES.items():
+            cursor.execute(f"CREATE INDEX {index_name} ON reports({', '.join(columns)});")
+        cursor.execute("COMMIT;")
+    except Exception:
+        cursor.execute("ROLLBACK;")
+        raise
+
+    return cursor.execute("SELECT COUNT(*) FROM reports;").fetchone()[0]
+
+
+def _checkpoint(db_path: str) -> None:
+    """
+    Fold the write-ahead log of db_path into the file and remove its -wal/-shm.
+
+    Args:
+        db_path: Path to the SQLite database.
+
+    Raises:
+        RuntimeError: If the log cannot be emptied because another connection
+            is reading from or writing to the database.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        busy = conn.execute("PRAGMA wal_checkpoint(TRUNCATE);").fetchone()[0]
+    finally:
+        conn.close()
+
+    wal_path = db_path + "-wal"
+    if busy or (os.path.exists(wal_path) and os.path.getsize(wal_path) > 0):
+        raise RuntimeError(f"Could not checkpoint {db_path}: the database is in use.")
+    _remove_database(db_path, suffixes=("-wal", "-shm"))
+
+
+def _remove_database(db_path: str, suffixes: Tuple[str, ...] = ("", "-wal", "-shm")) -> None:
+    """Remove db_path and its -wal/-shm files, skipping those that do not exist."""
+    for suffix in suffixes:
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+
+
+def compact_database(db_path: str, swap: bool = True) -> dict:
+    """
+    Deduplicate and compact a database offline, then swap it in atomically.
+
+    The database is copied with SQLite's backup API and all work happens on
+    the copy: the schema is brought up to date (integer years, duplicate
+    reports removed), reports is rebuilt as a WITHOUT ROWID table clustered
+    on (indicator_id, country_code, report_date), CLUSTERED_REPORT_INDEXES
+    are recreated and ANALYZE and VACUUM are run. The copy then replaces
+    db_path with os.replace(). Nothing else should write to db_path meanwhile.
+
+    Both databases are checkpointed with wal_checkpoint(TRUNCATE) and their
+    -wal/-shm files removed before the swap, so that a log written against
+    the old file is never replayed onto the compacted one.
+
+    Args:
+        db_path: Path to the SQLite database.
+        swap: Replace db_path with the compacted copy. If False the copy is
+            left at db_path + ".compact" for inspection.
+
+    Returns:
+        Dictionary with keys: rows_before, rows_after, duplicates_removed,
+        size_before, size_after (bytes), queries_before, queries_after
+        (seconds per benchmark query), seconds, path
+
+    Raises:
+        FileNotFoundError: If db_path does not exist.
+        RuntimeError: If a write-ahead log cannot be checkpointed because
+            the database is in use.
+    """
+    if not os.path.exists(db_path):
+        raise FileNotFoundError(f"Database not found: {db_path}")
+
+    start = time.perf_counter()
+    work_path = db_path + ".compact"
+    _remove_database(work_path)
+    _checkpoint(db_path)
+    source = sqlite3.connect(db_path)
+    rows_before = source.execute("SELECT COUNT(*) FROM reports;").fetchone()[0]
+    work = sqlite3.connect(work_path)
+    source.backup(work)
+    source.close()
+    work.close()
+
+    try:
+        queries_before = benchmark_queries(work_path)
+
+        # Migrates text dates and removes duplicate reports
+        repo = DatabaseRepository(work_path, cache_max_bytes=0)
+        repo.connect()
+        repo.init_schema()
+        repo.disconnect()
+
+        work = sqlite3.connect(work_path)
+        rows_after = _rebuild_reports(work)
+        work.execute("ANALYZE;")
+        work.execute("VACUUM;")
+        work.close()
+
+        queries_after = benchmark_queries(work_path)
+        _checkpoint(work_path)
+        stats = {
+            "rows_before": rows_before,
+            "rows_after": rows_after,
+            "duplicates_removed": rows_before - rows_after,
+            "size_before": os.path.getsize(db_path),
+            "size_after": os.path.getsize(work_path),
+            "queries_before": queries_before,
+            "queries_after": queries_after,
+        }
+    except Exception:
+        _remove_database(work_path)
+        raise
+
+    if swap:
+        _checkpoint(db_path)
+        os.replace(work_path, db_path)
+    stats["path"] = db_path if swap else work_path
+    stats["seconds"] = time.perf_counter() - start
+    return stats
+
+
+def main() -> None:
+    """Run compaction from the command line and print a before/after report."""
+    parser = argparse.ArgumentParser(description="Deduplicate and compact the health data database.")
+    parser.add_argument("db_path", nargs="?", default=DEFAULT_DB_PATH, help="SQLite database to compact")
+    parser.add_argument("--no-swap", action="store_true",
+                        help="leave the compacted copy next to the database instead of replacing it")
+    args = parser.parse_args()
+
+    stats = compact_database(args.db_path, swap=not args.no_swap)
+    print(f"Compacted {stats['path']} in {stats['seconds']:.2f}s")
+    print(f"  Rows:  {stats['rows_before']} -> {stats['rows_after']} "
+          f"({stats['duplicates_removed']} duplicates removed)")
+    print(f"  Size:  {stats['size_before']:,} -> {stats['size_after']:,} bytes")
+    for name, before in stats["queries_before"].items():
+        after = stats["queries_after"][name]
+        print(f"  {name}: {before * 1000:.1f} ms -> {after * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""Streaming import pipeline from CSV files into the repository."""
+import glob
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Iterator, List, Optional, Tuple
+import pandas as pd
+from data.adapters import get_adapter
+from data.csv_source import CSVDataSource
+from data.cleaner import DataCleaner
+from data.dataset_cache import DatasetCache
+from data.quality import QualityProfile
+from data.repository import DatabaseRepository
+from utils.config import IMPORT_CHUNK_SIZE, IMPORT_WORKERS
+
+
+def resolve_import_paths(pattern: str) -> List[str]:
+    """
+    Expand a file path, directory or glob pattern into CSV file paths.
+
+    Args:
+        pattern: A CSV file, a directory (all *.csv files inside) or a glob
+            such as "data/raw/API_*_DS2_en_csv_v2_*.csv".
+
+    Returns:
+        Sorted list of matching file paths.
+    """
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, "*.csv")
+    return sorted(path for path in glob.glob(pattern) if os.path.isfile(path))
+
+
+def iter_normalized_chunks(
+    csv_path: str,
+    dataset: str,
+    cleaner: DataCleaner,
+    chunksize: int,
+    dataset_cache: Optional[DatasetCache] = None,
+    dropna: bool = False
+) -> Iterator[Tuple[int, pd.DataFrame]]:
+    """
+    Read a CSV file as normalized long-format chunks.
+
+    With a dataset_cache, chunks are read from a matching cache entry when
+    the file content is unchanged, and written to the cache otherwise.
+    If the cleaner has a QualityProfile, cached chunks are profiled too.
+
+    Args:
+        csv_path: Path to the CSV file.
+        dataset: Dataset type passed to DataCleaner.normalize_schema().
+        cleaner: DataCleaner instance.
+        chunksize: Number of wide CSV rows per chunk (scaled by the
+            adapter's chunk_scale for long-format sources).
+        dataset_cache: Optional DatasetCache.
+        dropna: Leave out rows without a value while reshaping.
+
+    Yields:
+        Tuples of (CSV rows read, normalized DataFrame).
+    """
+    source = CSVDataSource(csv_path, dataset=dataset)
+    if not source.validate():
+        raise ValueError(f"Cannot load CSV file: {csv_path}")
+
+    # A profiled import caches its rows without values too, so the profile
+    # of a cache hit still counts them; they are dropped afterwards
+    keep_missing = dropna and cleaner.profile is not None and dataset_cache is not None
+    normalize_dropna = dropna and not keep_missing
+
+    if dataset_cache is not None:
+        key = dataset_cache.key_for(csv_path, dataset, dropna=normalize_dropna)
+        if dataset_cache.has(key):
+            for rows_read, df_normalized in dataset_cache.iter_parts(key):
+                if cleaner.profile is not None:
+                    cleaner.profile.update(df_normalized)
+                yield rows_read, _drop_missing(df_normalized) if keep_missing else df_normalized
+            return
+
+    chunks = (
+        (len(chunk), cleaner.normalize_schema(chunk, dataset=dataset, dropna=normalize_dropna))
+        for chunk in source.iter_chunks(chunksize * source.adapter.chunk_scale)
+    )
+    if dataset_cache is not None:
+        chunks = dataset_cache.write_through(key, chunks)
+    for rows_read, df_normalized in chunks:
+        yield rows_read, _drop_missing(df_normalized) if keep_missing else df_normalized
+
+
+def _drop_missing(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the rows of a normalized frame that have a value."""
+    return df[df["value"].notna()].reset_index(drop=True)
+
+
+def _count_chunks(chunks: Iterator[Tuple[int, pd.DataFrame]], stats: dict) -> Iterator[pd.DataFrame]:
+    """
+    Pass normalized chunks through, adding to the chunks, rows_read and rows_normalized stats.
+
+    Args:
+        chunks: Iterator from iter_normalized_chunks().
+        stats: Dictionary whose counters are updated in place.
+
+    Yields:
+        The normalized DataFrames.
+    """
+    for rows_read, df_normalized in chunks:
+        stats["chunks"] += 1
+        stats["rows_read"] += rows_read
+        stats["rows_normalized"] += len(df_normalized)
+        yield df_normalized
+
+
+def _parse_file(
+    csv_path: str,
+    dataset: str,
+    strategy: str,
+    cache_dir: Optional[str] = None,
+    profile_imports: bool = True
+) -> Tuple[str, pd.DataFrame, dict]:
+    """
+    Load, normalize and clean one CSV file (runs in a worker process).
+
+    Args:
+        csv_path: Path to the CSV file.
+        dataset: Dataset type passed to DataCleaner.normalize_schema().
+        strategy: Missing-value strategy passed to DataCleaner.iter_handle_missing().
+        cache_dir: Directory of a DatasetCache to use, or None.
+        profile_imports: Collect a QualityProfile, returned as stats["quality"].
+
+    Returns:
+        Tuple of (csv_path, cleaned DataFrame, stats dictionary).
+    """
+    start = time.perf_counter()
+    cleaner = DataCleaner(QualityProfile() if profile_imports else None)
+    dataset_cache = DatasetCache(cache_dir) if cache_dir else None
+    stats = {"chunks": 0, "rows_read": 0, "rows_normalized": 0}
+    chunks = iter_normalized_chunks(csv_path, dataset, cleaner, IMPORT_CHUNK_SIZE, dataset_cache,
+                                    dropna=(strategy == "drop"))
+    parts = list(cleaner.iter_handle_missing(_count_chunks(chunks, stats), strategy=strategy,
+                                             whole_series=get_adapter(dataset).whole_series))
+
+    df_clean = pd.concat(parts, ignore_index=True)
+    stats["rows_clean"] = len(df_clean)
+    if cleaner.profile is not None:
+        stats["quality"] = cleaner.profile.result()
+    stats["parse_seconds"] = time.perf_counter() - start
+    return csv_path, df_clean, stats
+
+
+class ImportPipeline:
+    """Streams a CSV file through cleaning into the database chunk by chunk."""
+
+    def __init__(
+        self,
+        repo: DatabaseRepository,
+        cleaner: DataCleaner,
+        chunksize: int = IMPORT_CHUNK_SIZE,
+        dataset_cache: Optional[DatasetCache] = None,
+        profile_imports: bool = True
+    ) -> None:
+        """
+        Initialize ImportPipeline with its dependencies.
+
+        Args:
+            repo: Connected DatabaseRepository instance.
+            cleaner: DataCleaner instance.
+            chunksize: Number of CSV rows read, cleaned and committed at a time.
+            dataset_cache: Optional DatasetCache reused when a file is unchanged.
+            profile_imports: Collect a QualityProfile while importing and store
+                it with repo.save_import_profile().
+        """
+        self.repo = repo
+        self.cleaner = cleaner
+        self.chunksize = chunksize
+        self.dataset_cache = dataset_cache
+        self.profile_imports = profile_imports
+
+    def run(self, csv_path: str, dataset: str = "world_bank", strategy: str = "drop") -> dict:
+        """
+        Import a CSV file without loading it into memory as a whole.
+
+        Each chunk is normalized, cleaned and upserted before the next one
+        is read, so peak memory depends on chunksize rather than file size.
+        The data-quality profile is collected in the same pass and stored
+        with the imported reports.
+
+        Args:
+            csv_path: Path to the CSV file.
+            dataset: Dataset type passed to DataCleaner.normalize_schema().
+            strategy: Missing-value strategy passed to DataCleaner.iter_handle_missing().
+
+        Returns:
+            Dictionary with keys: chunks, rows_read, rows_normalized, rows_clean,
+            inserted, updated, unchanged, seconds, rows_per_second, and with
+            profile_imports also quality (QualityProfile.result()) and profile_id
+
+        Raises:
+            ValueError: If the CSV file cannot be validated.
+        """
+        start = time.perf_counter()
+        stats = {
+            "chunks": 0,
+            "rows_read": 0,
+            "rows_normalized": 0,
+            "rows_clean": 0,
+            "inserted": 0,
+            "updated": 0,
+            "unchanged": 0
+        }
+
+        quality = QualityProfile() if self.profile_imports else None
+        previous_profile, self.cleaner.profile = self.cleaner.profile, quality
+        try:
+            # Missing values that would be dropped are masked out during the reshape
+            chunks = iter_normalized_chunks(csv_path, dataset, self.cleaner, self.chunksize,
+                                            self.dataset_cache, dropna=(strategy == "drop"))
+            # Imputing strategies carry series ends from one chunk to the next,
+            # unless the source's chunks hold whole series
+            cleaned = self.cleaner.iter_handle_missing(_count_chunks(chunks, stats), strategy=strategy,
+                                                       whole_series=get_adapter(dataset).whole_series)
+            # One bulk-load profile for all chunks instead of switching PRAGMAs per chunk
+            with self.repo.profile("bulk_load"):
+                for df_clean in cleaned:
+                    counts = self.repo.upsert_reports(df_clean)
+                    stats["rows_clean"] += len(df_clean)
+                    for key, count in counts.items():
+                        stats[key] += count
+
+                if quality is not None:
+                    stats["quality"] = quality.result()
+                    stats["profile_id"] = self.repo.save_import_profile(csv_path, dataset, stats["quality"])
+        finally:
+            self.cleaner.profile = previous_profile
+
+        elapsed = time.perf_counter() - start
+        stats["seconds"] = elapsed
+        stats["rows_per_second"] = stats["rows_clean"] / elapsed if elapsed > 0 else 0.0
+        return stats
+
+    def run_many(
+        self,
+        csv_paths: List[str],
+        dataset: str = "world_bank",
+        strategy: str = "drop",
+        workers: Optional[int] = IMPORT_WORKERS,
+        progress: Optional[Callable[[dict], None]] = None
+    ) -> dict:
+        """
+        Import several CSV files, parsing them in parallel worker processes.
+
+        Files are loaded, normalized and cleaned across a process pool while
+        the calling process is the only writer to the repository, so SQLite
+        never sees concurrent writes. At most two files per worker are in
+        flight at once to bound memory.
+
+        Args:
+            csv_paths: Paths of the CSV files to import.
+            dataset: Dataset type passed to DataCleaner.normalize_schema().
+            strategy: Missing-value strategy passed to DataCleaner.iter_handle_missing().
+            workers: Number of worker processes (None uses all cores).
+            progress: Optional callback receiving each file's stats as it is written.
+
+        Returns:
+            Dictionary with keys: files (list of per-file stats, including
+            quality and profile_id as in run()), rows_clean, inserted,
+            updated, unchanged, seconds
+        """
+        start = time.perf_counter()
+        workers = workers or os.cpu_count() or 1
+        cache_dir = self.dataset_cache.cache_dir if self.dataset_cache else None
+        totals = {"files": [], "rows_clean": 0, "inserted": 0, "updated": 0, "unchanged": 0}
+        pending_paths = list(csv_paths)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor, self.repo.profile("bulk_load"):
+            in_flight = set()
+            while pending_paths or in_flight:
+                while pending_paths and len(in_flight) < workers * 2:
+                    in_flight.add(executor.submit(_parse_file, pending_paths.pop(0), dataset,
+                                                  strategy, cache_dir, self.profile_imports))
+
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    csv_path, df_clean, file_stats = future.result()
+
+                    write_start = time.perf_counter()
+                    counts = self.repo.upsert_reports(df_clean)
+                    file_stats.update(counts)
+                    if "quality" in file_stats:
+                        file_stats["profile_id"] = self.repo.save_import_profile(
+                            csv_path, dataset, file_stats["quality"])
+                    file_stats["path"] = csv_path
+                    file_stats["write_seconds"] = time.perf_counter() - write_start
+                    file_stats["index"] = len(totals["files"]) + 1
+                    file_stats["total"] = len(csv_paths)
+
+                    totals["files"].append(file_stats)
+                    totals["rows_clean"] += file_stats["rows_clean"]
+                    for key, count in counts.items():
+                        totals[key] += count
+                    if progress:
+                        progress(file_stats)
+
+        totals["seconds"] = time.perf_counter() - start
+        return totals
@@ -0,0 +1,71 @@
+"""Pool of read-only SQLite connections shared across threads."""
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List
+
+
+class ReadConnectionPool:
+    """
+    Fixed-size pool of SQLite connections for concurrent reads.
+
+    Connections are opened lazily with check_same_thread=False, so any
+    thread may use one while it holds it. With the database in WAL mode each
+    reader sees the last committed state and neither blocks nor is blocked
+    by the writer connection.
+    """
+
+    def __init__(self, db_path: str, size: int, pragmas: dict) -> None:
+        """
+        Initialize ReadConnectionPool.
+
+        Args:
+            db_path: Path to the SQLite database file.
+            size: Maximum number of open connections.
+            pragmas: PRAGMA settings applied to every new connection.
+        """
+        self.db_path = db_path
+        self.size = size
+        self.pragmas = pragmas
+        self._idle: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._all: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a connection, waiting for one if all size connections are in use.
+
+        Yields:
+            sqlite3.Connection that is returned to the pool afterwards.
+        """
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self) -> None:
+        """Close every connection opened by the pool."""
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
+            self._idle = queue.Queue()
+
+    def _acquire(self) -> sqlite3.Connection:
+        """Return an idle connection, opening a new one while below size."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._all) < self.size:
+                conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                for pragma, value in self.pragmas.items():
+                    conn.execute(f"PRAGMA {pragma} = {value};")
+                self._all.append(conn)
+                return conn
+        return self._idle.get()
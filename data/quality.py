@@ -0,0 +1,214 @@
+"""Data-quality profiles collected while normalized chunks stream through an import."""
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Tuple
+from utils.config import QUALITY_RANGE_RULES
+
+# Columns that identify one report; a repeated key is a duplicate
+REPORT_KEY = ["country_code", "indicator_code", "report_date"]
+
+
+class _KeySet:
+    """
+    Set of 64-bit key hashes kept as a few sorted, disjoint runs.
+
+    Runs are merged when a new run is at least half the size of the one
+    before it, so membership tests touch O(log n) runs and each hash is
+    re-sorted O(log n) times overall.
+    """
+
+    def __init__(self) -> None:
+        self.runs: List[np.ndarray] = []
+
+    def add(self, hashes: np.ndarray) -> int:
+        """
+        Add hashes and return how many of them were already present.
+
+        Args:
+            hashes: uint64 hashes, possibly repeated.
+
+        Returns:
+            Number of hashes seen before (earlier in hashes or in the set).
+        """
+        if len(hashes) == 0:
+            return 0
+        # Sorting and comparing neighbours is faster than np.unique's hashing
+        hashes = np.sort(hashes)
+        unique = hashes[np.r_[True, hashes[1:] != hashes[:-1]]]
+        repeated = len(hashes) - len(unique)
+        seen = np.zeros(len(unique), dtype=bool)
+        for run in self.runs:
+            position = np.minimum(np.searchsorted(run, unique), len(run) - 1)
+            seen |= run[position] == unique
+        new = unique[~seen]
+        if len(new):
+            self.runs.append(new)
+        while len(self.runs) > 1 and 2 * len(self.runs[-1]) >= len(self.runs[-2]):
+            last = self.runs.pop()
+            self.runs[-1] = np.sort(np.concatenate([self.runs[-1], last]))
+        return repeated + int(seen.sum())
+
+
+class QualityProfile:
+    """
+    Data-quality profile of normalized reports, updated chunk by chunk.
+
+    Each chunk is reduced with bincounts over its category codes and
+    folded into running totals, so the profile is a by-product of the pass that normalizes an
+    import and needs no second read. Chunks must still contain their rows
+    without a value so null ratios can be counted.
+
+    Duplicate keys are tracked with 8 bytes per distinct
+    (country_code, indicator_code, report_date) key.
+    """
+
+    def __init__(self, range_rules: Optional[dict] = None) -> None:
+        """
+        Initialize an empty profile.
+
+        Args:
+            range_rules: Indicator code to (min, max) plausible range, either
+                bound may be None (default: QUALITY_RANGE_RULES).
+        """
+        self.range_rules = QUALITY_RANGE_RULES if range_rules is None else range_rules
+        self.rows = 0
+        self.column_nulls: dict = {}
+        self.duplicate_keys = 0
+        self.by_year: Optional[pd.DataFrame] = None
+        self.by_country: Optional[pd.DataFrame] = None
+        self.by_indicator: Optional[pd.DataFrame] = None
+        self._keys = _KeySet()
+
+    def update(self, df: pd.DataFrame) -> None:
+        """
+        Fold a normalized chunk into the profile.
+
+        Args:
+            df: DataFrame with the normalized report columns.
+        """
+        if df.empty:
+            return
+        self.rows += len(df)
+        for col, nulls in df.isna().sum().items():
+            self.column_nulls[col] = self.column_nulls.get(col, 0) + int(nulls)
+
+        hashes = pd.util.hash_pandas_object(df[REPORT_KEY], index=False).to_numpy()
+        self.duplicate_keys += self._keys.add(hashes)
+
+        value = df["value"].to_numpy(dtype=float)
+        has_value = ~np.isnan(value)
+        self.by_year = self._add(self.by_year, _count(*_codes(df["report_date"]), sum=has_value))
+        self.by_country = self._add(self.by_country, _count(*_codes(df["country_code"]), sum=has_value))
+
+        codes, labels = _codes(df["indicator_code"])
+        low, high = self._rule_bounds(codes, labels)
+        violations = has_value & ((value < low) | (value > high))
+        per_indicator = _count(codes, labels, values=has_value, range_violations=violations)
+        per_indicator = per_indicator.rename(columns={"size": "rows"})
+        # groupby yields the occurring codes in ascending order, like _count()
+        valid = codes >= 0
+        bounds = pd.Series(value[valid]).groupby(codes[valid]).agg(["min", "max"])
+        per_indicator["min"] = bounds["min"].to_numpy()
+        per_indicator["max"] = bounds["max"].to_numpy()
+        per_indicator = per_indicator[["rows", "values", "min", "max", "range_violations"]]
+        if self.by_indicator is None:
+            self.by_indicator = per_indicator
+        else:
+            left, right = self.by_indicator.align(per_indicator, join="outer")
+            counts = ["rows", "values", "range_violations"]
+            merged = left[counts].fillna(0) + right[counts].fillna(0)
+            merged["min"] = np.fmin(left["min"], right["min"])
+            merged["max"] = np.fmax(left["max"], right["max"])
+            self.by_indicator = merged[per_indicator.columns]
+
+    def result(self) -> dict:
+        """
+        Return the profile as a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with keys:
+            - rows, values: rows seen and rows with a value
+            - null_ratio: per column
+            - null_ratio_by_year: per report year (as a string, like the
+              keys of the persisted JSON)
+            - country_completeness: share of rows with a value per country
+            - indicators: per indicator code rows, values, min, max and
+              range_violations
+            - duplicate_keys: rows whose (country, indicator, year) key
+              appeared before
+            - range_violations: total values outside QUALITY_RANGE_RULES
+        """
+        if self.rows == 0:
+            return {"rows": 0, "values": 0, "null_ratio": {}, "null_ratio_by_year": {},
+                    "country_completeness": {}, "indicators": {}, "duplicate_keys": 0,
+                    "range_violations": 0}
+
+        by_year = self.by_year.sort_index()
+        by_country = self.by_country.sort_index()
+        by_indicator = self.by_indicator.sort_index()
+        indicators = {
+            str(code): {
+                "rows": int(row["rows"]),
+                "values": int(row["values"]),
+                "min": None if pd.isna(row["min"]) else float(row["min"]),
+                "max": None if pd.isna(row["max"]) else float(row["max"]),
+                "range_violations": int(row["range_violations"]),
+            }
+            for code, row in by_indicator.iterrows()
+        }
+        return {
+            "rows": self.rows,
+            "values": int(by_year["sum"].sum()),
+            "null_ratio": {col: nulls / self.rows for col, nulls in self.column_nulls.items()},
+            "null_ratio_by_year": {str(year): 1.0 - row["sum"] / row["size"] for year, row in by_year.iterrows()},
+            "country_completeness": {str(code): row["sum"] / row["size"] for code, row in by_country.iterrows()},
+            "indicators": indicators,
+            "duplicate_keys": self.duplicate_keys,
+            "range_violations": int(by_indicator["range_violations"].sum()),
+        }
+
+    def _rule_bounds(self, codes: np.ndarray, labels: pd.Index) -> Tuple[np.ndarray, np.ndarray]:
+        """Return per-row lower and upper bounds from range_rules (infinite if unset)."""
+        # Look rules up once per indicator, then spread them with the codes
+        rules = [self.range_rules.get(label, (None, None)) for label in labels]
+        # A trailing entry for code -1 (missing indicator code)
+        low = np.array([-np.inf if rule[0] is None else rule[0] for rule in rules] + [-np.inf])
+        high = np.array([np.inf if rule[1] is None else rule[1] for rule in rules] + [np.inf])
+        return low[codes], high[codes]
+
+    @staticmethod
+    def _add(total: Optional[pd.DataFrame], partial: pd.DataFrame) -> pd.DataFrame:
+        """Add partial counts to running counts aligned on the group index."""
+        return partial if total is None else total.add(partial, fill_value=0)
+
+
+def _codes(key: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """Return an integer code per row (-1 if missing) and the label of each code."""
+    if isinstance(key.dtype, pd.CategoricalDtype):
+        return key.cat.codes.to_numpy(), key.cat.categories
+    if pd.api.types.is_integer_dtype(key.dtype):
+        # Years: offsets from the smallest one, no hashing needed
+        values = key.to_numpy()
+        low = int(values.min())
+        return values - low, pd.RangeIndex(low, int(values.max()) + 1)
+    codes, labels = pd.factorize(key)
+    return codes, pd.Index(labels)
+
+
+def _count(codes: np.ndarray, labels: pd.Index, **weights: np.ndarray) -> pd.DataFrame:
+    """
+    Count rows per code, and sum each boolean weight array per code.
+
+    Returns:
+        DataFrame indexed by the labels that occur, with a size column and
+        one column per weight.
+    """
+    valid = codes >= 0
+    if not valid.all():
+        codes = codes[valid]
+        weights = {name: weight[valid] for name, weight in weights.items()}
+    size = np.bincount(codes, minlength=len(labels))
+    counts = {name: np.bincount(codes, weights=weight, minlength=len(labels)).astype("int64")
+              for name, weight in weights.items()}
+    frame = pd.DataFrame({"size": size, **counts}, index=labels)
+    return frame[size > 0]
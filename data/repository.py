@@ -1,35 +1,233 @@
 """Database repository for storing and querying health data."""
+import datetime
+import functools
+import json
 import sqlite3
+import threading
+import time
 import pandas as pd
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator, List, Optional, Sequence, Tuple
+from data.cache import QueryCache
+from data.pool import ReadConnectionPool
+from utils.config import (BULK_INSERT_BATCH_SIZE, CONNECTION_PROFILES, QUERY_CACHE_MAX_BYTES,
+                          QUERY_CHUNK_SIZE, READ_POOL_SIZE)
+from utils.periods import to_years, years_to_dates
+
+if TYPE_CHECKING:
+    from analysis.filters import FilterCriteria
+
+
+# Columns select_reports() can return: SQL expression and table it needs
+REPORT_COLUMNS = {
+    "country_code": ("r.country_code", None),
+    "indicator_id": ("r.indicator_id", None),
+    "report_date": ("r.report_date", None),
+    "value": ("r.value", None),
+    "indicator_code": ("i.indicator_code", "indicators"),
+    "indicator_name": ("i.indicator_name", "indicators"),
+    "country_name": ("c.country_name", "countries"),
+    "region": ("c.region", "countries"),
+}
+
+# Aggregates computed by aggregate_reports()
+AGGREGATE_COLUMNS = {
+    "count": "COUNT(r.value)",
+    "sum": "SUM(r.value)",
+    "mean": "AVG(r.value)",
+    "min": "MIN(r.value)",
+    "max": "MAX(r.value)",
+    "var": "CASE WHEN COUNT(r.value) > 1 THEN "
+           "(SUM(r.value * r.value) - SUM(r.value) * SUM(r.value) / COUNT(r.value)) "
+           "/ (COUNT(r.value) - 1) END",
+}
+
+DEFAULT_REPORT_COLUMNS = ("country_code", "indicator_code", "report_date", "value")
+
+# Label columns returned as pandas categoricals
+CATEGORICAL_COLUMNS = ("country_code", "indicator_code", "indicator_name", "country_name", "region")
+
+# Pre-aggregated rollups of reports.value, maintained by save_reports() and
+# upsert_reports(). "keys" are the rollup's key columns, "source" the matching
+# expressions over reports r (joined to countries c where needed), "filters"
+# the FilterCriteria fields it can apply and "groups" the columns it can group by.
+ROLLUPS = {
+    "rollup_indicator_year": {
+        "keys": ("indicator_id", "report_date"),
+        "source": ("r.indicator_id", "r.report_date"),
+        "filters": {"indicator", "date"},
+        "groups": {"indicator_id", "indicator_code", "indicator_name", "report_date"},
+    },
+    "rollup_country_indicator": {
+        "keys": ("country_code", "indicator_id"),
+        "source": ("r.country_code", "r.indicator_id"),
+        "filters": {"country", "indicator"},
+        "groups": {"country_code", "country_name", "region", "indicator_id", "indicator_code",
+                   "indicator_name"},
+    },
+    # Countries without a region are stored under region ''
+    "rollup_region_indicator_year": {
+        "keys": ("region", "indicator_id", "report_date"),
+        "source": ("COALESCE(c.region, '')", "r.indicator_id", "r.report_date"),
+        "filters": {"indicator", "date"},
+        "groups": {"region", "indicator_id", "indicator_code", "indicator_name", "report_date"},
+    },
+}
+
+# Aggregates computed from rollup tables (aliased r like reports)
+ROLLUP_AGGREGATE_COLUMNS = {
+    "count": "COALESCE(SUM(r.value_count), 0)",
+    "sum": "SUM(r.value_sum)",
+    "mean": "SUM(r.value_sum) / SUM(r.value_count)",
+    "min": "MIN(r.value_min)",
+    "max": "MAX(r.value_max)",
+    "var": "CASE WHEN SUM(r.value_count) > 1 THEN "
+           "(SUM(r.value_sumsq) - SUM(r.value_sum) * SUM(r.value_sum) / SUM(r.value_count)) "
+           "/ (SUM(r.value_count) - 1) END",
+}
+
+# Secondary indexes matched to the filter shapes FilterCriteria produces
+REPORT_INDEXES = {
+    "idx_reports_country_date": ("country_code", "report_date"),
+    "idx_reports_date": ("report_date",),
+    "idx_reports_indicator_date": ("indicator_id", "report_date"),
+}
+
+# Indexes of a reports table clustered on (indicator_id, country_code,
+# report_date) by data/maintenance.py: the primary key serves indicator
+# filters and whole-table scans, so only country and date-only filters
+# need a secondary index
+CLUSTERED_REPORT_INDEXES = {
+    "idx_reports_country_date": REPORT_INDEXES["idx_reports_country_date"],
+    "idx_reports_date": REPORT_INDEXES["idx_reports_date"],
+}
+
+
+def _serialized(method):
+    """Run a DatabaseRepository method while holding the writer lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._write_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class DatabaseRepository:
-    """Handles SQLite database operations."""
+    """
+    Handles SQLite database operations.
 
-    def __init__(self, db_path: str) -> None:
+    Safe to share between threads: writes go through a single writer
+    connection guarded by a lock, and queries borrow connections from a
+    pool of WAL-mode readers so independent queries run in parallel.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        cache_max_bytes: int = QUERY_CACHE_MAX_BYTES,
+        read_pool_size: int = READ_POOL_SIZE
+    ) -> None:
         """
         Initialize DatabaseRepository with database path.
 
         Args:
             db_path: Path to SQLite database file.
+            cache_max_bytes: Memory budget of the query result cache (0 disables it).
+            read_pool_size: Number of pooled read connections (0 reads through
+                the writer connection; in-memory databases always do).
         """
         self.db_path = db_path
         self.conn: Optional[sqlite3.Connection] = None
+        self.read_pool_size = read_pool_size
+        self.read_pool: Optional[ReadConnectionPool] = None
+        self._write_lock = threading.RLock()
+        self.cache = QueryCache(cache_max_bytes)
+        # Bumped by every write so cached query results are invalidated
+        self.data_version = 0
+        self.last_save_stats: Optional[dict] = None
+        self.last_aggregate_source: Optional[str] = None
+        self.active_profile: Optional[str] = None
 
     def connect(self) -> None:
-        """Establish connection to the database."""
-        self.conn = sqlite3.connect(self.db_path)
-        # Enable foreign key support
-        self.conn.execute("PRAGMA foreign_keys = ON;")
+        """Establish the writer connection (default profile) and the read pool."""
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._apply_profile("default")
+
+        if self.read_pool_size and self.db_path != ":memory:":
+            # journal_mode is a database setting, already applied by the writer
+            pragmas = {**CONNECTION_PROFILES["default"], **CONNECTION_PROFILES["read"]}
+            pragmas.pop("journal_mode", None)
+            self.read_pool = ReadConnectionPool(self.db_path, self.read_pool_size, pragmas)
+
+    @contextmanager
+    def profile(self, name: str) -> Iterator[None]:
+        """
+        Apply a connection profile from CONNECTION_PROFILES for a block.
+
+        The writer lock is held for the whole block, so other threads' writes
+        wait. The connection returns to the default profile afterwards. Profiles
+        do not nest: inside a non-default profile, inner profile() calls
+        keep the outer one, so e.g. queries made during an import do not
+        switch the connection to query_only.
+
+        Args:
+            name: Profile name (e.g., "bulk_load" or "read").
+
+        Raises:
+            ValueError: If name is not a known profile.
+        """
+        if not self.conn:
+            raise RuntimeError("Database not connected. Call connect() first.")
+        if name not in CONNECTION_PROFILES:
+            raise ValueError(f"Unknown connection profile: {name}")
+
+        with self._write_lock:
+            if self.active_profile != "default":
+                yield
+                return
+
+            self._apply_profile(name)
+            try:
+                yield
+            finally:
+                self._apply_profile("default")
+
+    @contextmanager
+    def _read_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a pooled read connection, or the writer without a pool.
+
+        Yields:
+            sqlite3.Connection to run queries on.
+        """
+        if self.read_pool is not None:
+            with self.read_pool.connection() as conn:
+                yield conn
+        else:
+            with self._write_lock:
+                yield self.conn
+
+    def _apply_profile(self, name: str) -> None:
+        """Set the PRAGMAs of a profile on top of the default profile."""
+        # PRAGMA foreign_keys has no effect inside an open transaction
         self.conn.commit()
+        pragmas = {**CONNECTION_PROFILES["default"], **CONNECTION_PROFILES[name]}
+        for pragma, value in pragmas.items():
+            self.conn.execute(f"PRAGMA {pragma} = {value};")
+        self.active_profile = name
 
     def disconnect(self) -> None:
-        """Close database connection."""
+        """Close the writer connection and the read pool."""
+        if self.read_pool is not None:
+            self.read_pool.close()
+            self.read_pool = None
         if self.conn:
             self.conn.close()
             self.conn = None
+            self.active_profile = None
 
+    @_serialized
     def init_schema(self) -> None:
         """
         Create database schema (tables and indexes).
@@ -38,6 +236,8 @@ class DatabaseRepository:
         - countries: Country reference data
         - indicators: Indicator reference data
         - reports: Health report data with foreign keys
+        plus the rollup tables and import_profiles (data-quality profile
+        of each import, stored as JSON).
         """
         if not self.conn:
             raise RuntimeError("Database not connected. Call connect() first.")
@@ -69,88 +269,626 @@ class DatabaseRepository:
                 report_id INTEGER PRIMARY KEY AUTOINCREMENT,
                 country_code TEXT NOT NULL,
                 indicator_id INTEGER NOT NULL,
-                report_date TEXT NOT NULL,
+                report_date INTEGER NOT NULL,
                 value REAL,
                 FOREIGN KEY (country_code) REFERENCES countries(country_code),
                 FOREIGN KEY (indicator_id) REFERENCES indicators(indicator_id)
             );
         """)
 
-        # Create index for filtering
+        # Create import profiles table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS import_profiles (
+                profile_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source TEXT NOT NULL,
+                dataset TEXT NOT NULL,
+                imported_at TEXT NOT NULL,
+                row_count INTEGER NOT NULL,
+                profile TEXT NOT NULL
+            );
+        """)
+
+        # Older databases store report_date as ISO text
+        cursor.execute("SELECT type FROM pragma_table_info('reports') WHERE name = 'report_date';")
+        if cursor.fetchone()[0].upper() == "TEXT":
+            self._migrate_text_dates()
+            cursor = self.conn.cursor()
+
+        # One row per (country, indicator, date); older databases may hold
+        # duplicates from repeated imports, which are removed first. Tables
+        # compacted by data/maintenance.py are keyed on it by their primary key.
+        cursor.execute("DROP INDEX IF EXISTS idx_reports_filters;")
+        cursor.execute("SELECT 1 FROM pragma_table_info('reports') WHERE name = 'report_id';")
+        clustered = cursor.fetchone() is None
+        cursor.execute("""
+            SELECT 1 FROM sqlite_master
+            WHERE type = 'index' AND name = 'idx_reports_key';
+        """)
+        if cursor.fetchone() is None and not clustered:
+            cursor.execute("""
+                DELETE FROM reports
+                WHERE report_id NOT IN (
+                    SELECT MAX(report_id) FROM reports
+                    GROUP BY country_code, indicator_id, report_date
+                );
+            """)
+            cursor.execute("""
+                CREATE UNIQUE INDEX idx_reports_key
+                ON reports(country_code, indicator_id, report_date);
+            """)
+
+        # Create indexes for filtering
+        indexes = CLUSTERED_REPORT_INDEXES if clustered else REPORT_INDEXES
+        for index_name, columns in indexes.items():
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS {index_name}
+                ON reports({", ".join(columns)});
+            """)
+
+        # Create rollup tables; existing data is aggregated once
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_reports_filters
-            ON reports(country_code, indicator_id, report_date);
+            SELECT COUNT(*) FROM sqlite_master
+            WHERE type = 'table' AND name LIKE 'rollup_%';
         """)
+        has_rollups = cursor.fetchone()[0] == len(ROLLUPS)
+        for table, rollup in ROLLUPS.items():
+            key_columns = ", ".join(f"{key} {'TEXT' if key in ('country_code', 'region') else 'INTEGER'} NOT NULL"
+                                    for key in rollup["keys"])
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    {key_columns},
+                    value_count INTEGER NOT NULL,
+                    value_sum REAL NOT NULL,
+                    value_min REAL,
+                    value_max REAL,
+                    value_sumsq REAL NOT NULL,
+                    PRIMARY KEY ({", ".join(rollup["keys"])})
+                );
+            """)
 
         self.conn.commit()
+        self.data_version += 1
+
+        if not has_rollups:
+            self.rebuild_rollups()
 
-    def save_reports(self, df: pd.DataFrame) -> int:
+    def _migrate_text_dates(self) -> None:
+        """
+        Convert reports.report_date from ISO text to integer years.
+
+        The reports table is rebuilt with an INTEGER column (dropping its
+        indexes, which init_schema() recreates), and the rollup tables,
+        which are keyed on the old text dates, are dropped to be rebuilt.
+        Foreign keys are not enforced while rows are copied, as in SQLite's
+        documented table rebuild procedure. The rebuild runs in one
+        transaction, and a reports_migrated table left over by an
+        interrupted run of an earlier version is dropped first.
+
+        Raises:
+            ValueError: If a report date is not an annual date ("YYYY" or
+                "YYYY-01-01"); such databases are left unchanged.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT DISTINCT report_date FROM reports
+            WHERE NOT (report_date GLOB '[0-9][0-9][0-9][0-9]'
+                       OR report_date GLOB '[0-9][0-9][0-9][0-9]-01-01')
+            LIMIT 5;
+        """)
+        non_annual = [row[0] for row in cursor.fetchall()]
+        if non_annual:
+            raise ValueError(
+                "Cannot migrate report dates to years, found non-annual dates: "
+                + ", ".join(repr(value) for value in non_annual)
+            )
+
+        self.conn.commit()
+        self.conn.execute("PRAGMA foreign_keys = OFF;")
+        try:
+            cursor.execute("BEGIN;")
+            self._rebuild_reports_with_years(cursor)
+            cursor.execute("COMMIT;")
+        except Exception:
+            cursor.execute("ROLLBACK;")
+            raise
+        finally:
+            self.conn.execute("PRAGMA foreign_keys = ON;")
+
+    @staticmethod
+    def _rebuild_reports_with_years(cursor: sqlite3.Cursor) -> None:
+        """Copy reports into an INTEGER-dated table and swap it in (inside a transaction)."""
+        cursor.execute("DROP TABLE IF EXISTS reports_migrated;")
+        cursor.execute("""
+            CREATE TABLE reports_migrated (
+                report_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                country_code TEXT NOT NULL,
+                indicator_id INTEGER NOT NULL,
+                report_date INTEGER NOT NULL,
+                value REAL,
+                FOREIGN KEY (country_code) REFERENCES countries(country_code),
+                FOREIGN KEY (indicator_id) REFERENCES indicators(indicator_id)
+            );
+        """)
+        cursor.execute("""
+            INSERT INTO reports_migrated (report_id, country_code, indicator_id, report_date, value)
+            SELECT report_id, country_code, indicator_id,
+                   CAST(substr(report_date, 1, 4) AS INTEGER), value
+            FROM reports;
+        """)
+        cursor.execute("DROP TABLE reports;")
+        cursor.execute("ALTER TABLE reports_migrated RENAME TO reports;")
+        for table in ROLLUPS:
+            cursor.execute(f"DROP TABLE IF EXISTS {table};")
+
+    def save_reports(self, df: pd.DataFrame, batch_size: int = BULK_INSERT_BATCH_SIZE) -> int:
         """
         Save reports DataFrame to database.
 
         Expected DataFrame columns:
         - country_code, country_name, indicator_code, indicator_name, report_date, value
 
+        Country and indicator keys are resolved once in memory, and report
+        rows are written with executemany() in batches of batch_size.
+
         Args:
             df: DataFrame with normalized schema.
+            batch_size: Number of report rows per executemany() call.
 
         Returns:
             Number of report rows inserted.
+
+        Raises:
+            sqlite3.IntegrityError: If a (country, indicator, date) key already exists
+                or a row violates a foreign key; no rows are written.
+                Use upsert_reports() for repeated imports.
         """
         if not self.conn:
             raise RuntimeError("Database not connected. Call connect() first.")
 
-        cursor = self.conn.cursor()
+        with self.profile("bulk_load"):
+            df = df.assign(report_date=to_years(df["report_date"]))
+            cursor = self.conn.cursor()
+            start = time.perf_counter()
 
-        try:
-            cursor.execute("BEGIN TRANSACTION;")
+            try:
+                cursor.execute("BEGIN TRANSACTION;")
+                # Foreign keys are checked at COMMIT, which fails and rolls back on a violation
+                cursor.execute("PRAGMA defer_foreign_keys = ON;")
 
-            # 1. Insert unique countries
-            countries = df[["country_code", "country_name"]].drop_duplicates()
-            for _, row in countries.iterrows():
-                cursor.execute("""
-                    INSERT OR IGNORE INTO countries (country_code, country_name, region)
-                    VALUES (?, ?, NULL);
-                """, (row["country_code"], row["country_name"]))
+                indicator_ids = self._insert_reference_data(cursor, df)
+                report_count = self._insert_report_rows(cursor, "reports", df, indicator_ids, batch_size)
+                self._add_rollup_deltas(cursor, df, indicator_ids)
 
-            # 2. Insert unique indicators
-            indicators = df[["indicator_code", "indicator_name"]].drop_duplicates()
-            for _, row in indicators.iterrows():
-                cursor.execute("""
-                    INSERT OR IGNORE INTO indicators (indicator_code, indicator_name, category)
-                    VALUES (?, ?, NULL);
-                """, (row["indicator_code"], row["indicator_name"]))
-
-            # 3. Insert reports
-            report_count = 0
-            for _, row in df.iterrows():
-                # Lookup indicator_id
+                cursor.execute("COMMIT;")
+
+            except Exception:
+                cursor.execute("ROLLBACK;")
+                raise
+            finally:
+                self.data_version += 1
+
+            self._record_save_stats(report_count, start)
+            return report_count
+
+    def upsert_reports(self, df: pd.DataFrame, batch_size: int = BULK_INSERT_BATCH_SIZE) -> dict:
+        """
+        Incrementally import reports keyed on (country_code, indicator_id, report_date).
+
+        New keys are inserted, existing keys whose value differs are updated,
+        and identical rows are left untouched, so re-importing the same file
+        is idempotent. Duplicate keys within df keep the last occurrence.
+
+        Args:
+            df: DataFrame with normalized schema (see save_reports()).
+            batch_size: Number of rows per executemany() call.
+
+        Returns:
+            Dictionary with keys: inserted, updated, unchanged
+        """
+        if not self.conn:
+            raise RuntimeError("Database not connected. Call connect() first.")
+
+        with self.profile("bulk_load"):
+            df = df.assign(report_date=to_years(df["report_date"]))
+            df = df.drop_duplicates(subset=["country_code", "indicator_code", "report_date"], keep="last")
+            cursor = self.conn.cursor()
+            start = time.perf_counter()
+
+            try:
+                cursor.execute("BEGIN TRANSACTION;")
+                # Foreign keys are checked at COMMIT, which fails and rolls back on a violation
+                cursor.execute("PRAGMA defer_foreign_keys = ON;")
+
+                indicator_ids = self._insert_reference_data(cursor, df)
+
+                # Stage incoming rows so the comparison runs inside SQLite
                 cursor.execute("""
-                    SELECT indicator_id FROM indicators WHERE indicator_code = ?;
-                """, (row["indicator_code"],))
-                indicator_id = cursor.fetchone()[0]
+                    CREATE TEMP TABLE IF NOT EXISTS staging_reports (
+                        country_code TEXT NOT NULL,
+                        indicator_id INTEGER NOT NULL,
+                        report_date INTEGER NOT NULL,
+                        value REAL
+                    );
+                """)
+                cursor.execute("DELETE FROM staging_reports;")
+                self._insert_report_rows(cursor, "staging_reports", df, indicator_ids, batch_size)
 
-                # Convert report_date to string if needed
-                report_date = str(row["report_date"])
+                # Keys that are new or whose value changed, with the old value
+                cursor.execute("DROP TABLE IF EXISTS temp.touched_reports;")
+                cursor.execute("""
+                    CREATE TEMP TABLE touched_reports AS
+                    SELECT s.country_code, s.indicator_id, s.report_date,
+                           s.value, r.value AS old_value,
+                           r.indicator_id IS NULL AS is_new
+                    FROM staging_reports s
+                    LEFT JOIN reports r
+                        ON r.country_code = s.country_code
+                        AND r.indicator_id = s.indicator_id
+                        AND r.report_date = s.report_date
+                    WHERE r.indicator_id IS NULL OR r.value IS NOT s.value;
+                """)
+                cursor.execute("SELECT COALESCE(SUM(is_new), 0), COUNT(*) FROM touched_reports;")
+                inserted, touched = cursor.fetchone()
+                updated = touched - inserted
 
-                # Insert report
+                # Only new keys and changed values are written
                 cursor.execute("""
                     INSERT INTO reports (country_code, indicator_id, report_date, value)
-                    VALUES (?, ?, ?, ?);
-                """, (row["country_code"], indicator_id, report_date, row["value"]))
-                report_count += 1
+                    SELECT country_code, indicator_id, report_date, value
+                    FROM staging_reports WHERE true
+                    ON CONFLICT (country_code, indicator_id, report_date)
+                    DO UPDATE SET value = excluded.value
+                    WHERE reports.value IS NOT excluded.value;
+                """)
 
-            cursor.execute("COMMIT;")
-            return report_count
+                self._apply_rollup_changes(cursor, "touched_reports")
+
+                cursor.execute("DELETE FROM staging_reports;")
+                cursor.execute("DROP TABLE touched_reports;")
+                cursor.execute("COMMIT;")
+
+            except Exception:
+                cursor.execute("ROLLBACK;")
+                raise
+            finally:
+                self.data_version += 1
+
+            self._record_save_stats(len(df), start)
+            return {
+                "inserted": int(inserted),
+                "updated": int(updated),
+                "unchanged": len(df) - int(inserted) - int(updated)
+            }
+
+    def _insert_reference_data(self, cursor: sqlite3.Cursor, df: pd.DataFrame) -> dict:
+        """
+        Insert unique countries and indicators and resolve their keys.
+
+        Args:
+            cursor: Cursor inside an open transaction.
+            df: DataFrame with normalized schema.
+
+        Returns:
+            Dictionary mapping indicator_code to indicator_id.
+        """
+        # 1. Insert unique countries
+        countries = df[["country_code", "country_name"]].drop_duplicates("country_code")
+        cursor.executemany("""
+            INSERT OR IGNORE INTO countries (country_code, country_name, region)
+            VALUES (?, ?, NULL);
+        """, countries.itertuples(index=False, name=None))
+
+        # 2. Insert unique indicators
+        indicators = df[["indicator_code", "indicator_name"]].drop_duplicates("indicator_code")
+        cursor.executemany("""
+            INSERT OR IGNORE INTO indicators (indicator_code, indicator_name, category)
+            VALUES (?, ?, NULL);
+        """, indicators.itertuples(index=False, name=None))
 
-        except Exception as e:
+        # 3. Resolve indicator_id for every code with a single lookup
+        return self._indicator_id_map(indicators["indicator_code"])
+
+    def _insert_report_rows(
+        self,
+        cursor: sqlite3.Cursor,
+        table: str,
+        df: pd.DataFrame,
+        indicator_ids: dict,
+        batch_size: int
+    ) -> int:
+        """
+        Insert report rows into table with batched executemany() calls.
+
+        Args:
+            cursor: Cursor inside an open transaction.
+            table: Target table ("reports" or a staging table).
+            df: DataFrame with normalized schema.
+            indicator_ids: Mapping from indicator_code to indicator_id.
+            batch_size: Number of rows per executemany() call.
+
+        Returns:
+            Number of rows inserted.
+        """
+        country_codes = df["country_code"].astype(str).tolist()
+        ids = df["indicator_code"].astype(str).map(indicator_ids).tolist()
+        report_dates = df["report_date"].astype("int64").tolist()
+        # NaN is stored as NULL by SQLite
+        values = df["value"].astype(float).tolist()
+
+        report_count = 0
+        for offset in range(0, len(values), batch_size):
+            stop = offset + batch_size
+            batch = zip(country_codes[offset:stop], ids[offset:stop],
+                        report_dates[offset:stop], values[offset:stop])
+            cursor.executemany(f"""
+                INSERT INTO {table} (country_code, indicator_id, report_date, value)
+                VALUES (?, ?, ?, ?);
+            """, batch)
+            report_count += min(batch_size, len(values) - offset)
+
+        return report_count
+
+    def _record_save_stats(self, row_count: int, start: float) -> None:
+        """Store timing statistics for the last write in last_save_stats."""
+        elapsed = time.perf_counter() - start
+        self.last_save_stats = {
+            "rows": row_count,
+            "seconds": elapsed,
+            "rows_per_second": row_count / elapsed if elapsed > 0 else float(row_count),
+        }
+
+    @_serialized
+    def rebuild_rollups(self) -> None:
+        """
+        Recompute all rollup tables from reports.
+
+        Needed after changes that bypass save_reports()/upsert_reports(),
+        such as assigning country regions directly.
+        """
+        if not self.conn:
+            raise RuntimeError("Database not connected. Call connect() first.")
+
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute("BEGIN TRANSACTION;")
+            for table in ROLLUPS:
+                cursor.execute(f"DELETE FROM {table};")
+            self._refresh_rollups(cursor)
+            cursor.execute("COMMIT;")
+        except Exception:
             cursor.execute("ROLLBACK;")
             raise
+        finally:
+            self.data_version += 1
+
+    @_serialized
+    def set_country_regions(self, regions: dict) -> None:
+        """
+        Assign regions to countries and rebuild the rollups that depend on them.
+
+        Args:
+            regions: Dictionary mapping country_code to region name.
+        """
+        if not self.conn:
+            raise RuntimeError("Database not connected. Call connect() first.")
+
+        self.conn.executemany(
+            "UPDATE countries SET region = ? WHERE country_code = ?;",
+            [(region, code) for code, region in regions.items()]
+        )
+        self.conn.commit()
+        self.rebuild_rollups()
+
+    @_serialized
+    def save_import_profile(self, source: str, dataset: str, profile: dict) -> int:
+        """
+        Store the data-quality profile of an import.
+
+        Args:
+            source: Path of the imported file.
+            dataset: Dataset type the file was imported as.
+            profile: Dictionary from QualityProfile.result().
+
+        Returns:
+            profile_id of the stored profile.
+        """
+        if not self.conn:
+            raise RuntimeError("Database not connected. Call connect() first.")
+
+        cursor = self.conn.execute(
+            "INSERT INTO import_profiles (source, dataset, imported_at, row_count, profile) "
+            "VALUES (?, ?, ?, ?, ?);",
+            (source, dataset, datetime.datetime.now().isoformat(timespec="seconds"),
+             profile["rows"], json.dumps(profile))
+        )
+        self.conn.commit()
+        return cursor.lastrowid
+
+    def load_import_profiles(self, source: Optional[str] = None) -> List[dict]:
+        """
+        Read stored import profiles, newest first.
+
+        Args:
+            source: Only return profiles of this file (None returns all).
+
+        Returns:
+            List of dictionaries with keys: profile_id, source, dataset,
+            imported_at, profile
+        """
+        if not self.conn:
+            raise RuntimeError("Database not connected. Call connect() first.")
+
+        sql = "SELECT profile_id, source, dataset, imported_at, profile FROM import_profiles"
+        params: tuple = ()
+        if source is not None:
+            sql += " WHERE source = ?"
+            params = (source,)
+        with self._read_connection() as conn:
+            rows = conn.execute(sql + " ORDER BY profile_id DESC;", params).fetchall()
+        return [
+            {"profile_id": profile_id, "source": source, "dataset": dataset,
+             "imported_at": imported_at, "profile": json.loads(profile)}
+            for profile_id, source, dataset, imported_at, profile in rows
+        ]
+
+    def _add_rollup_deltas(self, cursor: sqlite3.Cursor, df: pd.DataFrame, indicator_ids: dict) -> None:
+        """
+        Add aggregates of newly inserted rows to every rollup table.
+
+        Args:
+            cursor: Cursor inside an open transaction.
+            df: DataFrame of inserted rows with normalized schema.
+            indicator_ids: Mapping from indicator_code to indicator_id.
+        """
+        frame = pd.DataFrame({
+            "country_code": df["country_code"].astype(str),
+            "indicator_id": df["indicator_code"].astype(str).map(indicator_ids),
+            "report_date": df["report_date"].astype("int64"),
+            "value": df["value"].astype(float)
+        }).dropna(subset=["value"])
+        if frame.empty:
+            return
+
+        codes = frame["country_code"].unique().tolist()
+        cursor.execute(f"""
+            SELECT country_code, region FROM countries
+            WHERE region IS NOT NULL AND country_code IN ({", ".join("?" for _ in codes)});
+        """, codes)
+        frame["region"] = frame["country_code"].map(dict(cursor.fetchall())).fillna("")
+        frame["value_sq"] = frame["value"] ** 2
+
+        for table, rollup in ROLLUPS.items():
+            keys = list(rollup["keys"])
+            delta = frame.groupby(keys).agg(
+                value_count=("value", "count"),
+                value_sum=("value", "sum"),
+                value_min=("value", "min"),
+                value_max=("value", "max"),
+                value_sumsq=("value_sq", "sum")
+            ).reset_index()
+            delta["indicator_id"] = delta["indicator_id"].astype(int)
+
+            columns = keys + ["value_count", "value_sum", "value_min", "value_max", "value_sumsq"]
+            cursor.executemany(f"""
+                INSERT INTO {table} ({", ".join(columns)})
+                VALUES ({", ".join("?" for _ in columns)})
+                ON CONFLICT ({", ".join(keys)}) DO UPDATE SET
+                    value_count = value_count + excluded.value_count,
+                    value_sum = value_sum + excluded.value_sum,
+                    value_min = MIN(value_min, excluded.value_min),
+                    value_max = MAX(value_max, excluded.value_max),
+                    value_sumsq = value_sumsq + excluded.value_sumsq;
+            """, delta[columns].itertuples(index=False, name=None))
+
+    def _apply_rollup_changes(self, cursor: sqlite3.Cursor, touched_table: str) -> None:
+        """
+        Apply inserted and updated report values to every rollup table.
+
+        Counts, sums and sums of squares change by the difference between
+        new and old values, so the cost depends on the touched rows only,
+        not on the size of reports. Min and max are recomputed from reports
+        only for keys where an updated row held the old minimum or maximum.
+
+        Args:
+            cursor: Cursor inside an open transaction.
+            touched_table: Table of touched rows with country_code,
+                indicator_id, report_date, value and old_value (NULL for
+                new keys).
+        """
+        for table, rollup in ROLLUPS.items():
+            keys = rollup["keys"]
+            source_keys = ", ".join(rollup["source"])
+            join = ""
+            if "region" in keys:
+                join = "LEFT JOIN countries c ON c.country_code = r.country_code"
+            matches = " AND ".join(f"t.{key} = {source}" for key, source in zip(keys, rollup["source"]))
+
+            # Keys whose min or max may have been overwritten
+            cursor.execute("DROP TABLE IF EXISTS temp.stale_rollup_keys;")
+            cursor.execute(f"""
+                CREATE TEMP TABLE stale_rollup_keys AS
+                SELECT DISTINCT {", ".join(f"t.{key}" for key in keys)}
+                FROM {touched_table} r {join}
+                JOIN {table} t ON {matches}
+                WHERE r.old_value <= t.value_min OR r.old_value >= t.value_max;
+            """)
+
+            cursor.execute(f"""
+                INSERT INTO {table} ({", ".join(keys)}, value_count, value_sum,
+                                     value_min, value_max, value_sumsq)
+                SELECT {source_keys},
+                       COUNT(r.value) - COUNT(r.old_value),
+                       TOTAL(r.value) - TOTAL(r.old_value),
+                       MIN(r.value), MAX(r.value),
+                       TOTAL(r.value * r.value) - TOTAL(r.old_value * r.old_value)
+                FROM {touched_table} r {join}
+                WHERE true
+                GROUP BY {source_keys}
+                ON CONFLICT ({", ".join(keys)}) DO UPDATE SET
+                    value_count = value_count + excluded.value_count,
+                    value_sum = value_sum + excluded.value_sum,
+                    value_min = COALESCE(MIN(value_min, excluded.value_min), value_min, excluded.value_min),
+                    value_max = COALESCE(MAX(value_max, excluded.value_max), value_max, excluded.value_max),
+                    value_sumsq = value_sumsq + excluded.value_sumsq;
+            """)
+
+            cursor.execute(f"""
+                UPDATE {table} AS t SET (value_min, value_max) = (
+                    SELECT MIN(r.value), MAX(r.value) FROM reports r {join}
+                    WHERE {matches}
+                )
+                WHERE ({", ".join(keys)}) IN (SELECT {", ".join(keys)} FROM stale_rollup_keys);
+            """)
+            cursor.execute(f"DELETE FROM {table} WHERE value_count = 0;")
+            cursor.execute("DROP TABLE stale_rollup_keys;")
+
+    def _refresh_rollups(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Fill empty rollup tables from all reports.
+
+        Args:
+            cursor: Cursor inside an open transaction.
+        """
+        for table, rollup in ROLLUPS.items():
+            join = ""
+            if "region" in rollup["keys"]:
+                join = "LEFT JOIN countries c ON c.country_code = r.country_code"
+            source_keys = ", ".join(rollup["source"])
+            cursor.execute(f"""
+                INSERT INTO {table} ({", ".join(rollup["keys"])}, value_count, value_sum,
+                                     value_min, value_max, value_sumsq)
+                SELECT {source_keys}, COUNT(r.value), SUM(r.value), MIN(r.value),
+                       MAX(r.value), SUM(r.value * r.value)
+                FROM reports r {join}
+                WHERE r.value IS NOT NULL
+                GROUP BY {source_keys};
+            """)
+
+    def _indicator_id_map(self, indicator_codes: pd.Series) -> dict:
+        """
+        Look up indicator_id for each indicator code in one query.
+
+        Args:
+            indicator_codes: Unique indicator codes.
+
+        Returns:
+            Dictionary mapping indicator_code to indicator_id.
+        """
+        codes = indicator_codes.astype(str).tolist()
+        placeholders = ", ".join("?" for _ in codes)
+        cursor = self.conn.execute(f"""
+            SELECT indicator_code, indicator_id FROM indicators
+            WHERE indicator_code IN ({placeholders});
+        """, codes)
+        return dict(cursor.fetchall())
 
     def query_reports(self, sql: str, params: tuple = ()) -> pd.DataFrame:
         """
         Execute a SQL query and return results as DataFrame.
 
+        Results are served from the query cache when the same normalized
+        SQL and parameters were read at the current data_version.
+
         Args:
             sql: SQL query string (use ? for parameters).
             params: Tuple of parameter values for the query.
@@ -161,6 +899,290 @@ class DatabaseRepository:
         if not self.conn:
             raise RuntimeError("Database not connected. Call connect() first.")
 
+        key = (" ".join(sql.split()), tuple(params))
+        version = self.data_version
+        if self.cache.max_bytes:
+            cached = self.cache.get(key, version)
+            if cached is not None:
+                return cached
+
         # Execute query and fetch results
-        df = pd.read_sql_query(sql, self.conn, params=params)
+        if self.read_pool is not None:
+            with self.read_pool.connection() as conn:
+                df = pd.read_sql_query(sql, conn, params=params)
+        else:
+            with self.profile("read"):
+                df = pd.read_sql_query(sql, self.conn, params=params)
+
+        if self.cache.max_bytes:
+            self.cache.put(key, df, version)
         return df
+
+    def query_many(
+        self,
+        queries: Sequence[Tuple[str, tuple]],
+        max_workers: Optional[int] = None
+    ) -> List[pd.DataFrame]:
+        """
+        Run independent queries in parallel on a thread pool.
+
+        Each query uses its own pooled read connection; SQLite releases the
+        GIL while it executes, so the queries overlap.
+
+        Args:
+            queries: Sequence of (sql, params) pairs.
+            max_workers: Number of threads (default: the read pool size).
+
+        Returns:
+            List of DataFrames in the order of queries.
+        """
+        if not self.conn:
+            raise RuntimeError("Database not connected. Call connect() first.")
+
+        workers = max_workers or self.read_pool_size or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda query: self.query_reports(*query), queries))
+
+    def iter_query(self, sql: str, params: tuple = (), chunksize: int = QUERY_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """
+        Execute a SQL query and yield results as DataFrame chunks.
+
+        A pooled read connection is held until the iterator is exhausted
+        or closed. Without a pool the writer connection is used in the
+        default profile, since the caller may write between chunks.
+
+        Args:
+            sql: SQL query string (use ? for parameters).
+            params: Tuple of parameter values for the query.
+            chunksize: Number of rows per chunk.
+
+        Yields:
+            DataFrames with at most chunksize rows.
+        """
+        if not self.conn:
+            raise RuntimeError("Database not connected. Call connect() first.")
+
+        with self._read_connection() as conn:
+            yield from pd.read_sql_query(sql, conn, params=params, chunksize=chunksize)
+
+    def select_reports(
+        self,
+        criteria: Optional["FilterCriteria"] = None,
+        columns: Sequence[str] = DEFAULT_REPORT_COLUMNS,
+        float32: bool = False,
+        parse_dates: bool = False
+    ) -> pd.DataFrame:
+        """
+        Query reports matching criteria, returning only the requested columns.
+
+        Country and indicator tables are joined only when one of their
+        columns is requested. Label columns are returned as categoricals.
+
+        Args:
+            criteria: FilterCriteria instance (None selects all reports).
+            columns: Column names to return; see REPORT_COLUMNS.
+            float32: Return value as float32 instead of float64.
+            parse_dates: Convert report_date from integer years to datetime64.
+
+        Returns:
+            DataFrame with the requested columns in the requested order.
+
+        Raises:
+            ValueError: If an unknown column is requested.
+        """
+        sql, params = self._build_select(criteria, columns)
+        df = self.query_reports(sql, params)
+        return self._compact_dtypes(df, float32=float32, parse_dates=parse_dates)
+
+    def iter_reports(
+        self,
+        criteria: Optional["FilterCriteria"] = None,
+        columns: Sequence[str] = DEFAULT_REPORT_COLUMNS,
+        chunksize: int = QUERY_CHUNK_SIZE,
+        float32: bool = False,
+        parse_dates: bool = False
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream reports matching criteria as DataFrame chunks.
+
+        Same query and dtypes as select_reports(), but rows are fetched
+        chunksize at a time so memory use does not grow with the selection.
+
+        Args:
+            criteria: FilterCriteria instance (None selects all reports).
+            columns: Column names to return; see REPORT_COLUMNS.
+            chunksize: Number of rows per chunk.
+            float32: Return value as float32 instead of float64.
+            parse_dates: Convert report_date from integer years to datetime64.
+
+        Yields:
+            DataFrames with the requested columns.
+        """
+        sql, params = self._build_select(criteria, columns)
+        for chunk in self.iter_query(sql, params, chunksize=chunksize):
+            yield self._compact_dtypes(chunk, float32=float32, parse_dates=parse_dates)
+
+    def aggregate_reports(
+        self,
+        criteria: Optional["FilterCriteria"] = None,
+        group_cols: Sequence[str] = (),
+        parse_dates: bool = False,
+        use_rollups: bool = True
+    ) -> pd.DataFrame:
+        """
+        Aggregate values of reports matching criteria inside SQLite.
+
+        Only one row per group crosses into pandas, e.g. about 64 rows for
+        a trend over all years instead of every matching report. When the
+        filters and grouping match a rollup table (see ROLLUPS) the result
+        is read from it instead of scanning reports; the source used is
+        stored in last_aggregate_source.
+
+        Args:
+            criteria: FilterCriteria instance (None aggregates all reports).
+            group_cols: Columns to group by; see REPORT_COLUMNS (empty for
+                a single overall row).
+            parse_dates: Convert report_date from integer years to datetime64.
+            use_rollups: Answer from rollup tables when possible.
+
+        Returns:
+            DataFrame with columns group_cols + [count, sum, mean, min, max, var],
+            sorted by the group columns.
+
+        Raises:
+            ValueError: If an unknown or non-groupable column is requested.
+        """
+        if "value" in group_cols:
+            raise ValueError("Cannot group by the aggregated value column.")
+
+        source = self._choose_rollup(criteria, group_cols) if use_rollups else "reports"
+        sql, params = self._build_select(criteria, group_cols, aggregate=True, source=source)
+        df = self.query_reports(sql, params)
+        self.last_aggregate_source = source
+        return self._compact_dtypes(df, parse_dates=parse_dates)
+
+    @staticmethod
+    def _choose_rollup(criteria: Optional["FilterCriteria"], group_cols: Sequence[str]) -> str:
+        """
+        Pick the first rollup table that can answer an aggregation exactly.
+
+        Args:
+            criteria: FilterCriteria instance or None.
+            group_cols: Columns to group by.
+
+        Returns:
+            Rollup table name, or "reports" if no rollup matches.
+        """
+        used_filters = set()
+        if criteria:
+            if criteria.countries:
+                used_filters.add("country")
+            if criteria.indicators:
+                used_filters.add("indicator")
+            if criteria.date_from or criteria.date_to:
+                used_filters.add("date")
+            if criteria.value_min is not None or criteria.value_max is not None:
+                used_filters.add("value")
+
+        for table, rollup in ROLLUPS.items():
+            if used_filters <= rollup["filters"] and set(group_cols) <= rollup["groups"]:
+                return table
+        return "reports"
+
+    def _build_select(
+        self,
+        criteria: Optional["FilterCriteria"],
+        columns: Sequence[str],
+        aggregate: bool = False,
+        source: str = "reports"
+    ) -> Tuple[str, tuple]:
+        """
+        Build the SELECT statement used by select_reports() and aggregate_reports().
+
+        Args:
+            criteria: FilterCriteria instance or None.
+            columns: Column names to return (group columns if aggregate).
+            aggregate: Group by columns and add aggregate columns.
+            source: "reports" or a rollup table name (aggregate only).
+
+        Returns:
+            Tuple of (sql, params).
+        """
+        unknown = [col for col in columns if col not in REPORT_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown report columns: {unknown}")
+
+        column_sql = dict(REPORT_COLUMNS)
+        if source == "rollup_region_indicator_year":
+            column_sql["region"] = ("NULLIF(r.region, '')", None)
+
+        select_items = [f"{column_sql[col][0]} AS {col}" for col in columns]
+        if aggregate:
+            aggregates = AGGREGATE_COLUMNS if source == "reports" else ROLLUP_AGGREGATE_COLUMNS
+            select_items += [f"{expression} AS {name}" for name, expression in aggregates.items()]
+        joins = {column_sql[col][1] for col in columns}
+
+        sql = f"SELECT {', '.join(select_items)} FROM {source} r"
+        if "indicators" in joins:
+            sql += " JOIN indicators i ON i.indicator_id = r.indicator_id"
+        if "countries" in joins:
+            sql += " JOIN countries c ON c.country_code = r.country_code"
+
+        where_clause, params = criteria.to_sql_where(table_alias="r") if criteria else ("", ())
+        if where_clause:
+            sql += f" {where_clause}"
+
+        if aggregate and columns:
+            group_list = ", ".join(column_sql[col][0] for col in columns)
+            sql += f" GROUP BY {group_list} ORDER BY {group_list}"
+        return sql, params
+
+    @staticmethod
+    def _compact_dtypes(df: pd.DataFrame, float32: bool = False, parse_dates: bool = False) -> pd.DataFrame:
+        """
+        Convert query results to compact dtypes.
+
+        Args:
+            df: DataFrame returned by query_reports().
+            float32: Downcast value to float32.
+            parse_dates: Convert report_date from integer years to datetime64.
+
+        Returns:
+            The same DataFrame with converted columns.
+        """
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype("category")
+        if "value" in df.columns:
+            df["value"] = df["value"].astype("float32" if float32 else "float64")
+        if parse_dates and "report_date" in df.columns:
+            df["report_date"] = years_to_dates(df["report_date"])
+        return df
+
+    def explain_filter(self, criteria: "FilterCriteria") -> dict:
+        """
+        Show how SQLite would execute the query for a set of filter criteria.
+
+        Runs EXPLAIN QUERY PLAN on the SELECT built from criteria and flags
+        full table scans of reports.
+
+        Args:
+            criteria: FilterCriteria instance.
+
+        Returns:
+            Dictionary with keys:
+            - sql: The query that was explained
+            - plan: List of plan step descriptions
+            - full_scan: True if any step scans reports instead of searching an index
+        """
+        if not self.conn:
+            raise RuntimeError("Database not connected. Call connect() first.")
+
+        where_clause, params = criteria.to_sql_where()
+        sql = f"SELECT * FROM reports {where_clause}".strip()
+
+        with self._read_connection() as conn:
+            plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()]
+        full_scan = any(step.startswith("SCAN") for step in plan)
+
+        return {"sql": sql, "plan": plan, "full_scan": full_scan}
@@ -1,16 +1,15 @@
 """Main entry point for the Health Insights Dashboard."""
-from data.repository import DatabaseRepository
+from data.backends import create_repository
 from data.cleaner import DataCleaner
 from analysis.analyzer import Analyzer
 from presentation.visualizer import Visualizer
 from presentation.cli import CLIController
-from utils.config import DEFAULT_DB_PATH
 
 
 def main():
     """Initialize and run the CLI application."""
     # Initialize dependencies
-    repo = DatabaseRepository(DEFAULT_DB_PATH)
+    repo = create_repository()
     repo.connect()
     repo.init_schema()
     
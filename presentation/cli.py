@@ -1,11 +1,15 @@
 """Command-line interface controller."""
+import os
 import pandas as pd
 from typing import Optional
 from data.repository import DatabaseRepository
 from data.cleaner import DataCleaner
 from data.csv_source import CSVDataSource
+from data.dataset_cache import DatasetCache
+from data.pipeline import ImportPipeline, resolve_import_paths
 from analysis.analyzer import Analyzer
 from analysis.filters import FilterCriteria
+from analysis.selection import ReportSelection
 from presentation.visualizer import Visualizer
 import matplotlib.pyplot as plt
 
@@ -34,6 +38,7 @@ class CLIController:
         self.visualizer = visualizer
         self.cleaner = cleaner
         self.current_df: Optional[pd.DataFrame] = None
+        self.current_selection: Optional[ReportSelection] = None
 
     def run(self) -> None:
         """Run the main CLI loop."""
@@ -67,71 +72,138 @@ class CLIController:
 
     def menu_import(self) -> None:
         """Handle CSV import."""
-        csv_path = input("Enter CSV file path (or press Enter for default): ").strip()
+        csv_path = input("Enter CSV file path, directory or glob (or press Enter for default): ").strip()
         if not csv_path:
             csv_path = "data/raw/API_SP.DYN.LE00.IN_DS2_en_csv_v2_2505.csv"
 
+        if os.path.isdir(csv_path) or any(char in csv_path for char in "*?["):
+            self.menu_import_batch(csv_path)
+            return
+
         try:
             print(f"Loading CSV from: {csv_path}")
             source = CSVDataSource(csv_path)
-            
+
             if not source.validate():
                 print("Error: Invalid CSV file.")
                 return
 
-            # Load raw data
-            df_raw = source.load()
-            print(f"Loaded {len(df_raw)} rows from CSV.")
+            # Stream, normalize, clean and save chunk by chunk
+            print("Importing in chunks...")
+            pipeline = ImportPipeline(self.repo, self.cleaner, dataset_cache=DatasetCache())
+            stats = pipeline.run(csv_path, dataset="world_bank", strategy="drop")
+            print(f"Read {stats['rows_read']} rows from CSV in {stats['chunks']} chunk(s).")
+            print(f"Normalized to {stats['rows_normalized']} rows (long format).")
+            print(f"After cleaning: {stats['rows_clean']} rows.")
+            print(f"Successfully imported {stats['rows_clean']} reports to database "
+                  f"({stats['inserted']} inserted, {stats['updated']} updated, "
+                  f"{stats['unchanged']} unchanged).")
+            print(f"Import time: {stats['seconds']:.2f}s "
+                  f"({stats['rows_per_second']:,.0f} rows/sec).")
+            quality = stats["quality"]
+            print(f"Data quality (profile #{stats['profile_id']}): "
+                  f"{quality['null_ratio'].get('value', 0.0):.1%} missing values, "
+                  f"{quality['duplicate_keys']} duplicate keys, "
+                  f"{quality['range_violations']} out-of-range values.")
+
+            # Imported data is not kept in memory; use "Filter data" to load a selection
+            self.current_df = None
 
-            # Normalize schema
-            print("Normalizing schema...")
-            df_normalized = self.cleaner.normalize_schema(df_raw, dataset="world_bank")
-            print(f"Normalized to {len(df_normalized)} rows (long format).")
+        except Exception as e:
+            print(f"Error during import: {e}")
 
-            # Handle missing values
-            df_clean = self.cleaner.handle_missing(df_normalized, strategy="drop")
-            print(f"After cleaning: {len(df_clean)} rows.")
+    def menu_import_batch(self, pattern: str) -> None:
+        """
+        Handle import of several CSV files in parallel.
 
-            # Save to database
-            print("Saving to database...")
-            row_count = self.repo.save_reports(df_clean)
-            print(f"Successfully imported {row_count} reports to database.")
+        Args:
+            pattern: Directory or glob pattern matching the CSV files.
+        """
+        csv_paths = resolve_import_paths(pattern)
+        if not csv_paths:
+            print(f"Error: No CSV files match: {pattern}")
+            return
+
+        def report_progress(file_stats: dict) -> None:
+            print(f"[{file_stats['index']}/{file_stats['total']}] "
+                  f"{os.path.basename(file_stats['path'])}: {file_stats['rows_clean']} rows "
+                  f"(parsed in {file_stats['parse_seconds']:.2f}s, "
+                  f"written in {file_stats['write_seconds']:.2f}s)")
+
+        try:
+            print(f"Importing {len(csv_paths)} file(s) in parallel...")
+            pipeline = ImportPipeline(self.repo, self.cleaner, dataset_cache=DatasetCache())
+            stats = pipeline.run_many(csv_paths, dataset="world_bank", strategy="drop",
+                                      progress=report_progress)
+            print(f"Successfully imported {stats['rows_clean']} reports to database "
+                  f"({stats['inserted']} inserted, {stats['updated']} updated, "
+                  f"{stats['unchanged']} unchanged).")
+            print(f"Total import time: {stats['seconds']:.2f}s.")
 
-            self.current_df = df_clean
+            self.current_df = None
 
         except Exception as e:
             print(f"Error during import: {e}")
 
     def menu_filter(self) -> None:
         """Handle data filtering."""
-        country = input("Enter country code (or press Enter to skip): ").strip() or None
-        date_from = input("Enter start date YYYY-MM-DD (or press Enter to skip): ").strip() or None
-        date_to = input("Enter end date YYYY-MM-DD (or press Enter to skip): ").strip() or None
+        country = input("Enter country code(s), comma-separated (or press Enter to skip): ").strip()
+        indicator = input("Enter indicator code(s), comma-separated (or press Enter to skip): ").strip()
+        date_from = input("Enter start year or date YYYY-MM-DD (or press Enter to skip): ").strip() or None
+        date_to = input("Enter end year or date YYYY-MM-DD (or press Enter to skip): ").strip() or None
 
         try:
-            filters = FilterCriteria(country=country, date_from=date_from, date_to=date_to)
-            where_clause, params = filters.to_sql_where()
-
-            if where_clause:
-                sql = f"SELECT * FROM reports {where_clause}"
-            else:
-                sql = "SELECT * FROM reports"
-
-            df = self.repo.query_reports(sql, params)
-            print(f"Found {len(df)} matching rows.")
-            self.current_df = df
+            filters = FilterCriteria(
+                country=self._parse_codes(country),
+                date_from=date_from,
+                date_to=date_to,
+                indicator=self._parse_codes(indicator)
+            )
+            # Keep the selection in the database; analysis runs as SQL aggregates
+            selection = ReportSelection(self.repo, filters)
+            count = self.analyzer.summary_stats(selection, value_col="value")["count"]
+            print(f"Found {count} matching rows.")
+            self.current_df = None
+            self.current_selection = selection if count > 0 else None
 
         except Exception as e:
             print(f"Error during filtering: {e}")
 
+    @staticmethod
+    def _parse_codes(text: str) -> Optional[list]:
+        """
+        Split comma-separated user input into a list of codes.
+
+        Args:
+            text: Raw user input (e.g., "ABW, AFG").
+
+        Returns:
+            List of non-empty codes, or None if there are none.
+        """
+        codes = [code.strip() for code in text.split(",") if code.strip()]
+        return codes or None
+
+    def _current_data(self):
+        """
+        Return the data to analyze.
+
+        Returns:
+            The in-memory DataFrame if one is loaded, otherwise the current
+            ReportSelection (or None if there is no non-empty data).
+        """
+        if self.current_df is not None:
+            return self.current_df if len(self.current_df) > 0 else None
+        return self.current_selection
+
     def menu_analyze(self) -> None:
         """Handle summary statistics."""
-        if self.current_df is None or len(self.current_df) == 0:
+        data = self._current_data()
+        if data is None:
             print("No data loaded. Please import or filter data first.")
             return
 
         try:
-            stats = self.analyzer.summary_stats(self.current_df, value_col="value")
+            stats = self.analyzer.summary_stats(data, value_col="value")
             print("\nSummary Statistics:")
             print(f"  Mean:  {stats['mean']:.2f}")
             print(f"  Min:   {stats['min']:.2f}")
@@ -143,12 +215,13 @@ class CLIController:
 
     def menu_visualize(self) -> None:
         """Handle trend visualization."""
-        if self.current_df is None or len(self.current_df) == 0:
+        data = self._current_data()
+        if data is None:
             print("No data loaded. Please import or filter data first.")
             return
 
         try:
-            trend = self.analyzer.trend_over_time(self.current_df, date_col="report_date", value_col="value")
+            trend = self.analyzer.trend_over_time(data, date_col="report_date", value_col="value")
             
             if len(trend) == 0:
                 print("No trend data to visualize.")
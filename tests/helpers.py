@@ -0,0 +1,12 @@
+"""Shared test fixtures."""
+import pandas as pd
+
+
+def reports_frame(rows):
+    """Build a normalized reports DataFrame from (country, indicator, year, value) tuples."""
+    return pd.DataFrame([
+        {"country_code": country, "country_name": f"Country {country}",
+         "indicator_code": indicator, "indicator_name": f"Indicator {indicator}",
+         "report_date": year, "value": value}
+        for country, indicator, year, value in rows
+    ])
@@ -0,0 +1,134 @@
+"""Tests for the dataset adapter registry."""
+import os
+import tempfile
+import unittest
+import pandas as pd
+from data.adapters import ADAPTERS, LongFormatAdapter, get_adapter, register_adapter
+from data.cleaner import DataCleaner
+from data.csv_source import CSVDataSource
+from data.pipeline import ImportPipeline
+from data.repository import DatabaseRepository
+
+# WHO GHO export of an indicator without dimensions: one row per country and period
+GHO_CSV = """IndicatorCode,Indicator,ValueType,Location type,SpatialDimValueCode,Location,Period type,Period,FactValueNumeric,Value
+WHOSIS_000001,Life expectancy at birth (years),numeric,Country,ABW,Aruba,Year,2019,76.3,76.3
+WHOSIS_000001,Life expectancy at birth (years),numeric,Country,ABW,Aruba,Year,2020,,No data
+WHOSIS_000001,Life expectancy at birth (years),numeric,Country,AFG,Afghanistan,Year,2019,63.2,63.2
+"""
+
+# WHO GHO export split by sex (Dim1): one row per country, period and sex
+GHO_SEX_CSV = """IndicatorCode,Indicator,SpatialDimValueCode,Location,Period,Dim1 type,Dim1,Dim1ValueCode,FactValueNumeric
+WHOSIS_000001,Life expectancy at birth (years),AUS,Australia,2019,Sex,Both sexes,SEX_BTSX,83.0
+WHOSIS_000001,Life expectancy at birth (years),AUS,Australia,2019,Sex,Male,SEX_MLE,81.3
+WHOSIS_000001,Life expectancy at birth (years),AUS,Australia,2019,Sex,Female,SEX_FMLE,79.5
+"""
+
+# OECD SDMX-CSV export with labels, split by sex and age
+OECD_CSV = """DATAFLOW,REF_AREA,Reference area,MEASURE,Measure,SEX,AGE,UNIT_MEASURE,TIME_PERIOD,OBS_VALUE
+OECD.ELS.HD:DSD_HEALTH,AUS,Australia,LFEXP,Life expectancy,_T,_T,Y,2021,83.3
+OECD.ELS.HD:DSD_HEALTH,AUT,Austria,LFEXP,Life expectancy,_T,_T,Y,2021,81.3
+OECD.ELS.HD:DSD_HEALTH,AUT,Austria,LFEXP,Life expectancy,F,Y65,Y,2021,21.2
+"""
+
+
+class TestDatasetAdapters(unittest.TestCase):
+    """Test cases for the dataset adapters."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cleaner = DataCleaner()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def _write(self, name, text):
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def test_get_adapter_raises_for_unknown_dataset(self):
+        """Test that an unregistered dataset type raises ValueError."""
+        with self.assertRaises(ValueError):
+            get_adapter("unknown")
+        with self.assertRaises(ValueError):
+            self.cleaner.normalize_schema(pd.DataFrame(), dataset="unknown")
+
+    def test_only_wide_sources_hold_whole_series_per_chunk(self):
+        """Test that wide adapters let imputation handle each chunk on its own."""
+        self.assertTrue(get_adapter("world_bank").whole_series)
+        self.assertFalse(get_adapter("who_gho").whole_series)
+        self.assertFalse(get_adapter("oecd").whole_series)
+
+    def test_who_gho_long_format_maps_columns(self):
+        """Test that a GHO export is read with only the mapped columns and normalized without reshaping."""
+        source = CSVDataSource(self._write("gho.csv", GHO_CSV), dataset="who_gho", engine="c")
+        df = source.load()
+        self.assertNotIn("Value", df.columns)
+
+        result = self.cleaner.normalize_schema(df, dataset="who_gho", dropna=True)
+
+        self.assertListEqual(list(result.columns), ["country_code", "country_name", "indicator_code",
+                                                    "indicator_name", "report_date", "value"])
+        self.assertEqual(result["country_code"].tolist(), ["ABW", "AFG"])
+        self.assertEqual(result["report_date"].tolist(), [2019, 2019])
+        self.assertIsInstance(result["indicator_code"].dtype, pd.CategoricalDtype)
+
+    def test_oecd_import_streams_into_repository(self):
+        """Test that ImportPipeline imports a long-format OECD file end to end."""
+        db_path = os.path.join(self.temp_dir.name, "test.db")
+        repo = DatabaseRepository(db_path)
+        repo.connect()
+        repo.init_schema()
+        try:
+            stats = ImportPipeline(repo, self.cleaner).run(self._write("oecd.csv", OECD_CSV), dataset="oecd")
+            saved = repo.select_reports(columns=["country_code", "country_name", "report_date", "value"])
+        finally:
+            repo.disconnect()
+
+        self.assertEqual(stats["inserted"], 3)
+        self.assertEqual(saved["country_name"].astype(str).tolist(), ["Australia", "Austria", "Austria"])
+        self.assertEqual(saved["value"].tolist(), [83.3, 81.3, 21.2])
+
+    def test_dimensions_keep_distinct_observations(self):
+        """Test that rows split by sex get distinct indicator codes, with both sexes under the plain code."""
+        source = CSVDataSource(self._write("gho_sex.csv", GHO_SEX_CSV), dataset="who_gho", engine="c")
+
+        result = self.cleaner.normalize_schema(source.load(), dataset="who_gho")
+
+        values = dict(zip(result["indicator_code"].astype(str), result["value"]))
+        self.assertEqual(values, {"WHOSIS_000001": 83.0, "WHOSIS_000001.SEX_MLE": 81.3,
+                                  "WHOSIS_000001.SEX_FMLE": 79.5})
+        self.assertEqual(result["indicator_name"].astype(str).iloc[2],
+                         "Life expectancy at birth (years) (SEX_FMLE)")
+
+        oecd = CSVDataSource(self._write("oecd.csv", OECD_CSV), dataset="oecd", engine="c")
+        codes = self.cleaner.normalize_schema(oecd.load(), dataset="oecd")["indicator_code"].astype(str)
+        self.assertEqual(codes.tolist(), ["LFEXP.Y", "LFEXP.Y", "LFEXP.F.Y65.Y"])
+
+    def test_non_annual_periods_are_rejected(self):
+        """Test that quarterly periods raise instead of being truncated to the year."""
+        quarterly = OECD_CSV.replace(",2021,83.3", ",2021-Q1,83.3")
+        source = CSVDataSource(self._write("oecd_q.csv", quarterly), dataset="oecd", engine="c")
+
+        with self.assertRaisesRegex(ValueError, "2021-Q1"):
+            self.cleaner.normalize_schema(source.load(), dataset="oecd")
+
+    def test_register_adapter_adds_source(self):
+        """Test that a new long-format source only needs a registered column map."""
+        adapter = register_adapter(LongFormatAdapter("test_source", {
+            "iso3": "country_code", "code": "indicator_code", "year": "report_date", "v": "value"
+        }))
+        try:
+            result = adapter.normalize(pd.DataFrame({"iso3": ["ABW"], "code": ["X"], "year": [2000], "v": [1.5]}))
+        finally:
+            del ADAPTERS["test_source"]
+
+        self.assertEqual(result["country_name"].tolist(), ["ABW"])
+        self.assertEqual(result["value"].tolist(), [1.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
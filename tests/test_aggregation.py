@@ -0,0 +1,78 @@
+"""Tests for online aggregation engine."""
+import unittest
+import numpy as np
+import pandas as pd
+from analysis.aggregation import GroupedOnlineStats, OnlineStats, QuantileSketch
+
+
+class TestOnlineStats(unittest.TestCase):
+    """Test cases for OnlineStats class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        rng = np.random.default_rng(42)
+        self.values = rng.normal(loc=65.0, scale=8.0, size=10000)
+
+    def test_update_in_chunks_matches_numpy(self):
+        """Test that chunked updates give exact count, mean, min, max and variance."""
+        stats = OnlineStats()
+        for chunk in np.array_split(self.values, 7):
+            stats.update(chunk)
+
+        result = stats.result()
+        self.assertEqual(result["count"], 10000)
+        self.assertAlmostEqual(result["mean"], self.values.mean(), places=9)
+        self.assertAlmostEqual(result["sum"], self.values.sum(), places=6)
+        self.assertAlmostEqual(result["var"], self.values.var(ddof=1), places=6)
+        self.assertEqual(result["min"], self.values.min())
+        self.assertEqual(result["max"], self.values.max())
+
+    def test_merge_partial_states(self):
+        """Test that merging states from two workers equals one pass over all data."""
+        left, right = OnlineStats(), OnlineStats()
+        left.update(self.values[:3000])
+        right.update(np.append(self.values[3000:], np.nan))
+
+        left.merge(right)
+
+        self.assertEqual(left.count, 10000)
+        self.assertAlmostEqual(left.variance, self.values.var(ddof=1), places=6)
+        self.assertAlmostEqual(left.quantile(0.5), np.median(self.values), delta=0.2)
+
+    def test_quantile_sketch_bounded_and_accurate(self):
+        """Test that QuantileSketch keeps few items and estimates quantiles closely."""
+        sketch = QuantileSketch(capacity=256)
+        for chunk in np.array_split(self.values, 20):
+            sketch.update(chunk)
+
+        kept = sum(len(level) for level in sketch.levels)
+        self.assertLess(kept, 256 * len(sketch.levels) + 1)
+        self.assertLess(kept, 2000)
+        for q in (0.1, 0.5, 0.9):
+            self.assertAlmostEqual(sketch.quantile(q), np.quantile(self.values, q), delta=0.5)
+
+
+class TestGroupedOnlineStats(unittest.TestCase):
+    """Test cases for GroupedOnlineStats class."""
+
+    def test_update_in_chunks_matches_groupby(self):
+        """Test that grouped statistics over chunks match a pandas groupby."""
+        df = pd.DataFrame({
+            "country_code": ["ABW", "AFG", "ABW", "AFG", "ALB", "ABW"],
+            "value": [64.0, 32.0, 65.0, 33.0, 58.0, np.nan]
+        })
+        stats = GroupedOnlineStats(["country_code"])
+        for start in range(0, len(df), 4):
+            stats.update(df.iloc[start:start + 4])
+
+        result = stats.result().set_index("country_code")
+        expected = df.groupby("country_code")["value"].agg(["count", "mean", "var"])
+
+        self.assertListEqual(list(result["count"]), list(expected["count"]))
+        np.testing.assert_allclose(result["mean"], expected["mean"])
+        np.testing.assert_allclose(result["var"], expected["var"])
+        self.assertEqual(result.loc["ABW", "max"], 65.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -71,6 +71,55 @@ class TestAnalyzer(unittest.TestCase):
         self.assertAlmostEqual(abw_row["value"].iloc[0], 64.5)  # mean of 64.0 and 65.0
         self.assertAlmostEqual(afg_row["value"].iloc[0], 32.5)  # mean of 32.0 and 33.0
 
+    def test_summary_stats_and_trend_accept_chunk_iterator(self):
+        """Test that summary_stats() and trend_over_time() consume chunk iterators."""
+        df = pd.DataFrame({
+            "country_code": pd.Categorical(["ABW", "AFG", "ABW", "AFG"]),
+            "report_date": ["2020-01-01", "2020-01-01", "2021-01-01", "2021-01-01"],
+            "value": [64.0, 32.0, 65.0, 33.0]
+        })
+        chunks = lambda: (df.iloc[i:i + 3] for i in range(0, len(df), 3))
+
+        stats = self.analyzer.summary_stats(chunks(), value_col="value")
+        expected = self.analyzer.summary_stats(df, value_col="value")
+        self.assertEqual(set(stats), set(expected))
+        for key, value in expected.items():
+            self.assertAlmostEqual(stats[key], value, msg=key)
+
+        trend = self.analyzer.trend_over_time(chunks())
+        self.assertListEqual(list(trend["report_date"]), ["2020-01-01", "2021-01-01"])
+        self.assertListEqual(list(trend["value"]), [48.0, 49.0])
+
+        grouped = self.analyzer.group_aggregate(chunks(), group_cols=["country_code"])
+        self.assertListEqual(list(grouped["value"]), [64.5, 32.5])
+
+    def test_online_stats_single_pass(self):
+        """Test that online_stats() returns all statistics from one pass over chunks."""
+        df = pd.DataFrame({"value": [64.0, 32.0, 58.0, 70.0]})
+        chunks = (df.iloc[i:i + 2] for i in range(0, len(df), 2))
+
+        result = self.analyzer.online_stats(chunks, quantiles=(0.5,))
+
+        self.assertEqual(result["count"], 4)
+        self.assertAlmostEqual(result["mean"], 56.0)
+        self.assertAlmostEqual(result["var"], df["value"].var())
+        self.assertEqual(result["quantiles"][0.5], 58.0)
+
+    def test_operations_accept_indicator_cube(self):
+        """Test that Analyzer reduces an IndicatorCube along its axes."""
+        from analysis.cube import IndicatorCube
+        cube = IndicatorCube.from_frame(pd.DataFrame({
+            "indicator_code": ["LE"] * 4,
+            "country_code": ["ABW", "AFG", "ABW", "AFG"],
+            "report_date": ["2020-01-01", "2020-01-01", "2021-01-01", "2021-01-01"],
+            "value": [64.0, 32.0, 65.0, 33.0]
+        }))
+
+        self.assertEqual(self.analyzer.summary_stats(cube)["count"], 4)
+        self.assertListEqual(list(self.analyzer.trend_over_time(cube)["value"]), [48.0, 49.0])
+        grouped = self.analyzer.group_aggregate(cube, group_cols=["country_code"])
+        self.assertListEqual(list(grouped["value"]), [64.5, 32.5])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""Tests for AsyncRepository."""
+import asyncio
+import contextlib
+import os
+import tempfile
+import threading
+import unittest
+import pandas as pd
+from analysis.filters import FilterCriteria
+from data.async_repository import AsyncRepository
+from data.repository import DatabaseRepository
+
+
+class TestAsyncRepository(unittest.IsolatedAsyncioTestCase):
+    """Test cases for AsyncRepository class."""
+
+    def setUp(self):
+        """Set up a database with one indicator for three countries over four years."""
+        temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        temp_db.close()
+        self.db_path = temp_db.name
+        self.repo = DatabaseRepository(self.db_path, read_pool_size=2)
+        self.repo.connect()
+        self.repo.init_schema()
+        self.repo.save_reports(pd.DataFrame({
+            "country_code": ["ABW"] * 4 + ["AFG"] * 4 + ["AGO"] * 4,
+            "country_name": ["Aruba"] * 4 + ["Afghanistan"] * 4 + ["Angola"] * 4,
+            "indicator_code": ["SP.DYN.LE00.IN"] * 12,
+            "indicator_name": ["Life expectancy"] * 12,
+            "report_date": [1960, 1961, 1962, 1963] * 3,
+            "value": [64.0, 64.2, 64.6, 65.0, 32.0, 32.5, 33.0, 33.5, 58.0, 58.5, 59.0, 59.5]
+        }))
+        self.async_repo = AsyncRepository(self.repo)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.async_repo.close()
+        self.repo.disconnect()
+        os.remove(self.db_path)
+
+    async def test_concurrent_selects_match_sync_results(self):
+        """Test that gathered select_reports() calls return the same frames as the sync API."""
+        codes = ["AGO", "ABW", "AFG"]
+
+        results = await asyncio.gather(*(
+            self.async_repo.select_reports(FilterCriteria(country=code)) for code in codes
+        ))
+
+        for code, result in zip(codes, results):
+            expected = self.repo.select_reports(FilterCriteria(country=code))
+            pd.testing.assert_frame_equal(result, expected)
+
+    async def test_query_many_keeps_order(self):
+        """Test that query_many() returns results in the order of the queries."""
+        sql = "SELECT COUNT(*) AS n FROM reports WHERE report_date >= ?"
+
+        results = await self.async_repo.query_many([(sql, (1963,)), (sql, (1960,)), (sql, (1962,))])
+
+        self.assertEqual([int(df["n"].iloc[0]) for df in results], [3, 12, 6])
+
+    async def test_iter_reports_streams_chunks(self):
+        """Test that iter_reports() yields chunks and releases the connection on early exit."""
+        chunks = [chunk async for chunk in self.async_repo.iter_reports(chunksize=5)]
+        self.assertEqual([len(chunk) for chunk in chunks], [5, 5, 2])
+
+        async with contextlib.aclosing(self.async_repo.iter_query("SELECT * FROM reports", chunksize=1)) as rows:
+            async for _ in rows:
+                break
+        # Both pooled readers must be free again
+        self.assertEqual(self.repo.read_pool._idle.qsize(), len(self.repo.read_pool._all))
+
+    async def test_aexit_keeps_event_loop_running_until_calls_finish(self):
+        """Test that leaving async with waits for pending calls without blocking the loop."""
+        release = threading.Event()
+
+        async with AsyncRepository(self.repo) as async_repo:
+            pending = asyncio.ensure_future(async_repo._run(release.wait, 5))
+            await asyncio.sleep(0)
+            # Only runs if the loop is free while __aexit__ waits for the call
+            asyncio.get_running_loop().call_later(0.05, release.set)
+
+        self.assertTrue(await pending)
+
+    async def test_iterators_on_repository_without_read_pool(self):
+        """Test that iterators over the writer connection take and release its lock on one thread."""
+        repo = DatabaseRepository(":memory:")
+        repo.connect()
+        repo.init_schema()
+        repo.save_reports(self.repo.select_reports(columns=[
+            "country_code", "country_name", "indicator_code", "indicator_name", "report_date", "value"]))
+        try:
+            async with AsyncRepository(repo, max_workers=4) as async_repo:
+                chunks = [chunk async for chunk in async_repo.iter_reports(chunksize=5)]
+                self.assertEqual([len(chunk) for chunk in chunks], [5, 5, 2])
+
+                async with contextlib.aclosing(async_repo.iter_query("SELECT * FROM reports", chunksize=1)) as rows:
+                    async for _ in rows:
+                        break
+                # The writer lock is free again for other threads
+                self.assertTrue(repo._write_lock.acquire(timeout=1))
+                repo._write_lock.release()
+                self.assertEqual(len(await async_repo.select_reports()), 12)
+        finally:
+            repo.disconnect()
+
+
+if __name__ == '__main__':
+    unittest.main()
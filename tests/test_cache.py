@@ -0,0 +1,60 @@
+"""Tests for QueryCache."""
+import unittest
+import pandas as pd
+from data.cache import QueryCache
+
+
+class TestQueryCache(unittest.TestCase):
+    """Test cases for QueryCache class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.df = pd.DataFrame({"value": [64.0, 32.0, 58.0]})
+        self.size = int(self.df.memory_usage(index=True, deep=True).sum())
+
+    def test_get_returns_copy_and_counts_hits(self):
+        """Test that get() counts hits and misses and returns a copy."""
+        cache = QueryCache(max_bytes=10 * self.size)
+
+        self.assertIsNone(cache.get("q1", version=0))
+        cache.put("q1", self.df, version=0)
+        result = cache.get("q1", version=0)
+        result.loc[0, "value"] = 0.0
+
+        self.assertEqual(cache.get("q1", version=0).loc[0, "value"], 64.0)
+        self.assertEqual(cache.stats()["hits"], 2)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_put_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when memory is full."""
+        cache = QueryCache(max_bytes=2 * self.size)
+
+        cache.put("q1", self.df, version=0)
+        cache.put("q2", self.df, version=0)
+        cache.get("q1", version=0)
+        cache.put("q3", self.df, version=0)
+
+        self.assertIsNotNone(cache.get("q1", version=0))
+        self.assertIsNone(cache.get("q2", version=0))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_new_version_invalidates_entries(self):
+        """Test that a lookup with a newer data version empties the cache."""
+        cache = QueryCache(max_bytes=10 * self.size)
+        cache.put("q1", self.df, version=0)
+
+        self.assertIsNone(cache.get("q1", version=1))
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_put_skips_results_from_older_version(self):
+        """Test that a result read before a newer version was seen is not cached."""
+        cache = QueryCache(max_bytes=10 * self.size)
+        cache.get("q1", version=1)
+        cache.put("q1", self.df, version=0)
+
+        self.assertIsNone(cache.get("q1", version=0))
+        self.assertEqual(cache.stats()["entries"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -35,13 +35,32 @@ class TestDataCleaner(unittest.TestCase):
         # Assert number of rows (2 countries × 3 years = 6 rows)
         self.assertEqual(len(result), 6)
 
-        # Assert report_date is in ISO format
-        self.assertTrue(result["report_date"].iloc[0].startswith("196"))
-        self.assertIn("-01-01", result["report_date"].iloc[0])
+        # Assert report_date is an integer year
+        self.assertTrue(pd.api.types.is_integer_dtype(result["report_date"]))
+        self.assertEqual(result["report_date"].iloc[0], 1960)
 
         # Assert value column is numeric (empty strings become NaN)
         self.assertTrue(pd.api.types.is_numeric_dtype(result["value"]))
 
+    def test_normalize_schema_dropna_returns_categorical_rows_with_values(self):
+        """Test that dropna masks out empty cells and identifiers come back as categoricals."""
+        df = pd.DataFrame({
+            "Country Name": ["Aruba", "Afghanistan"],
+            "Country Code": ["ABW", "AFG"],
+            "Indicator Name": ["Life expectancy", "Life expectancy"],
+            "Indicator Code": ["SP.DYN.LE00.IN", "SP.DYN.LE00.IN"],
+            "1960": [64.049, None],
+            "1961": [64.215, 33.291]
+        })
+
+        result = self.cleaner.normalize_schema(df, dataset="world_bank", dropna=True)
+
+        self.assertEqual(result["country_code"].tolist(), ["ABW", "ABW", "AFG"])
+        self.assertEqual(result["report_date"].tolist(), [1960, 1961, 1961])
+        self.assertEqual(result["value"].tolist(), [64.049, 64.215, 33.291])
+        self.assertIsInstance(result["country_code"].dtype, pd.CategoricalDtype)
+        self.assertEqual(list(result["indicator_code"].cat.categories), ["SP.DYN.LE00.IN"])
+
     def test_handle_missing_drop_strategy(self):
         """Test handle_missing with 'drop' strategy removes rows with NaN."""
         df = pd.DataFrame({
@@ -68,6 +87,83 @@ class TestDataCleaner(unittest.TestCase):
         self.assertEqual(len(result), 3)
         self.assertEqual(result.loc[1, "value"], 0.0)
 
+    def _series_frame(self):
+        """Two series with gaps, rows deliberately out of order."""
+        return pd.DataFrame({
+            "country_code": ["AFG", "ABW", "ABW", "ABW", "AFG", "ABW", "AFG"],
+            "indicator_code": ["LE"] * 7,
+            "report_date": [1961, 1963, 1960, 1961, 1960, 1962, 1962],
+            "value": [None, 70.0, None, 64.0, 30.0, None, 34.0]
+        })
+
+    def test_handle_missing_imputes_within_series(self):
+        """Test ffill, interpolate and mean fill gaps from the same (country, indicator) series only."""
+        df = self._series_frame()
+        lookup = lambda result: {(row.country_code, row.report_date): row.value
+                                 for row in result.itertuples()}
+
+        ffill = lookup(self.cleaner.handle_missing(df, strategy="ffill"))
+        interpolated = lookup(self.cleaner.handle_missing(df, strategy="interpolate"))
+        mean = lookup(self.cleaner.handle_missing(df, strategy="mean"))
+
+        # ABW 1960 precedes the first value, so only the mean can fill it
+        self.assertNotIn(("ABW", 1960), ffill)
+        self.assertNotIn(("ABW", 1960), interpolated)
+        self.assertEqual(mean[("ABW", 1960)], 67.0)
+        self.assertEqual(ffill[("ABW", 1962)], 64.0)
+        self.assertEqual(interpolated[("ABW", 1962)], 67.0)
+        self.assertEqual(ffill[("AFG", 1961)], 30.0)
+        self.assertEqual(interpolated[("AFG", 1961)], 32.0)
+        self.assertEqual(mean[("AFG", 1961)], 32.0)
+
+    def test_iter_handle_missing_matches_whole_frame_across_chunks(self):
+        """Test that series split over chunks are imputed as if the frame were whole."""
+        df = self._series_frame().sort_values("report_date", kind="stable")
+        chunks = [df.iloc[:3], df.iloc[3:5], df.iloc[5:]]
+        key = ["country_code", "report_date"]
+
+        for strategy in ("ffill", "interpolate", "mean"):
+            streamed = pd.concat(list(self.cleaner.iter_handle_missing(chunks, strategy=strategy)))
+            whole = self.cleaner.handle_missing(df, strategy=strategy)
+            pd.testing.assert_frame_equal(
+                streamed.sort_values(key).reset_index(drop=True),
+                whole.sort_values(key).reset_index(drop=True)
+            )
+
+    def test_iter_handle_missing_carries_series_over_chunks_without_them(self):
+        """Test that a series absent from some chunks picks up its carried end when it returns."""
+        df = self._series_frame()
+        # AFG only reappears in the last chunk, ABW runs through every chunk
+        chunks = [df.iloc[[4, 2]], df.iloc[[3]], df.iloc[[5]], df.iloc[[0, 6, 1]]]
+        key = ["country_code", "report_date"]
+
+        for strategy in ("ffill", "interpolate"):
+            streamed = pd.concat(list(self.cleaner.iter_handle_missing(chunks, strategy=strategy)))
+            whole = self.cleaner.handle_missing(df, strategy=strategy)
+            pd.testing.assert_frame_equal(
+                streamed.sort_values(key).reset_index(drop=True),
+                whole.sort_values(key).reset_index(drop=True)
+            )
+
+    def test_iter_handle_missing_whole_series_emits_each_chunk_at_once(self):
+        """Test that with whole_series each chunk's fills are emitted before the next chunk is read."""
+        df = self._series_frame()
+        abw, afg = df[df["country_code"] == "ABW"], df[df["country_code"] == "AFG"]
+        read = []
+
+        def chunks():
+            for chunk in (abw, afg):
+                read.append(chunk["country_code"].iloc[0])
+                yield chunk
+
+        for strategy in ("ffill", "interpolate", "mean"):
+            read.clear()
+            stream = self.cleaner.iter_handle_missing(chunks(), strategy=strategy, whole_series=True)
+            first = next(stream)
+            self.assertEqual(read, ["ABW"])
+            pd.testing.assert_frame_equal(first, self.cleaner.handle_missing(abw, strategy=strategy))
+            self.assertEqual(list(next(stream)["country_code"].unique()), ["AFG"])
+
     def test_convert_types_float_conversion(self):
         """Test convert_types converts string values to float."""
         df = pd.DataFrame({
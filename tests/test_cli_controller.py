@@ -1,6 +1,11 @@
 """Tests for CLIController."""
 import unittest
-from unittest.mock import Mock
+import os
+import tempfile
+from unittest.mock import Mock, patch
+import pandas as pd
+from data.repository import DatabaseRepository
+from analysis.analyzer import Analyzer
 from presentation.cli import CLIController
 
 
@@ -27,6 +32,40 @@ class TestCLIController(unittest.TestCase):
         except Exception as e:
             self.fail(f"CLIController instantiation raised {type(e).__name__}: {e}")
 
+    def test_menu_filter_keeps_selection_in_database(self):
+        """Test that filtered data is analysed through SQL aggregates."""
+        temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        temp_db.close()
+        repo = DatabaseRepository(temp_db.name)
+        repo.connect()
+        repo.init_schema()
+        repo.save_reports(pd.DataFrame({
+            "country_code": ["ABW", "ABW", "AFG"],
+            "country_name": ["Aruba", "Aruba", "Afghanistan"],
+            "indicator_code": ["SP.DYN.LE00.IN"] * 3,
+            "indicator_name": ["Life expectancy"] * 3,
+            "report_date": ["2020-01-01", "2021-01-01", "2020-01-01"],
+            "value": [64.0, 65.0, 32.0]
+        }))
+
+        try:
+            controller = CLIController(
+                repo=repo, analyzer=Analyzer(), visualizer=Mock(), cleaner=Mock()
+            )
+            with patch("builtins.input", side_effect=["ABW", "", "", ""]), \
+                    patch("builtins.print") as mock_print:
+                controller.menu_filter()
+                controller.menu_analyze()
+
+            self.assertIsNone(controller.current_df)
+            self.assertIsNotNone(controller.current_selection)
+            printed = [str(call.args[0]) for call in mock_print.call_args_list if call.args]
+            self.assertIn("Found 2 matching rows.", printed)
+            self.assertIn("  Mean:  64.50", printed)
+        finally:
+            repo.disconnect()
+            os.remove(temp_db.name)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
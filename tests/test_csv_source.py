@@ -1,6 +1,9 @@
 """Tests for CSVDataSource."""
+import importlib.util
 import unittest
 import os
+import numpy as np
+import pandas as pd
 from data.csv_source import CSVDataSource
 
 
@@ -31,6 +34,34 @@ class TestCSVDataSource(unittest.TestCase):
         # Sample CSV has 3 data rows (after skipping 4 metadata rows: 2 metadata + 2 blank)
         self.assertEqual(len(df), 3)
     
+    def test_iter_chunks_yields_all_rows(self):
+        """Test that iter_chunks() splits the file into chunks of the given size."""
+        source = CSVDataSource(self.sample_csv_path)
+        chunks = list(source.iter_chunks(chunksize=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+        self.assertListEqual(list(chunks[0].columns), list(source.load().columns))
+
+    def test_load_uses_explicit_dtypes_and_skips_trailing_column(self):
+        """Test that load() reads ids as categoricals, years as floats and drops the empty column."""
+        source = CSVDataSource("data/raw/API_SP.DYN.LE00.IN_DS2_en_csv_v2_2505.csv", float32=True, engine="c")
+        df = source.load()
+
+        self.assertEqual(source.header()[-1], "")
+        self.assertFalse(any(col.startswith("Unnamed") for col in df.columns))
+        self.assertIsInstance(df["Country Code"].dtype, pd.CategoricalDtype)
+        self.assertEqual(df["1960"].dtype, "float32")
+        self.assertEqual(df.loc[df["Country Code"] == "ABW", "1960"].iloc[0], np.float32(64.049))
+
+    @unittest.skipIf(importlib.util.find_spec("pyarrow") is None, "pyarrow is not installed")
+    def test_load_with_pyarrow_matches_c_engine(self):
+        """Test that the pyarrow engine skips the WDI metadata and blank lines like the C engine."""
+        for path in (self.sample_csv_path, "data/raw/API_SP.DYN.LE00.IN_DS2_en_csv_v2_2505.csv"):
+            expected = CSVDataSource(path, engine="c").load()
+            df = CSVDataSource(path, engine="pyarrow").load()
+
+            self.assertListEqual(list(df.columns), list(expected.columns))
+            pd.testing.assert_frame_equal(df, expected, check_categorical=False)
+
     def test_validate_returns_false_for_nonexistent_file(self):
         """Test that validate() returns False for non-existent file."""
         source = CSVDataSource(self.missing_file_path)
@@ -0,0 +1,71 @@
+"""Tests for IndicatorCube."""
+import unittest
+import numpy as np
+import pandas as pd
+from analysis.cube import IndicatorCube
+
+
+class TestIndicatorCube(unittest.TestCase):
+    """Test cases for IndicatorCube class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.df = pd.DataFrame({
+            "indicator_code": ["LE", "LE", "LE", "LE", "LE"],
+            "country_code": ["ABW", "ABW", "ABW", "AFG", "AFG"],
+            "report_date": ["2000-01-01", "2001-01-01", "2002-01-01", "2000-01-01", "2002-01-01"],
+            "value": [70.0, 77.0, 84.0, 50.0, 60.0]
+        })
+        self.cube = IndicatorCube.from_frame(self.df)
+
+    def test_from_frame_builds_dense_axes(self):
+        """Test that from_frame() fills a contiguous year axis with NaN gaps."""
+        self.assertEqual(self.cube.values.shape, (1, 2, 3))
+        self.assertEqual(list(self.cube.countries), ["ABW", "AFG"])
+        self.assertEqual(list(self.cube.years), [2000, 2001, 2002])
+        self.assertTrue(np.isnan(self.cube.values[0, 1, 1]))
+        self.assertEqual(self.cube.count, 5)
+
+    def test_group_mean_matches_pandas(self):
+        """Test that axis reductions match pandas groupby means."""
+        result = self.cube.group_mean(["country_code"])
+        expected = self.df.groupby("country_code")["value"].mean()
+
+        self.assertEqual(result["country_code"].tolist(), ["ABW", "AFG"])
+        np.testing.assert_allclose(result["value"], expected.values)
+
+        trend = self.cube.trend()
+        self.assertEqual(trend["value"].tolist(), [60.0, 77.0, 72.0])
+
+    def test_yoy_growth(self):
+        """Test growth against the previous year, NaN across gaps."""
+        growth = self.cube.yoy_growth()
+
+        self.assertEqual(list(growth.years), [2001, 2002])
+        np.testing.assert_allclose(growth.values[0, 0], [0.1, 84.0 / 77.0 - 1])
+        self.assertTrue(np.isnan(growth.values[0, 1]).all())
+
+    def test_rolling_mean(self):
+        """Test trailing means with and without min_periods."""
+        np.testing.assert_allclose(self.cube.rolling_mean(2).values[0, 0], [np.nan, 73.5, 80.5])
+        np.testing.assert_allclose(self.cube.rolling_mean(2, min_periods=1).values[0, 1],
+                                   [50.0, 50.0, 60.0])
+
+    def test_rank_orders_countries(self):
+        """Test ranking across countries within each year."""
+        ranks = self.cube.rank()
+
+        np.testing.assert_allclose(ranks.values[0, :, 0], [1, 2])
+        np.testing.assert_allclose(ranks.values[0, :, 1], [1, np.nan])
+        np.testing.assert_allclose(self.cube.rank(ascending=True).values[0, :, 2], [2, 1])
+
+    def test_to_frame_round_trip(self):
+        """Test that to_frame() returns every non-missing value."""
+        frame = self.cube.to_frame()
+
+        self.assertEqual(len(frame), 5)
+        self.assertAlmostEqual(frame["value"].sum(), self.df["value"].sum())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+"""Tests for CubeRepository."""
+import unittest
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from data.cube_repository import CubeRepository
+from data.repository import DatabaseRepository
+from analysis.filters import FilterCriteria
+from tests.helpers import reports_frame
+
+
+class TestCubeRepository(unittest.TestCase):
+    """Test cases for CubeRepository class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.store_dir = tempfile.mkdtemp()
+        self.repo = CubeRepository(self.store_dir)
+        self.repo.connect()
+        self.repo.init_schema()
+        self.df = reports_frame([
+            ("ABW", "LE", 2000, 70.0), ("ABW", "LE", 2001, 71.0),
+            ("AFG", "LE", 2000, 50.0), ("AFG", "LE", 2002, 52.0),
+            ("ABW", "GDP", 2001, 10.0),
+        ])
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.repo.disconnect()
+        shutil.rmtree(self.store_dir)
+
+    def test_save_reports_grows_cube_and_persists(self):
+        """Test that new labels grow the cube and survive reconnecting."""
+        self.assertEqual(self.repo.save_reports(self.df), 5)
+        self.assertEqual(self.repo.values.shape, (2, 2, 3))
+        self.repo.save_reports(reports_frame([("ALB", "LE", 1999, 60.0)]))
+
+        self.repo.disconnect()
+        self.repo.connect()
+        self.assertEqual(self.repo.values.shape, (2, 3, 4))
+        self.assertEqual(self.repo.first_year, 1999)
+        self.assertEqual(len(self.repo.select_reports()), 6)
+
+    def test_upsert_reports_counts_changes(self):
+        """Test that upsert_reports() classifies each cell."""
+        self.repo.upsert_reports(self.df)
+        changed = reports_frame([("ABW", "LE", 2000, 70.0), ("ABW", "LE", 2001, 72.0),
+                            ("AFG", "LE", 2001, 51.0)])
+
+        counts = self.repo.upsert_reports(changed)
+
+        self.assertEqual(counts, {"inserted": 1, "updated": 1, "unchanged": 1})
+        self.assertEqual(len(self.repo.select_reports()), 6)
+
+    def test_select_reports_applies_criteria(self):
+        """Test that select_reports() filters by every criterion."""
+        self.repo.save_reports(self.df)
+        criteria = FilterCriteria(country=["AFG", "ABW"], indicator="LE",
+                                  date_from="2000-06-01", value_min=51)
+
+        result = self.repo.select_reports(criteria, columns=("country_code", "report_date", "value"))
+
+        self.assertEqual(result["country_code"].astype(str).tolist(), ["ABW", "AFG"])
+        self.assertEqual(result["value"].tolist(), [71.0, 52.0])
+        self.assertEqual(result["report_date"].tolist(), [2001, 2002])
+
+    def test_aggregate_reports_matches_sqlite(self):
+        """Test that aggregates equal those of DatabaseRepository."""
+        self.repo.save_reports(self.df)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sqlite_repo = DatabaseRepository(f"{temp_dir}/test.db")
+            sqlite_repo.connect()
+            sqlite_repo.init_schema()
+            sqlite_repo.save_reports(self.df)
+
+            for group_cols in [(), ("report_date",), ("indicator_code", "country_code")]:
+                expected = sqlite_repo.aggregate_reports(group_cols=group_cols)
+                result = self.repo.aggregate_reports(group_cols=group_cols)
+                self.assertEqual(len(result), len(expected))
+                for col in ["count", "sum", "mean", "min", "max", "var"]:
+                    np.testing.assert_allclose(result[col].to_numpy(float),
+                                               expected[col].to_numpy(float))
+            sqlite_repo.disconnect()
+
+    def test_aggregate_reports_rejects_region(self):
+        """Test that grouping by a column outside the cube axes raises."""
+        self.repo.save_reports(self.df)
+        with self.assertRaises(ValueError):
+            self.repo.aggregate_reports(group_cols=("region",))
+
+    def test_iter_reports_streams_all_rows(self):
+        """Test that iter_reports() yields every row in bounded chunks."""
+        self.repo.save_reports(self.df)
+
+        chunks = list(self.repo.iter_reports(chunksize=2))
+
+        self.assertTrue(all(len(chunk) <= 2 for chunk in chunks))
+        self.assertEqual(sum(len(chunk) for chunk in chunks), 5)
+
+    def test_select_block_returns_dense_view(self):
+        """Test that select_block() returns the sub-cube with its labels."""
+        self.repo.save_reports(self.df)
+
+        values, indicators, countries, years = self.repo.select_block(FilterCriteria(indicator="LE"))
+
+        self.assertEqual(indicators, ["LE"])
+        self.assertEqual(countries, ["ABW", "AFG"])
+        self.assertEqual(list(years), [2000, 2001, 2002])
+        self.assertEqual(int((~np.isnan(values)).sum()), 4)
+
+    def test_import_profiles_persist(self):
+        """Test that import profiles are appended and read back newest first."""
+        first = self.repo.save_import_profile("a.csv", "world_bank", {"rows": 1})
+        second = self.repo.save_import_profile("b.csv", "world_bank", {"rows": 2})
+
+        self.repo.disconnect()
+        self.repo.connect()
+        self.assertEqual([p["profile_id"] for p in self.repo.load_import_profiles()], [second, first])
+        self.assertEqual(self.repo.load_import_profiles("a.csv")[0]["profile"], {"rows": 1})
+
+    def test_empty_writes_return_zero_counts(self):
+        """Test that empty chunks, e.g. all-NaN chunks after dropna, are accepted like on SQLite."""
+        empty = self.df.iloc[0:0]
+
+        self.assertEqual(self.repo.save_reports(empty), 0)
+        self.assertEqual(self.repo.upsert_reports(empty), {"inserted": 0, "updated": 0, "unchanged": 0})
+        self.assertEqual(self.repo.values.shape, (0, 0, 0))
+
+    def test_growth_reallocates_geometrically(self):
+        """Test that adding one indicator per write resizes the value file only a few times."""
+        resizes = []
+        resize = self.repo._resize
+        def counting_resize(*args):
+            resizes.append(args[0])
+            resize(*args)
+        self.repo._resize = counting_resize
+
+        for i in range(40):
+            self.repo.upsert_reports(reports_frame([("ABW", f"IND{i}", 2000, float(i)),
+                                               ("AFG", f"IND{i}", 1990 - i, 1.0)]))
+
+        self.assertLessEqual(len(resizes), 15)
+        self.repo.disconnect()
+        self.repo.connect()
+        self.assertEqual(self.repo.values.shape, (40, 2, 50))
+        self.assertEqual(self.repo.first_year, 1951)
+        self.assertEqual(self.repo.aggregate_reports(FilterCriteria(country="ABW"))["sum"].iloc[0], sum(range(40)))
+        self.assertEqual(len(self.repo.select_reports()), 80)
+
+    def test_raw_sql_is_not_part_of_the_interface(self):
+        """Test that the cube backend does not offer query_reports()."""
+        self.assertFalse(hasattr(self.repo, "query_reports"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""Tests for DatasetCache."""
+import unittest
+import shutil
+import tempfile
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+from data.cleaner import DataCleaner
+from data.dataset_cache import DatasetCache
+from data.pipeline import iter_normalized_chunks
+
+
+class TestDatasetCache(unittest.TestCase):
+    """Test cases for DatasetCache class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = DatasetCache(self.cache_dir)
+        self.sample_csv_path = "data/world_bank_sample.csv"
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.cache_dir)
+
+    def test_write_through_round_trip(self):
+        """Test that cached parts read back with the same values."""
+        df = pd.DataFrame({
+            "country_code": ["ABW", "AFG", "ABW"],
+            "report_date": ["1960-01-01", "1960-01-01", "1961-01-01"],
+            "value": [64.049, np.nan, 64.215]
+        })
+
+        passed = list(self.cache.write_through("k1", iter([(1, df), (2, df.iloc[:1])])))
+        self.assertEqual(len(passed), 2)
+        self.assertTrue(self.cache.has("k1"))
+
+        parts = list(self.cache.iter_parts("k1"))
+        self.assertEqual([rows for rows, _ in parts], [1, 2])
+        restored = parts[0][1]
+        self.assertListEqual(list(restored["country_code"]), ["ABW", "AFG", "ABW"])
+        np.testing.assert_array_equal(restored["value"], df["value"])
+
+    def test_incomplete_entry_is_discarded(self):
+        """Test that an entry is only committed when all chunks were consumed."""
+        df = pd.DataFrame({"value": [1.0]})
+        chunks = self.cache.write_through("k2", iter([(1, df), (1, df)]))
+        next(chunks)
+        chunks.close()
+
+        self.assertFalse(self.cache.has("k2"))
+
+    def test_unchanged_file_skips_parsing(self):
+        """Test that a second read of the same file comes from the cache."""
+        cleaner = DataCleaner()
+        first = list(iter_normalized_chunks(self.sample_csv_path, "world_bank", cleaner, 2, self.cache))
+
+        with patch("data.csv_source.CSVDataSource.iter_chunks", side_effect=AssertionError("parsed")):
+            second = list(iter_normalized_chunks(self.sample_csv_path, "world_bank", cleaner, 2, self.cache))
+
+        self.assertEqual(len(first), len(second))
+        self.assertListEqual(list(first[0][1]["value"]), list(second[0][1]["value"]))
+        self.assertListEqual(list(first[0][1]["report_date"].astype(str)),
+                             list(second[0][1]["report_date"].astype(str)))
+
+
+if __name__ == '__main__':
+    unittest.main()
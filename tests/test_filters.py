@@ -25,8 +25,8 @@ class TestFilterCriteria(unittest.TestCase):
         # Params should have 3 values
         self.assertEqual(len(params), 3)
         self.assertIn("ABW", params)
-        self.assertIn("2020-01-01", params)
-        self.assertIn("2024-12-31", params)
+        self.assertIn(2020, params)
+        self.assertIn(2024, params)
 
     def test_to_sql_where_with_country_only(self):
         """Test to_sql_where() with only country filter."""
@@ -82,6 +82,58 @@ class TestFilterCriteria(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result.iloc[0]["report_date"], "2020-01-01")
 
+    def test_to_sql_where_with_lists_indicator_and_values(self):
+        """Test to_sql_where() with IN lists, indicator codes and a value range."""
+        filters = FilterCriteria(
+            country=["ABW", "AFG"],
+            indicator="SP.DYN.LE00.IN",
+            value_min=50.0,
+            value_max=80.0
+        )
+
+        where_clause, params = filters.to_sql_where()
+
+        self.assertIn("country_code IN (?, ?)", where_clause)
+        self.assertIn("indicator_code IN (?)", where_clause)
+        self.assertIn("value >= ?", where_clause)
+        self.assertIn("value <= ?", where_clause)
+        self.assertEqual(params, ("ABW", "AFG", "SP.DYN.LE00.IN", 50.0, 80.0))
+
+    def test_apply_pandas_filters_by_lists_and_values(self):
+        """Test apply_pandas() with country list, indicator and value range."""
+        import pandas as pd
+
+        df = pd.DataFrame([
+            {"country_code": "ABW", "indicator_code": "A", "report_date": "2020-01-01", "value": 64.0},
+            {"country_code": "AFG", "indicator_code": "A", "report_date": "2020-01-01", "value": 32.0},
+            {"country_code": "ALB", "indicator_code": "A", "report_date": "2020-01-01", "value": 70.0},
+            {"country_code": "ABW", "indicator_code": "B", "report_date": "2020-01-01", "value": 65.0}
+        ])
+
+        filters = FilterCriteria(country=["ABW", "AFG"], indicator=["A"], value_min=40.0)
+        result = filters.apply_pandas(df)
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result.iloc[0]["country_code"], "ABW")
+        self.assertEqual(result.iloc[0]["indicator_code"], "A")
+
+    def test_dates_convert_to_report_years(self):
+        """Test that ISO dates and years convert to inclusive integer year bounds."""
+        import pandas as pd
+
+        self.assertEqual(FilterCriteria(date_from="2020-01-01", date_to="2024-12-31").to_sql_where()[1],
+                         (2020, 2024))
+        self.assertEqual(FilterCriteria(date_from="2020-06-30", date_to=2024).to_sql_where()[1],
+                         (2021, 2024))
+
+        df = pd.DataFrame({"country_code": ["ABW"] * 3, "report_date": [2019, 2020, 2021],
+                           "value": [1.0, 2.0, 3.0]})
+        result = FilterCriteria(date_from="2020", date_to="2020-12-31").apply_pandas(df)
+        self.assertEqual(result["report_date"].tolist(), [2020])
+
+        with self.assertRaises(ValueError):
+            FilterCriteria(date_from="1967-09-88").to_sql_where()
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""Tests for database compaction."""
+import unittest
+import os
+import sqlite3
+import tempfile
+import pandas as pd
+from analysis.filters import FilterCriteria
+from data.maintenance import compact_database
+from data.repository import DatabaseRepository
+
+
+class TestCompactDatabase(unittest.TestCase):
+    """Test cases for compact_database()."""
+
+    def setUp(self):
+        """Create a database in the old schema with duplicated imports."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "test.db")
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript("""
+            CREATE TABLE countries (country_code TEXT PRIMARY KEY, country_name TEXT NOT NULL, region TEXT);
+            CREATE TABLE indicators (indicator_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                                     indicator_code TEXT UNIQUE NOT NULL,
+                                     indicator_name TEXT NOT NULL, category TEXT);
+            CREATE TABLE reports (report_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                                  country_code TEXT NOT NULL, indicator_id INTEGER NOT NULL,
+                                  report_date TEXT NOT NULL, value REAL);
+            INSERT INTO countries VALUES ('ABW', 'Aruba', NULL), ('AFG', 'Afghanistan', NULL);
+            INSERT INTO indicators (indicator_code, indicator_name) VALUES ('LE', 'Life expectancy');
+            INSERT INTO reports (country_code, indicator_id, report_date, value) VALUES
+                ('ABW', 1, '1960-01-01', 64.0), ('AFG', 1, '1960-01-01', 32.0),
+                ('ABW', 1, '1960-01-01', 64.0), ('AFG', 1, '1960-01-01', 32.5);
+        """)
+        conn.close()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_compact_deduplicates_and_clusters_reports(self):
+        """Test that compaction removes duplicates and rebuilds reports WITHOUT ROWID."""
+        stats = compact_database(self.db_path)
+
+        self.assertEqual(stats["rows_before"], 4)
+        self.assertEqual(stats["rows_after"], 2)
+        self.assertEqual(stats["duplicates_removed"], 2)
+        self.assertEqual(set(stats["queries_before"]), set(stats["queries_after"]))
+        self.assertFalse(os.path.exists(self.db_path + ".compact"))
+
+        conn = sqlite3.connect(self.db_path)
+        sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'reports'").fetchone()[0]
+        rows = conn.execute("SELECT country_code, report_date, value FROM reports").fetchall()
+        conn.close()
+        self.assertIn("WITHOUT ROWID", sql)
+        self.assertEqual(rows, [("ABW", 1960, 64.0), ("AFG", 1960, 32.5)])
+
+    def test_compacted_database_accepts_upserts(self):
+        """Test that the repository keeps working on a compacted database."""
+        compact_database(self.db_path)
+        repo = DatabaseRepository(self.db_path)
+        repo.connect()
+        repo.init_schema()
+
+        counts = repo.upsert_reports(pd.DataFrame({
+            "country_code": ["ABW", "ABW"], "country_name": ["Aruba", "Aruba"],
+            "indicator_code": ["LE", "LE"], "indicator_name": ["Life expectancy"] * 2,
+            "report_date": [1960, 1961], "value": [65.0, 66.0]
+        }))
+        repo.disconnect()
+
+        self.assertEqual(counts, {"inserted": 1, "updated": 1, "unchanged": 0})
+
+    def test_compact_leaves_no_write_ahead_log_beside_database(self):
+        """Test that the -wal/-shm of the replaced database are not left for the copy to replay."""
+        # An idle connection keeps the log (and its frames) beside the database
+        writer = sqlite3.connect(self.db_path)
+        writer.execute("PRAGMA journal_mode = WAL;")
+        writer.execute("PRAGMA wal_autocheckpoint = 0;")
+        writer.execute("INSERT INTO reports (country_code, indicator_id, report_date, value) "
+                       "VALUES ('ABW', 1, '1961-01-01', 65.0);")
+        writer.commit()
+
+        stats = compact_database(self.db_path)
+
+        self.assertEqual(stats["rows_after"], 3)
+        self.assertFalse(os.path.exists(self.db_path + "-wal"))
+        self.assertFalse(os.path.exists(self.db_path + "-shm"))
+        writer.close()
+        conn = sqlite3.connect(self.db_path)
+        self.assertEqual(conn.execute("PRAGMA integrity_check").fetchone()[0], "ok")
+        rows = conn.execute("SELECT country_code, report_date, value FROM reports").fetchall()
+        conn.close()
+        self.assertEqual(rows, [("ABW", 1960, 64.0), ("ABW", 1961, 65.0), ("AFG", 1960, 32.5)])
+
+    def test_compacted_database_serves_filter_shapes_from_indexes(self):
+        """Test that every supported filter shape is index-backed after compaction."""
+        # Many countries and indicators with few rows each, so that ANALYZE
+        # neither prefers a scan nor a skip-scan over the leading key columns
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript("""
+            WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n WHERE i < 2999)
+            INSERT INTO reports (country_code, indicator_id, report_date, value)
+            SELECT printf('C%03d', i / 10), 2 + i % 300, (1960 + i % 60) || '-01-01', i FROM n;
+            INSERT INTO countries SELECT DISTINCT country_code, 'Country', NULL FROM reports
+                WHERE country_code LIKE 'C%';
+            INSERT INTO indicators (indicator_code, indicator_name)
+                SELECT DISTINCT 'I' || indicator_id, 'Indicator' FROM reports WHERE indicator_id > 1
+                ORDER BY indicator_id;
+        """)
+        conn.close()
+        compact_database(self.db_path)
+        repo = DatabaseRepository(self.db_path)
+        repo.connect()
+        repo.init_schema()
+
+        shapes = [
+            FilterCriteria(country="ABW"),
+            FilterCriteria(country="ABW", date_from="2000-01-01", date_to="2010-01-01"),
+            FilterCriteria(date_from="2000"),
+            FilterCriteria(date_from="2000-01-01", date_to="2010-01-01"),
+            FilterCriteria(indicator="LE", date_from="2000-01-01"),
+            FilterCriteria(country=["ABW", "AFG"], indicator=["LE"]),
+        ]
+        reports = [repo.explain_filter(criteria) for criteria in shapes]
+        repo.disconnect()
+
+        for report in reports:
+            self.assertFalse(report["full_scan"], report["plan"])
+
+    def test_no_swap_keeps_original(self):
+        """Test that swap=False leaves the original database untouched."""
+        stats = compact_database(self.db_path, swap=False)
+
+        self.assertEqual(stats["path"], self.db_path + ".compact")
+        conn = sqlite3.connect(self.db_path)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM reports").fetchone()[0], 4)
+        conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""Tests for ImportPipeline."""
+import unittest
+import os
+import shutil
+import tempfile
+from data.repository import DatabaseRepository
+from data.cleaner import DataCleaner
+from data.dataset_cache import DatasetCache
+from data.pipeline import ImportPipeline, resolve_import_paths
+
+
+class TestImportPipeline(unittest.TestCase):
+    """Test cases for ImportPipeline class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+        self.db_path = self.temp_db.name
+        self.repo = DatabaseRepository(self.db_path)
+        self.repo.connect()
+        self.repo.init_schema()
+        self.sample_csv_path = "data/world_bank_sample.csv"
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.repo.disconnect()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+
+    def test_run_imports_file_in_chunks(self):
+        """Test that run() streams every chunk into the database."""
+        pipeline = ImportPipeline(self.repo, DataCleaner(), chunksize=2)
+
+        stats = pipeline.run(self.sample_csv_path)
+
+        # Sample CSV has 3 countries × 3 years
+        self.assertEqual(stats["chunks"], 2)
+        self.assertEqual(stats["rows_read"], 3)
+        self.assertEqual(stats["rows_clean"], 9)
+        self.assertEqual(stats["inserted"], 9)
+
+        cursor = self.repo.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM reports")
+        self.assertEqual(cursor.fetchone()[0], 9)
+
+    def test_run_twice_leaves_rows_unchanged(self):
+        """Test that re-running the same import does not duplicate rows."""
+        pipeline = ImportPipeline(self.repo, DataCleaner(), chunksize=2)
+
+        pipeline.run(self.sample_csv_path)
+        stats = pipeline.run(self.sample_csv_path)
+
+        self.assertEqual(stats["inserted"], 0)
+        self.assertEqual(stats["unchanged"], 9)
+
+    def test_run_stores_quality_profile(self):
+        """Test that run() profiles the import, including cache hits, and stores the profile."""
+        cache_dir = tempfile.mkdtemp()
+        try:
+            pipeline = ImportPipeline(self.repo, DataCleaner(), chunksize=2,
+                                      dataset_cache=DatasetCache(cache_dir))
+            first = pipeline.run(self.sample_csv_path)
+            cached = pipeline.run(self.sample_csv_path)
+        finally:
+            shutil.rmtree(cache_dir)
+
+        self.assertEqual(first["quality"], cached["quality"])
+        self.assertEqual(first["quality"]["rows"], 9)
+        self.assertEqual(first["quality"]["indicators"]["SP.DYN.LE00.IN"]["min"], 32.799)
+        self.assertEqual(first["quality"]["range_violations"], 0)
+
+        profiles = self.repo.load_import_profiles(self.sample_csv_path)
+        self.assertEqual([p["profile_id"] for p in profiles], [cached["profile_id"], first["profile_id"]])
+        self.assertEqual(profiles[0]["profile"], cached["quality"])
+        self.assertIsNone(pipeline.cleaner.profile)
+
+    def test_run_many_imports_all_files(self):
+        """Test that run_many() parses files in parallel and writes each one."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            # Second file carries a different indicator code
+            with open(self.sample_csv_path) as f:
+                content = f.read()
+            with open(os.path.join(temp_dir, "API_A_DS2_en_csv_v2_1.csv"), "w") as f:
+                f.write(content)
+            with open(os.path.join(temp_dir, "API_B_DS2_en_csv_v2_1.csv"), "w") as f:
+                f.write(content.replace("SP.DYN.LE00.IN", "SP.DYN.LE00.FE.IN"))
+
+            csv_paths = resolve_import_paths(temp_dir)
+            self.assertEqual(len(csv_paths), 2)
+
+            progress = []
+            pipeline = ImportPipeline(self.repo, DataCleaner())
+            stats = pipeline.run_many(csv_paths, workers=2, progress=progress.append)
+        finally:
+            shutil.rmtree(temp_dir)
+
+        self.assertEqual(len(progress), 2)
+        self.assertEqual(stats["inserted"], 18)
+        self.assertEqual(sorted(f["path"] for f in stats["files"]), csv_paths)
+        self.assertEqual(len(self.repo.load_import_profiles()), 2)
+
+        cursor = self.repo.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM reports")
+        self.assertEqual(cursor.fetchone()[0], 18)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""Tests for QualityProfile."""
+import json
+import unittest
+import numpy as np
+import pandas as pd
+from data.cleaner import DataCleaner
+from data.csv_source import CSVDataSource
+from data.quality import QualityProfile
+from tests.helpers import reports_frame
+
+
+class TestQualityProfile(unittest.TestCase):
+    """Test cases for QualityProfile class."""
+
+    def test_profile_counts_nulls_and_bounds(self):
+        """Test null ratios per year and country, and min/max per indicator."""
+        profile = QualityProfile(range_rules={})
+        profile.update(reports_frame([
+            ("ABW", "LE", 2000, 70.0), ("ABW", "LE", 2001, np.nan),
+            ("AFG", "LE", 2000, 50.0), ("AFG", "GDP", 2001, np.nan),
+        ]))
+
+        result = profile.result()
+
+        self.assertEqual(result["rows"], 4)
+        self.assertEqual(result["values"], 2)
+        self.assertEqual(result["null_ratio"]["value"], 0.5)
+        self.assertEqual(result["null_ratio"]["country_code"], 0.0)
+        self.assertEqual(result["null_ratio_by_year"], {"2000": 0.0, "2001": 1.0})
+        self.assertEqual(result["country_completeness"], {"ABW": 0.5, "AFG": 0.5})
+        self.assertEqual(result["indicators"]["LE"], {
+            "rows": 3, "values": 2, "min": 50.0, "max": 70.0, "range_violations": 0})
+        self.assertIsNone(result["indicators"]["GDP"]["min"])
+        # The result can be stored as JSON as it is
+        self.assertEqual(json.loads(json.dumps(result)), result)
+
+    def test_profile_merges_chunks(self):
+        """Test that duplicate keys and ranges are tracked across chunks."""
+        profile = QualityProfile(range_rules={"LE": (0.0, 120.0), "GDP": (0.0, None)})
+        profile.update(reports_frame([("ABW", "LE", 2000, 70.0), ("ABW", "LE", 2000, 130.0)]))
+        profile.update(reports_frame([("ABW", "LE", 2000, 71.0), ("ABW", "GDP", 2000, -1.0),
+                                 ("AFG", "LE", 1990, 20.0)]))
+
+        result = profile.result()
+
+        self.assertEqual(result["rows"], 5)
+        self.assertEqual(result["duplicate_keys"], 2)
+        self.assertEqual(result["range_violations"], 2)
+        self.assertEqual(result["indicators"]["LE"]["min"], 20.0)
+        self.assertEqual(result["indicators"]["LE"]["max"], 130.0)
+        self.assertEqual(result["indicators"]["LE"]["range_violations"], 1)
+        self.assertEqual(result["indicators"]["GDP"]["range_violations"], 1)
+        self.assertEqual(list(result["null_ratio_by_year"]), ["1990", "2000"])
+
+    def test_cleaner_profiles_before_dropping_rows(self):
+        """Test that normalize_schema() profiles the rows it drops."""
+        source = CSVDataSource("data/world_bank_sample.csv", engine="c")
+        df = source.load()
+        df.loc[0, "1960"] = np.nan
+        profile = QualityProfile()
+
+        result = DataCleaner(profile).normalize_schema(df, dataset="world_bank", dropna=True)
+
+        self.assertEqual(len(result), 8)
+        self.assertEqual(profile.rows, 9)
+        self.assertAlmostEqual(profile.result()["null_ratio_by_year"]["1960"], 1 / 3)
+
+    def test_empty_profile_result(self):
+        """Test that a profile without rows still returns every key."""
+        result = QualityProfile().result()
+
+        self.assertEqual(result["rows"], 0)
+        self.assertEqual(result["indicators"], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -43,6 +43,7 @@ class TestDatabaseRepository(unittest.TestCase):
         self.assertIn("countries", tables)
         self.assertIn("indicators", tables)
         self.assertIn("reports", tables)
+        self.assertIn("import_profiles", tables)
 
     def test_save_reports_inserts_data(self):
         """Test that save_reports() inserts data into all tables."""
@@ -83,6 +84,204 @@ class TestDatabaseRepository(unittest.TestCase):
         cursor.execute("SELECT COUNT(*) FROM reports")
         self.assertEqual(cursor.fetchone()[0], 3)
 
+    def test_save_reports_writes_in_batches(self):
+        """Test that save_reports() resolves keys and writes across several batches."""
+        import pandas as pd
+
+        self.repo.connect()
+        self.repo.init_schema()
+
+        df = pd.DataFrame({
+            "country_code": ["ABW", "AFG", "ALB", "ABW", "AFG"],
+            "country_name": ["Aruba", "Afghanistan", "Albania", "Aruba", "Afghanistan"],
+            "indicator_code": ["SP.DYN.LE00.IN"] * 3 + ["SP.POP.TOTL"] * 2,
+            "indicator_name": ["Life expectancy"] * 3 + ["Population"] * 2,
+            "report_date": ["1960-01-01"] * 5,
+            "value": [64.049, 32.799, None, 54608.0, 8622466.0]
+        })
+
+        row_count = self.repo.save_reports(df, batch_size=2)
+
+        self.assertEqual(row_count, 5)
+        self.assertEqual(self.repo.last_save_stats["rows"], 5)
+        self.assertGreater(self.repo.last_save_stats["rows_per_second"], 0)
+
+        result = self.repo.query_reports("""
+            SELECT r.country_code, i.indicator_code, r.value
+            FROM reports r JOIN indicators i ON r.indicator_id = i.indicator_id
+            ORDER BY i.indicator_code, r.country_code
+        """)
+        self.assertListEqual(list(result["indicator_code"]),
+                             ["SP.DYN.LE00.IN"] * 3 + ["SP.POP.TOTL"] * 2)
+        # Missing values are stored as NULL
+        self.assertTrue(pd.isna(result["value"].iloc[2]))
+        self.assertEqual(result["value"].iloc[4], 8622466.0)
+
+    def test_upsert_reports_is_idempotent(self):
+        """Test that upsert_reports() only writes new or changed values."""
+        import pandas as pd
+
+        self.repo.connect()
+        self.repo.init_schema()
+
+        df = pd.DataFrame([
+            {"country_code": "ABW", "country_name": "Aruba",
+            "indicator_code": "SP.DYN.LE00.IN", "indicator_name": "Life expectancy",
+            "report_date": "1960-01-01", "value": 64.049},
+            {"country_code": "AFG", "country_name": "Afghanistan",
+            "indicator_code": "SP.DYN.LE00.IN", "indicator_name": "Life expectancy",
+            "report_date": "1960-01-01", "value": 32.799}
+        ])
+
+        first = self.repo.upsert_reports(df)
+        self.assertEqual(first, {"inserted": 2, "updated": 0, "unchanged": 0})
+
+        # Same file again: nothing is written
+        second = self.repo.upsert_reports(df)
+        self.assertEqual(second, {"inserted": 0, "updated": 0, "unchanged": 2})
+
+        # One revised value and one new year
+        refresh = pd.concat([df, pd.DataFrame([
+            {"country_code": "ABW", "country_name": "Aruba",
+            "indicator_code": "SP.DYN.LE00.IN", "indicator_name": "Life expectancy",
+            "report_date": "1961-01-01", "value": 64.215}
+        ])], ignore_index=True)
+        refresh.loc[1, "value"] = 33.0
+
+        third = self.repo.upsert_reports(refresh)
+        self.assertEqual(third, {"inserted": 1, "updated": 1, "unchanged": 1})
+
+        result = self.repo.query_reports(
+            "SELECT value FROM reports WHERE country_code = ?", ("AFG",)
+        )
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result["value"].iloc[0], 33.0)
+
+        cursor = self.repo.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM reports")
+        self.assertEqual(cursor.fetchone()[0], 3)
+
+    def test_init_schema_removes_duplicate_reports(self):
+        """Test that init_schema() deduplicates databases created without a unique key."""
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript("""
+            CREATE TABLE reports (
+                report_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                country_code TEXT NOT NULL,
+                indicator_id INTEGER NOT NULL,
+                report_date TEXT NOT NULL,
+                value REAL
+            );
+            INSERT INTO reports (country_code, indicator_id, report_date, value)
+            VALUES ('ABW', 1, '1960-01-01', 64.0), ('ABW', 1, '1960-01-01', 64.0);
+        """)
+        conn.close()
+
+        self.repo.connect()
+        self.repo.init_schema()
+
+        cursor = self.repo.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM reports")
+        self.assertEqual(cursor.fetchone()[0], 1)
+
+    def test_init_schema_migrates_text_dates_to_years(self):
+        """Test that init_schema() converts ISO text report dates to integer years."""
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript("""
+            CREATE TABLE reports (
+                report_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                country_code TEXT NOT NULL,
+                indicator_id INTEGER NOT NULL,
+                report_date TEXT NOT NULL,
+                value REAL
+            );
+            INSERT INTO reports (country_code, indicator_id, report_date, value)
+            VALUES ('ABW', 1, '1960-01-01', 64.0), ('ABW', 1, '1961-01-01', 65.0);
+        """)
+        conn.close()
+
+        self.repo.connect()
+        self.repo.init_schema()
+
+        cursor = self.repo.conn.cursor()
+        cursor.execute("SELECT type FROM pragma_table_info('reports') WHERE name = 'report_date'")
+        self.assertEqual(cursor.fetchone()[0], "INTEGER")
+        cursor.execute("SELECT report_date, typeof(report_date) FROM reports ORDER BY report_date")
+        self.assertEqual(cursor.fetchall(), [(1960, "integer"), (1961, "integer")])
+        cursor.execute("SELECT report_date, value_count FROM rollup_indicator_year ORDER BY report_date")
+        self.assertEqual(cursor.fetchall(), [(1960, 1), (1961, 1)])
+
+    def test_init_schema_migration_drops_leftover_migration_table(self):
+        """Test that a reports_migrated table left by an interrupted migration does not block it."""
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript("""
+            CREATE TABLE reports (
+                report_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                country_code TEXT NOT NULL,
+                indicator_id INTEGER NOT NULL,
+                report_date TEXT NOT NULL,
+                value REAL
+            );
+            CREATE TABLE reports_migrated (report_id INTEGER PRIMARY KEY);
+            INSERT INTO reports (country_code, indicator_id, report_date, value)
+            VALUES ('ABW', 1, '1960-01-01', 64.0);
+        """)
+        conn.close()
+
+        self.repo.connect()
+        self.repo.init_schema()
+
+        cursor = self.repo.conn.cursor()
+        cursor.execute("SELECT report_date, value FROM reports")
+        self.assertEqual(cursor.fetchall(), [(1960, 64.0)])
+        cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 'reports_migrated'")
+        self.assertEqual(cursor.fetchone()[0], 0)
+
+    def test_init_schema_refuses_to_migrate_non_annual_dates(self):
+        """Test that text dates other than YYYY or YYYY-01-01 abort the migration unchanged."""
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript("""
+            CREATE TABLE reports (
+                report_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                country_code TEXT NOT NULL,
+                indicator_id INTEGER NOT NULL,
+                report_date TEXT NOT NULL,
+                value REAL
+            );
+            INSERT INTO reports (country_code, indicator_id, report_date, value)
+            VALUES ('ABW', 1, '1960-01-01', 64.0), ('ABW', 1, '1960-07-01', 64.5);
+        """)
+        conn.close()
+
+        self.repo.connect()
+        with self.assertRaisesRegex(ValueError, "'1960-07-01'"):
+            self.repo.init_schema()
+
+        cursor = self.repo.conn.cursor()
+        cursor.execute("SELECT report_date FROM reports ORDER BY report_date")
+        self.assertEqual(cursor.fetchall(), [("1960-01-01",), ("1960-07-01",)])
+
+    def test_writes_reject_non_annual_report_dates(self):
+        """Test that save_reports() and upsert_reports() refuse dates other than 1 January."""
+        import pandas as pd
+
+        self.repo.connect()
+        self.repo.init_schema()
+        df = pd.DataFrame({
+            "country_code": ["ABW", "ABW", "ABW"], "country_name": ["Aruba"] * 3,
+            "indicator_code": ["LE"] * 3, "indicator_name": ["Life expectancy"] * 3,
+            "report_date": ["2000", "2000-06-30", "2001-01-01"], "value": [74.0, 74.5, 75.0]
+        })
+
+        for write in (self.repo.save_reports, self.repo.upsert_reports):
+            with self.assertRaisesRegex(ValueError, "'2000-06-30'"):
+                write(df)
+        self.assertEqual(self.repo.conn.execute("SELECT COUNT(*) FROM reports").fetchone()[0], 0)
+
+        self.assertEqual(self.repo.save_reports(df.drop(index=1)), 2)
+        years = self.repo.conn.execute("SELECT report_date FROM reports ORDER BY report_date").fetchall()
+        self.assertEqual(years, [(2000,), (2001,)])
+
     def test_query_reports_returns_dataframe(self):
         """Test that query_reports() returns filtered data as DataFrame."""
         import pandas as pd
@@ -111,6 +310,319 @@ class TestDatabaseRepository(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertIsInstance(result, pd.DataFrame)
 
+    def test_select_reports_projects_columns_with_compact_dtypes(self):
+        """Test that select_reports() returns requested columns with compact dtypes."""
+        import pandas as pd
+        from analysis.filters import FilterCriteria
+
+        self.repo.connect()
+        self.repo.init_schema()
+        self.repo.save_reports(pd.DataFrame([
+            {"country_code": "ABW", "country_name": "Aruba",
+            "indicator_code": "SP.DYN.LE00.IN", "indicator_name": "Life expectancy",
+            "report_date": "1960-01-01", "value": 64.049},
+            {"country_code": "AFG", "country_name": "Afghanistan",
+            "indicator_code": "SP.DYN.LE00.IN", "indicator_name": "Life expectancy",
+            "report_date": "1960-01-01", "value": 32.799},
+            {"country_code": "ABW", "country_name": "Aruba",
+            "indicator_code": "SP.POP.TOTL", "indicator_name": "Population",
+            "report_date": "1960-01-01", "value": 54608.0}
+        ]))
+
+        result = self.repo.select_reports(FilterCriteria(indicator="SP.DYN.LE00.IN"))
+        self.assertListEqual(list(result.columns),
+                             ["country_code", "indicator_code", "report_date", "value"])
+        self.assertEqual(len(result), 2)
+        self.assertIsInstance(result["country_code"].dtype, pd.CategoricalDtype)
+        self.assertEqual(result["report_date"].tolist(), [1960, 1960])
+
+        parsed = self.repo.select_reports(columns=["report_date"], parse_dates=True)
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(parsed["report_date"]))
+
+        named = self.repo.select_reports(
+            FilterCriteria(country="ABW"),
+            columns=["country_name", "indicator_name", "value"],
+            float32=True
+        )
+        self.assertListEqual(sorted(named["indicator_name"]), ["Life expectancy", "Population"])
+        self.assertEqual(named["value"].dtype, "float32")
+
+        with self.assertRaises(ValueError):
+            self.repo.select_reports(columns=["report_id"])
+
+    def test_iter_reports_yields_bounded_chunks(self):
+        """Test that iter_reports() streams a selection in chunks of chunksize rows."""
+        import pandas as pd
+
+        self.repo.connect()
+        self.repo.init_schema()
+        self.repo.save_reports(pd.DataFrame({
+            "country_code": ["ABW"] * 5,
+            "country_name": ["Aruba"] * 5,
+            "indicator_code": ["SP.DYN.LE00.IN"] * 5,
+            "indicator_name": ["Life expectancy"] * 5,
+            "report_date": [f"196{year}-01-01" for year in range(5)],
+            "value": [64.0, 64.2, 64.6, 65.0, 65.5]
+        }))
+
+        chunks = list(self.repo.iter_reports(columns=["report_date", "value"], chunksize=2))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(chunks[0]["report_date"].tolist(), [1960, 1961])
+
+    def test_aggregate_reports_groups_in_sql(self):
+        """Test that aggregate_reports() returns one aggregated row per group."""
+        import pandas as pd
+        from analysis.filters import FilterCriteria
+
+        self.repo.connect()
+        self.repo.init_schema()
+        self.repo.save_reports(pd.DataFrame({
+            "country_code": ["ABW", "AFG", "ABW", "AFG"],
+            "country_name": ["Aruba", "Afghanistan", "Aruba", "Afghanistan"],
+            "indicator_code": ["SP.DYN.LE00.IN"] * 4,
+            "indicator_name": ["Life expectancy"] * 4,
+            "report_date": ["2020-01-01", "2020-01-01", "2021-01-01", "2021-01-01"],
+            "value": [64.0, 32.0, 65.0, 33.0]
+        }))
+
+        trend = self.repo.aggregate_reports(group_cols=["report_date"])
+        self.assertEqual(len(trend), 2)
+        self.assertListEqual(list(trend["mean"]), [48.0, 49.0])
+        self.assertListEqual(list(trend["count"]), [2, 2])
+
+        overall = self.repo.aggregate_reports(FilterCriteria(country="ABW"))
+        self.assertEqual(len(overall), 1)
+        self.assertAlmostEqual(overall["mean"].iloc[0], 64.5)
+        self.assertAlmostEqual(overall["var"].iloc[0], 0.5)
+
+        with self.assertRaises(ValueError):
+            self.repo.aggregate_reports(group_cols=["value"])
+
+    def test_rollups_match_raw_aggregates_after_writes(self):
+        """Test that rollup tables stay consistent through inserts and upserts."""
+        import pandas as pd
+        from analysis.filters import FilterCriteria
+
+        self.repo.connect()
+        self.repo.init_schema()
+
+        base = pd.DataFrame({
+            "country_code": ["ABW", "AFG", "ABW", "AFG"],
+            "country_name": ["Aruba", "Afghanistan", "Aruba", "Afghanistan"],
+            "indicator_code": ["SP.DYN.LE00.IN"] * 4,
+            "indicator_name": ["Life expectancy"] * 4,
+            "report_date": ["2020-01-01", "2020-01-01", "2021-01-01", "2021-01-01"],
+            "value": [64.0, 32.0, 65.0, 33.0]
+        })
+        self.repo.save_reports(base)
+
+        # Revise one value downwards (min/max must be recomputed) and add a year
+        refresh = pd.concat([base, base.iloc[[0]].assign(report_date="2022-01-01")],
+                            ignore_index=True)
+        refresh.loc[3, "value"] = 20.0
+        self.repo.upsert_reports(refresh)
+        self.repo.set_country_regions({"ABW": "Latin America & Caribbean"})
+
+        cases = [
+            (None, ["report_date"], "rollup_indicator_year"),
+            (FilterCriteria(date_from="2021-01-01"), [], "rollup_indicator_year"),
+            (FilterCriteria(country=["ABW", "AFG"]), ["country_code"], "rollup_country_indicator"),
+            (None, ["region", "report_date"], "rollup_region_indicator_year"),
+            (FilterCriteria(country="ABW", date_from="2021-01-01"), [], "reports"),
+        ]
+        for criteria, group_cols, expected_source in cases:
+            fast = self.repo.aggregate_reports(criteria, group_cols=group_cols)
+            self.assertEqual(self.repo.last_aggregate_source, expected_source)
+            raw = self.repo.aggregate_reports(criteria, group_cols=group_cols, use_rollups=False)
+            pd.testing.assert_frame_equal(fast, raw, check_dtype=False)
+
+    def test_rollups_match_rebuild_after_many_upsert_chunks(self):
+        """Test that rollup deltas from chunked upserts equal a full rebuild."""
+        import numpy as np
+        import pandas as pd
+
+        self.repo.connect()
+        self.repo.init_schema()
+        self.repo.set_country_regions({})
+        rng = np.random.default_rng(0)
+        countries = ["ABW", "AFG", "AGO", "ALB"]
+        df = pd.DataFrame(
+            [(code, f"IND{indicator}", year) for code in countries
+             for indicator in range(3) for year in range(2000, 2010)],
+            columns=["country_code", "indicator_code", "report_date"]
+        )
+        df["country_name"] = df["country_code"]
+        df["indicator_name"] = df["indicator_code"]
+
+        for round_number in range(4):
+            # Each round changes some values, empties others and restores the rest
+            values = rng.integers(0, 100, len(df)).astype(float)
+            values[rng.random(len(df)) < 0.2] = np.nan
+            chunk_order = rng.permutation(len(df))
+            for chunk in np.array_split(chunk_order, 7):
+                self.repo.upsert_reports(df.iloc[chunk].assign(value=values[chunk]))
+            if round_number == 1:
+                self.repo.set_country_regions({"ABW": "A", "AFG": "A", "AGO": "B"})
+
+        tables = ["rollup_indicator_year", "rollup_country_indicator", "rollup_region_indicator_year"]
+        incremental = {table: pd.read_sql_query(f"SELECT * FROM {table} ORDER BY 1, 2, 3", self.repo.conn)
+                       for table in tables}
+        self.repo.rebuild_rollups()
+        for table in tables:
+            rebuilt = pd.read_sql_query(f"SELECT * FROM {table} ORDER BY 1, 2, 3", self.repo.conn)
+            pd.testing.assert_frame_equal(incremental[table], rebuilt, check_dtype=False)
+
+    def test_query_reports_cache_invalidated_by_writes(self):
+        """Test that repeated queries hit the cache until save_reports() bumps the version."""
+        import pandas as pd
+
+        self.repo.connect()
+        self.repo.init_schema()
+        row = {"country_code": "ABW", "country_name": "Aruba",
+               "indicator_code": "SP.DYN.LE00.IN", "indicator_name": "Life expectancy",
+               "report_date": "1960-01-01", "value": 64.049}
+        self.repo.save_reports(pd.DataFrame([row]))
+
+        sql = "SELECT * FROM reports WHERE country_code = ?"
+        self.assertEqual(len(self.repo.query_reports(sql, ("ABW",))), 1)
+        self.assertEqual(len(self.repo.query_reports("SELECT *  FROM reports\n WHERE country_code = ?",
+                                                     ("ABW",))), 1)
+        self.assertEqual(self.repo.cache.stats()["hits"], 1)
+
+        self.repo.save_reports(pd.DataFrame([dict(row, report_date="1961-01-01")]))
+        self.assertEqual(len(self.repo.query_reports(sql, ("ABW",))), 2)
+
+    def test_explain_filter_uses_index_for_filter_shapes(self):
+        """Test that every supported filter shape is served by an index."""
+        from analysis.filters import FilterCriteria
+
+        self.repo.connect()
+        self.repo.init_schema()
+
+        shapes = [
+            FilterCriteria(country="ABW"),
+            FilterCriteria(country="ABW", date_from="2000-01-01", date_to="2010-01-01"),
+            FilterCriteria(date_from="2000-01-01"),
+            FilterCriteria(date_from="2000-01-01", date_to="2010-01-01"),
+            FilterCriteria(indicator="SP.DYN.LE00.IN", date_from="2000-01-01"),
+            FilterCriteria(country=["ABW", "AFG"], indicator=["SP.DYN.LE00.IN"]),
+        ]
+        for criteria in shapes:
+            report = self.repo.explain_filter(criteria)
+            self.assertFalse(report["full_scan"], report["plan"])
+
+        # No filter at all must read the whole table
+        self.assertTrue(self.repo.explain_filter(FilterCriteria())["full_scan"])
+
+    def test_profile_switches_pragmas_and_restores_default(self):
+        """Test that profile() applies PRAGMAs and returns to the default profile."""
+        self.repo.connect()
+        self.repo.init_schema()
+        pragma = lambda name: self.repo.conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+        self.assertEqual(pragma("journal_mode"), "wal")
+        with self.repo.profile("bulk_load"):
+            self.assertEqual(pragma("synchronous"), 0)
+            self.assertEqual(pragma("foreign_keys"), 1)
+            # Profiles do not nest
+            with self.repo.profile("read"):
+                self.assertEqual(pragma("query_only"), 0)
+        with self.repo.profile("read"):
+            self.assertEqual(pragma("query_only"), 1)
+            with self.assertRaises(sqlite3.OperationalError):
+                self.repo.conn.execute("DELETE FROM reports")
+        self.assertEqual(self.repo.active_profile, "default")
+        self.assertEqual(pragma("foreign_keys"), 1)
+        self.assertEqual(pragma("query_only"), 0)
+
+    def test_foreign_key_violation_rolls_back_and_later_imports_succeed(self):
+        """Test that rows violating a foreign key are not persisted and do not block later imports."""
+        import pandas as pd
+        from unittest import mock
+
+        self.repo.connect()
+        self.repo.init_schema()
+        df = pd.DataFrame({
+            "country_code": ["ABW"], "country_name": ["Aruba"],
+            "indicator_code": ["LE"], "indicator_name": ["Life expectancy"],
+            "report_date": [2000], "value": [74.0]
+        })
+        count = lambda: self.repo.conn.execute("SELECT COUNT(*) FROM reports").fetchone()[0]
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            with self.repo.profile("bulk_load"):
+                self.repo.conn.execute(
+                    "INSERT INTO reports (country_code, indicator_id, report_date, value) "
+                    "VALUES ('XXX', 99, 2000, 1.0)"
+                )
+        self.repo.conn.commit()
+        self.assertEqual(count(), 0)
+
+        # Report rows written without their parents fail at COMMIT
+        for write in (self.repo.save_reports, self.repo.upsert_reports):
+            with mock.patch.object(self.repo, "_insert_reference_data", return_value={"LE": 99}):
+                with self.assertRaises(sqlite3.IntegrityError):
+                    write(df)
+            self.assertEqual(count(), 0)
+
+        self.assertEqual(self.repo.upsert_reports(df), {"inserted": 1, "updated": 0, "unchanged": 0})
+        self.assertEqual(count(), 1)
+
+    def test_query_many_runs_queries_on_pooled_readers(self):
+        """Test that query_many() returns each query's result in order from read connections."""
+        import pandas as pd
+
+        self.repo.connect()
+        self.repo.init_schema()
+        self.repo.save_reports(pd.DataFrame({
+            "country_code": ["ABW", "AFG", "AGO"],
+            "country_name": ["Aruba", "Afghanistan", "Angola"],
+            "indicator_code": ["SP.DYN.LE00.IN"] * 3,
+            "indicator_name": ["Life expectancy"] * 3,
+            "report_date": [1960, 1960, 1960],
+            "value": [64.0, 32.0, 58.0]
+        }))
+        sql = "SELECT value FROM reports WHERE country_code = ?"
+
+        results = self.repo.query_many([(sql, (code,)) for code in ("AGO", "ABW", "AFG")] * 3)
+
+        self.assertEqual([df["value"].iloc[0] for df in results], [58.0, 64.0, 32.0] * 3)
+        self.assertLessEqual(len(self.repo.read_pool._all), self.repo.read_pool_size)
+        self.assertGreater(len(self.repo.read_pool._all), 0)
+
+    def test_readers_in_threads_see_committed_writes(self):
+        """Test that queries from other threads run alongside writes and see committed rows."""
+        import threading
+        import pandas as pd
+
+        self.repo.connect()
+        self.repo.init_schema()
+        counts, errors = [], []
+
+        def read():
+            try:
+                for _ in range(20):
+                    counts.append(len(self.repo.query_reports("SELECT * FROM reports")))
+            except Exception as exc:  # surfaced in the main thread below
+                errors.append(exc)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for thread in readers:
+            thread.start()
+        for year in range(10):
+            self.repo.save_reports(pd.DataFrame({
+                "country_code": ["ABW"], "country_name": ["Aruba"],
+                "indicator_code": ["SP.DYN.LE00.IN"], "indicator_name": ["Life expectancy"],
+                "report_date": [1960 + year], "value": [64.0 + year]
+            }))
+        for thread in readers:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertTrue(all(0 <= count <= 10 for count in counts))
+        self.assertEqual(len(self.repo.query_reports("SELECT * FROM reports")), 10)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
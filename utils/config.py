@@ -9,4 +9,72 @@ DEFAULT_DB_PATH = "health_insights.db"
 # Table names
 TABLE_REPORTS = "reports"
 TABLE_COUNTRIES = "countries"
-TABLE_INDICATORS = "indicators"
\ No newline at end of file
+TABLE_INDICATORS = "indicators"
+# Bulk ingest
+BULK_INSERT_BATCH_SIZE = 50000
+
+# Streaming import: wide CSV rows read per chunk
+IMPORT_CHUNK_SIZE = 1000
+
+# Long-format sources have one value per row instead of one per year column,
+# so their chunks are this many times larger
+LONG_FORMAT_CHUNK_SCALE = 64
+
+# Parallel multi-file import: worker processes (None uses all cores)
+IMPORT_WORKERS = None
+
+# Streaming queries: rows fetched per chunk
+QUERY_CHUNK_SIZE = 100000
+
+# Query result cache size in bytes (0 disables caching)
+QUERY_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# On-disk cache of normalized datasets (keyed by source file content hash)
+DATASET_CACHE_DIR = "data/cache"
+
+# Storage backend: "sqlite" (DatabaseRepository) or "cube" (CubeRepository)
+STORAGE_BACKEND = "sqlite"
+
+# Directory of the memory-mapped cube store
+CUBE_STORE_PATH = "health_insights_cube"
+
+# Factor by which a full cube axis grows, so a chunked import that keeps
+# adding labels reallocates the value file only a logarithmic number of times
+CUBE_GROWTH_FACTOR = 1.5
+
+# SQLite PRAGMA settings per connection profile. Every profile is applied on
+# top of "default", which the connection returns to afterwards. Negative
+# cache_size values are in KiB.
+CONNECTION_PROFILES = {
+    "default": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "foreign_keys": "ON",
+        "cache_size": -256 * 1024,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "query_only": "OFF",
+    },
+    # Imports: no fsync; foreign keys stay on and writes defer them to COMMIT
+    "bulk_load": {
+        "synchronous": "OFF",
+        "temp_store": "MEMORY",
+    },
+    # Queries: memory-mapped reads on a read-only connection
+    "read": {
+        "mmap_size": 1024 * 1024 * 1024,
+        "query_only": "ON",
+    },
+}
+
+# Read-only SQLite connections in the repository pool (0 reads through the writer)
+READ_POOL_SIZE = 4
+
+# Plausible (min, max) value per indicator code for import quality profiles;
+# values outside are counted as range violations (None leaves a side open)
+QUALITY_RANGE_RULES = {
+    "SP.DYN.LE00.IN": (0.0, 120.0),
+    "SP.DYN.LE00.FE.IN": (0.0, 120.0),
+    "SP.DYN.LE00.MA.IN": (0.0, 120.0),
+    "WHOSIS_000001": (0.0, 120.0),
+}
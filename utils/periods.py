@@ -0,0 +1,108 @@
+"""Conversion between ISO dates and integer report years."""
+import datetime
+import numpy as np
+import pandas as pd
+from typing import Union
+
+# A date given as an integer year, "YYYY", "YYYY-MM-DD" or a date/datetime
+DateLike = Union[int, str, datetime.date]
+
+
+def _parse(value: DateLike) -> datetime.date:
+    """
+    Parse a date-like value, treating a bare year as 1 January.
+
+    Raises:
+        ValueError: If value is not a valid year or ISO date.
+    """
+    if isinstance(value, datetime.date):
+        return value
+    text = str(value).strip()
+    try:
+        if text.isdigit() and len(text) == 4:
+            return datetime.date(int(text), 1, 1)
+        return datetime.date.fromisoformat(text)
+    except ValueError:
+        raise ValueError(f"Invalid date: {value!r} (expected YYYY or YYYY-MM-DD)") from None
+
+
+def year_of(value: DateLike) -> int:
+    """
+    Return the year a date falls in.
+
+    Args:
+        value: Year or ISO date (e.g., 2020, "2020" or "2020-06-30").
+
+    Returns:
+        Year as an integer.
+
+    Raises:
+        ValueError: If value is not a valid year or ISO date.
+    """
+    return _parse(value).year
+
+
+def first_year_from(value: DateLike) -> int:
+    """
+    Return the first year whose report date (1 January) is on or after value.
+
+    Args:
+        value: Start of a date range (e.g., "2020-01-01" gives 2020,
+            "2020-06-01" gives 2021).
+
+    Returns:
+        Year as an integer.
+
+    Raises:
+        ValueError: If value is not a valid year or ISO date.
+    """
+    date = _parse(value)
+    return date.year if (date.month, date.day) == (1, 1) else date.year + 1
+
+
+def to_years(dates: pd.Series) -> np.ndarray:
+    """
+    Convert a column of report dates to integer years.
+
+    Report dates are annual, so every date must be a bare year or fall on
+    1 January. Each distinct value is parsed once.
+
+    Args:
+        dates: Series of integer years, datetimes or ISO date strings.
+
+    Returns:
+        int64 array of years.
+
+    Raises:
+        ValueError: If a date is missing, invalid or not on 1 January
+            (e.g., "2000-06-30"); truncating it would merge distinct reports.
+    """
+    if pd.api.types.is_integer_dtype(dates):
+        return dates.to_numpy(dtype="int64")
+
+    codes, uniques = pd.factorize(dates)
+    if (codes < 0).any():
+        raise ValueError("Report dates must not be missing")
+    parsed = [_parse(int(value) if isinstance(value, float) and value.is_integer() else value)
+              for value in uniques]
+    non_annual = [value for value, date in zip(uniques, parsed) if (date.month, date.day) != (1, 1)]
+    if non_annual:
+        raise ValueError(
+            "Only annual report dates (YYYY or YYYY-01-01) are supported, found: "
+            + ", ".join(repr(str(value)) for value in non_annual[:5])
+        )
+    years = np.array([date.year for date in parsed], dtype="int64")
+    return years[codes]
+
+
+def years_to_dates(years: pd.Series) -> pd.Series:
+    """
+    Convert integer years to datetime64 values on 1 January.
+
+    Args:
+        years: Series of integer years.
+
+    Returns:
+        Series of datetime64 values.
+    """
+    return pd.to_datetime(years.astype("int64").astype(str), format="%Y")